@@ -8,3 +8,25 @@ class EncodingListError(CoreError):
             f"command data list was too long, max: {LIST_DATA_LEN_MAX}, actual: {actual_len}",
             internal=True,
         )
+
+
+class EncodingError(CoreError):
+    def __init__(self, msg: str):
+        super().__init__(f"could not encode data: {msg}", internal=True)
+
+
+class DecodingError(CoreError):
+    def __init__(self, msg: str):
+        super().__init__(f"could not decode data: {msg}", internal=True)
+
+
+class DeltaSequenceError(CoreError):
+    def __init__(self, expected: int, actual: int):
+        super().__init__(
+            f"delta is based on sequence {actual}, expected: {expected}, a full resync is needed",
+            internal=True,
+        )
+
+
+class ChecksumError(DecodingError):
+    """a received frame failed its checksum, it was corrupted on the way"""
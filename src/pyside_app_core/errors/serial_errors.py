@@ -36,3 +36,30 @@ class SerialWriteError(SerialError):
 
 class SerialDisconnectedError(SerialError):
     """connection was broken"""
+
+
+class SerialBufferOverflowError(CoreError):
+    """received data could not be framed before the receive buffer filled up"""
+
+    def __init__(self, capacity: int):
+        super().__init__(f"Serial receive buffer overflow, no frame found in {capacity} bytes", internal=True)
+
+
+class SerialRequestError(CoreError):
+    """a request didn't get a reply"""
+
+
+class SerialRequestTimeoutError(SerialRequestError):
+    def __init__(self, request_id: int, timeout_ms: int):
+        super().__init__(f"Serial request {request_id} got no reply within {timeout_ms}ms")
+
+
+class SerialCaptureError(CoreError):
+    """a serial capture file can't be read or appended to"""
+
+
+class SerialReconnectError(CoreError):
+    """a dropped port didn't come back"""
+
+    def __init__(self, port_name: str, attempts: int):
+        super().__init__(f"Serial port {port_name} could not be reconnected after {attempts} attempts")
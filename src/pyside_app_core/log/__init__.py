@@ -1,5 +1,5 @@
-import inspect
 import logging
+import sys
 from collections.abc import Callable
 from typing import Protocol
 
@@ -7,21 +7,19 @@ __logger_cache: dict[str, logging.Logger] = {}
 
 __pac_name = "pyside_app_core"
 
+_LEVEL_METHODS = ("debug", "info", "warning", "error", "critical")
+
 
 def _get_caller_name() -> str:
+    # only the frame is needed, inspect.stack() would read source for the whole stack
     try:
-        stack = inspect.stack()
-        frame = stack[2][0]
-        module = inspect.getmodule(frame)
-        if not module:
-            return __pac_name
-    except:  # noqa
+        name = sys._getframe(2).f_globals.get("__name__")
+    except ValueError:
         return __pac_name
-    name = module.__name__
-    if name == "__main__":
+    if not name or name == "__main__":
         name = __pac_name
 
-    return name
+    return str(name)
 
 
 def _get_cached_logger(name: str) -> logging.Logger:
@@ -63,6 +61,13 @@ def configure_get_logger_func(func: GetLogger) -> None:
     __get_logger_func = func
 
 
+def _get_named_logger(name: str) -> _Logger | logging.Logger:
+    # the default resolves by caller, a named logger only applies to it
+    if __get_logger_func is __default_get_logger:  # type: ignore[comparison-overlap]
+        return _get_cached_logger(name)
+    return __get_logger_func()
+
+
 def debug(msg: object, *args: object, **kwargs: object) -> None:
     """call logger's debug"""
     lg = __get_logger_func()
@@ -99,6 +104,79 @@ def exception(msg: object, *args: object, **kwargs: object) -> None:
     lg.exception(msg, *args, **kwargs)  # type: ignore[arg-type]
 
 
+class _LazyMessage:
+    """%-formats on `str()`, configured loggers (eg. loguru) only do that for records they emit"""
+
+    __slots__ = ("_args", "_msg")
+
+    def __init__(self, msg: str, args: tuple[object, ...]):
+        self._msg = msg
+        self._args = args
+
+    def __str__(self) -> str:
+        return self._msg % self._args
+
+
+class Tracer:
+    """
+    debug tracing that can be switched on and off per instance, off by default.
+    `enabled` is a flag or a function returning one, eg. an owner's debug setting.
+
+    arguments are %-formatted only when a record is emitted, while off or below
+    the logger level a call costs a flag check: `trace("serial data: %r", raw)`.
+    guard anything expensive to compute with `if trace:`
+
+    records go to the logger from `configure_get_logger_func` when one is set,
+    looked up on every record so it can be configured after the tracer is made.
+    the level is checked on loggers with `isEnabledFor` (stdlib), others filter
+    the record themselves but still only format it when they emit it.
+    """
+
+    __slots__ = ("_enabled", "_level", "_method", "_name")
+
+    def __init__(
+        self,
+        name: str | None = None,
+        *,
+        enabled: bool | Callable[[], bool] = False,
+        level: int = logging.DEBUG,
+    ):
+        self._name = name or _get_caller_name()
+        self._enabled = enabled
+        self._level = level
+
+        # configured loggers are only known to have the named level methods
+        method = logging.getLevelName(level).lower()
+        self._method = method if method in _LEVEL_METHODS else "debug"
+
+    def __bool__(self) -> bool:
+        if not self.enabled:
+            return False
+
+        is_enabled_for = getattr(_get_named_logger(self._name), "isEnabledFor", None)
+        return is_enabled_for is None or bool(is_enabled_for(self._level))
+
+    def __call__(self, msg: str, /, *args: object) -> None:
+        if not self.enabled:
+            return
+
+        lg = _get_named_logger(self._name)
+        if isinstance(lg, logging.Logger):
+            if lg.isEnabledFor(self._level):
+                lg.log(self._level, msg, *args, stacklevel=2)
+        else:
+            getattr(lg, self._method)(_LazyMessage(msg, args) if args else msg)
+
+    @property
+    def enabled(self) -> bool:
+        enabled = self._enabled
+        return enabled() if callable(enabled) else enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool | Callable[[], bool]) -> None:
+        self._enabled = enabled
+
+
 # def set_level(level: int) -> None:
 #     lg = __get_logger_func()
 #     lg.setLevel(level)
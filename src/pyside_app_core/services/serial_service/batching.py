@@ -0,0 +1,59 @@
+from collections.abc import Callable
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from pyside_app_core.services.serial_service.types import Decodable
+
+BatchCallback = Callable[[list[Decodable]], None]
+
+DEFAULT_BATCH_WINDOW_MS = 16
+DEFAULT_BATCH_SIZE = 512
+
+
+class ResultBatcher(QObject):
+    """
+    coalesce decoded results, a batch is flushed when `window_ms` has passed
+    since its first result or when it holds `max_size` results, whichever is first
+    """
+
+    def __init__(
+        self,
+        on_batch: BatchCallback,
+        window_ms: int = DEFAULT_BATCH_WINDOW_MS,
+        max_size: int = DEFAULT_BATCH_SIZE,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent=parent)
+
+        if max_size < 1:
+            raise ValueError("batch size must be at least 1")
+
+        self._on_batch = on_batch
+        self._max_size = max_size
+        self._batch: list[Decodable] = []
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(window_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def add(self, result: Decodable) -> None:
+        self._batch.append(result)
+
+        if len(self._batch) >= self._max_size:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        self._on_batch(batch)
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self._batch = []
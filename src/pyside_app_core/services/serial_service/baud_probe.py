@@ -0,0 +1,125 @@
+import os
+from collections.abc import Sequence
+from typing import cast
+
+from PySide6.QtCore import QDeadlineTimer
+from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
+
+from pyside_app_core import log
+from pyside_app_core.services.serial_service.port import DEFAULT_PORT_CONFIG, SerialPortConfig, open_serial_port
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, Message, Result
+from pyside_app_core.services.serial_service.types import Decodable
+
+PROBE_BAUD_RATES = (921600, 460800, 230400, 115200, 57600, 38400, 19200, 9600)
+
+# start (plus parity and stop) bits on the wire for every data byte, roughly
+_BITS_PER_BYTE = 10
+
+
+class LoopbackMessage(Message):
+    def __init__(self, payload: bytes):
+        self._payload = payload
+
+    def encode(self) -> bytes:
+        return self._payload
+
+
+class LoopbackResult(Result):
+    @property
+    def payload(self) -> bytes:
+        return self._raw_data
+
+
+class LoopbackTranscoder(CobsTranscoder):
+    """COBS framed probe payloads, the device is expected to echo every frame back unchanged"""
+
+    @classmethod
+    def decode(cls, raw: bytearray) -> LoopbackResult:
+        return LoopbackResult(cls.unframe(raw))
+
+
+def probe_baud_rate(
+    com: QSerialPort,
+    baud_rates: Sequence[int] = PROBE_BAUD_RATES,
+    *,
+    frame_count: int = 8,
+    payload_size: int = 64,
+    timeout_ms: int = 250,
+) -> int | None:
+    """
+    fastest of `baud_rates` at which the device on the open port `com` echoes
+    `frame_count` random loopback frames intact, or None.
+
+    the device must follow the host baud rate (auto-baud, USB CDC, a loopback plug)
+    and echo frames while probing. the port is left at the chosen rate, or at its
+    original rate when no rate passes.
+    """
+    original = com.baudRate()
+
+    for baud in sorted(baud_rates, reverse=True):
+        if not com.setBaudRate(baud):
+            # the loopback would run at whatever rate the port was left at
+            log.debug(f"baud probe: {baud} not supported by the port")
+            continue
+
+        if _loopback_ok(com, frame_count, payload_size, timeout_ms):
+            log.debug(f"baud probe: {baud} ok")
+            return baud
+
+        log.debug(f"baud probe: {baud} failed")
+
+    if not com.setBaudRate(original):
+        log.warning(f"baud probe: can't restore the original rate {original}")
+    return None
+
+
+def probe_serial_port(
+    port_info: QSerialPortInfo,
+    config: SerialPortConfig = DEFAULT_PORT_CONFIG,
+    baud_rates: Sequence[int] = PROBE_BAUD_RATES,
+) -> SerialPortConfig | None:
+    """
+    open `port_info` just to run `probe_baud_rate`, blocks until done.
+    returns `config` with the negotiated baud rate for `SerialService.open_connection`
+    """
+    com, error = open_serial_port(port_info, config=config)
+    if error:
+        log.warning(f"baud probe: can't open {port_info.portName()}: {error}")
+        com.deleteLater()
+        return None
+
+    try:
+        baud = probe_baud_rate(com, baud_rates)
+    finally:
+        com.close()
+        com.deleteLater()
+
+    return None if baud is None else config._replace(baud_rate=baud)
+
+
+def _loopback_ok(com: QSerialPort, frame_count: int, payload_size: int, timeout_ms: int) -> bool:
+    payloads = [os.urandom(payload_size) for _ in range(frame_count)]
+    echoed: list[bytes] = []
+
+    def _on_result(result: Decodable) -> None:
+        echoed.append(cast(LoopbackResult, result).payload)
+
+    # garbage from a previous rate can frame or decode badly, only the echoed payloads matter
+    receiver = FrameReceiver(LoopbackTranscoder, on_result=_on_result, on_error=lambda _: None)
+
+    com.clear()
+    sent = LoopbackTranscoder.SEP  # flush any partial frame on the device side
+    sent += b"".join(LoopbackTranscoder.encode(LoopbackMessage(p)) for p in payloads)
+    com.write(sent)
+
+    # there and back again at this rate, on top of the device turnaround
+    transfer_ms = 2 * len(sent) * _BITS_PER_BYTE * 1000 // com.baudRate()
+    deadline = QDeadlineTimer(timeout_ms + transfer_ms)
+
+    while echoed[-frame_count:] != payloads:
+        if not com.waitForReadyRead(deadline.remainingTime()):
+            return False
+        receiver.feed(cast(bytes, com.readAll()))
+
+    return True
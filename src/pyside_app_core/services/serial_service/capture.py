@@ -0,0 +1,114 @@
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from enum import IntEnum
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Self
+
+from pyside_app_core.errors.serial_errors import SerialCaptureError
+
+CAPTURE_MAGIC = b"PACSCAP"
+CAPTURE_VERSION = 1
+
+# timestamp (monotonic ns), direction, payload length
+_RECORD = struct.Struct("<qBI")
+_HEADER = len(CAPTURE_MAGIC) + 1
+
+
+class CaptureDirection(IntEnum):
+    INBOUND = 0
+    OUTBOUND = 1
+
+
+class CaptureRecord(NamedTuple):
+    timestamp_ns: int
+    direction: CaptureDirection
+    data: bytes
+
+
+class CaptureRecorder:
+    """
+    appends raw serial traffic to a capture file, see `SerialService.set_recorder`.
+
+    the file is a short header followed by records of a fixed 13 byte head and
+    the bytes as they were read from or handed to the port. records are only ever
+    appended, a later session carries on at the end of an existing capture.
+    safe to use from the worker thread and the service thread at once.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = self._path.open("ab")
+
+        try:
+            if self._file.tell() == 0:
+                self._file.write(CAPTURE_MAGIC + bytes((CAPTURE_VERSION,)))
+            else:
+                _check_header(self._path)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def record(self, direction: CaptureDirection, data: bytes | bytearray | memoryview) -> None:
+        if not data:
+            return
+
+        head = _RECORD.pack(time.monotonic_ns(), direction, len(data))
+        with self._lock:
+            if self._file:
+                self._file.write(head)
+                self._file.write(data)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def read_capture(path: str | os.PathLike[str]) -> Iterator[CaptureRecord]:
+    """records in file order, a record cut short by a crash ends the capture"""
+    with Path(path).open("rb") as f:
+        _check_version(f.read(_HEADER), path)
+
+        while len(head := f.read(_RECORD.size)) == _RECORD.size:
+            timestamp_ns, direction, size = _RECORD.unpack(head)
+            data = f.read(size)
+            if len(data) < size:
+                return
+
+            yield CaptureRecord(timestamp_ns, CaptureDirection(direction), data)
+
+
+def _check_header(path: Path) -> None:
+    with path.open("rb") as f:
+        _check_version(f.read(_HEADER), path)
+
+
+def _check_version(header: bytes, path: str | os.PathLike[str]) -> None:
+    if len(header) < _HEADER or not header.startswith(CAPTURE_MAGIC):
+        raise SerialCaptureError(f"{path} is not a serial capture")
+    if header[-1] != CAPTURE_VERSION:
+        raise SerialCaptureError(f"{path} is capture version {header[-1]}, expected {CAPTURE_VERSION}")
@@ -1,15 +1,28 @@
 import struct
+import sys
+from array import array
+from functools import lru_cache
+from typing import Literal
 
 from pyside_app_core.constants import (
+    COBS_SEP,
     DATA_ENCODING_ENDIAN,
     DATA_STRUCT_ENDIAN,
     FLOAT_PRECISION,
     LIST_DATA_LEN_BYTES,
     LIST_DATA_LEN_MAX,
 )
-from pyside_app_core.errors.encode_errors import EncodingListError
+from pyside_app_core.errors.encode_errors import DecodingError, EncodingListError
 from pyside_app_core.types.numeric import FloatPrecision
 
+# compiled structs are reused for repeated payloads of the same shape
+STRUCT_CACHE_SIZE = 256
+
+_LIST_LEN_FMT = {1: "B", 2: "H", 4: "I"}[LIST_DATA_LEN_BYTES]
+_LIST_LEN_STRUCT = struct.Struct(f"{DATA_STRUCT_ENDIAN}{_LIST_LEN_FMT}")
+
+_FLOAT_FMT: dict[FloatPrecision, Literal["f", "d"]] = {"single": "f", "double": "d"}
+
 
 def int_to_bytes(val: int, *, num_bytes: int, signed: bool) -> bytes:
     return val.to_bytes(length=num_bytes, byteorder=DATA_ENCODING_ENDIAN, signed=signed)
@@ -19,25 +32,173 @@ def int_from_bytes(val: bytes, *, signed: bool) -> int:
     return int.from_bytes(bytes=val, byteorder=DATA_ENCODING_ENDIAN, signed=signed)
 
 
-def encode_float_list(floats: list[float], precision: FloatPrecision = FLOAT_PRECISION) -> bytearray:
+@lru_cache(maxsize=STRUCT_CACHE_SIZE)
+def float_list_struct(
+    count: int,
+    precision: FloatPrecision = FLOAT_PRECISION,
+    endian: str = DATA_STRUCT_ENDIAN,
+) -> struct.Struct:
+    """compiled struct for `count` floats, without the length header"""
+    return struct.Struct(f"{endian}{count}{_FLOAT_FMT[precision]}")
+
+
+def encoded_float_list_size(count: int, precision: FloatPrecision = FLOAT_PRECISION) -> int:
+    return LIST_DATA_LEN_BYTES + float_list_struct(count, precision).size
+
+
+def encode_float_list_into(
+    buffer: bytearray | memoryview,
+    offset: int,
+    floats: list[float],
+    precision: FloatPrecision = FLOAT_PRECISION,
+) -> int:
+    """
+    encode into a preallocated buffer at `offset`, see `encoded_float_list_size`.
+    returns the number of bytes written
+    """
     data_len = len(floats)
     if data_len > LIST_DATA_LEN_MAX:
         raise EncodingListError(data_len)
 
-    precision_format = "f" if precision == "single" else "d"
+    data_struct = float_list_struct(data_len, precision)
+    _LIST_LEN_STRUCT.pack_into(buffer, offset, data_len)
+    data_struct.pack_into(buffer, offset + LIST_DATA_LEN_BYTES, *floats)
 
-    encoded = bytearray()
-    encoded.extend(int_to_bytes(data_len, num_bytes=LIST_DATA_LEN_BYTES, signed=False))
-    encoded.extend(struct.pack(f"{DATA_STRUCT_ENDIAN}{data_len}{precision_format}", *floats))
+    return LIST_DATA_LEN_BYTES + data_struct.size
+
+
+def encode_float_list(floats: list[float], precision: FloatPrecision = FLOAT_PRECISION) -> bytearray:
+    data_len = len(floats)
+    if data_len > LIST_DATA_LEN_MAX:
+        raise EncodingListError(data_len)
+
+    encoded = bytearray(encoded_float_list_size(data_len, precision))
+    encode_float_list_into(encoded, 0, floats, precision)
 
     return encoded
 
 
 def decode_float_list(raw_data: bytes, precision: FloatPrecision = FLOAT_PRECISION) -> list[float]:
-    len_bytes = raw_data[:LIST_DATA_LEN_BYTES]
-    data_bytes = raw_data[LIST_DATA_LEN_BYTES:]
+    floats, consumed = decode_float_list_from(raw_data, 0, precision)
+
+    if consumed != len(raw_data):
+        raise struct.error(f"unpack requires a buffer of {consumed} bytes")
+
+    return floats
+
+
+def _float_list_span(
+    buffer: bytes | bytearray | memoryview,
+    offset: int,
+    precision: FloatPrecision,
+) -> tuple[struct.Struct, int, int]:
+    """struct for the list at `offset` and the start/end of its float data"""
+    (data_len,) = _LIST_LEN_STRUCT.unpack_from(buffer, offset)
+    data_struct = float_list_struct(data_len, precision)
+
+    start = offset + LIST_DATA_LEN_BYTES
+    end = start + data_struct.size
+    if len(buffer) < end:
+        raise struct.error(f"unpack requires a buffer of {end - offset} bytes")
+
+    return data_struct, start, end
+
+
+def decode_float_list_from(
+    buffer: bytes | bytearray | memoryview,
+    offset: int = 0,
+    precision: FloatPrecision = FLOAT_PRECISION,
+) -> tuple[list[float], int]:
+    """
+    decode the length prefixed list at `offset`, anything after it is left alone.
+    returns the floats and the number of bytes consumed
+    """
+    data_struct, start, end = _float_list_span(buffer, offset, precision)
+    return list(data_struct.unpack_from(buffer, start)), end - offset
+
+
+def decode_float_array_from(
+    buffer: bytes | bytearray | memoryview,
+    offset: int = 0,
+    precision: FloatPrecision = FLOAT_PRECISION,
+) -> tuple["array[float]", int]:
+    """like `decode_float_list_from` but copies the raw floats into an `array` without boxing them"""
+    _, start, end = _float_list_span(buffer, offset, precision)
+
+    floats = array(_FLOAT_FMT[precision])
+    floats.frombytes(memoryview(buffer).cast("B")[start:end])
+    if sys.byteorder != DATA_ENCODING_ENDIAN:
+        floats.byteswap()
+
+    return floats, end - offset
+
+
+def float_list_view(
+    buffer: bytes | bytearray | memoryview,
+    offset: int = 0,
+    precision: FloatPrecision = FLOAT_PRECISION,
+) -> tuple["memoryview[float]", int]:
+    """
+    zero copy float view of the list at `offset`, only possible when the host
+    byte order matches the wire. the view borrows `buffer`, release it before
+    the buffer is written to again.
+    """
+    if sys.byteorder != DATA_ENCODING_ENDIAN:
+        raise ValueError(f"can't view {DATA_ENCODING_ENDIAN} endian floats on a {sys.byteorder} endian host")
+
+    _, start, end = _float_list_span(buffer, offset, precision)
+    return memoryview(buffer).cast("B")[start:end].cast(_FLOAT_FMT[precision]), end - offset
+
+
+_COBS_MAX_BLOCK = 254
+
+
+def cobs_encode(data: bytes) -> bytes:
+    """
+    consistent overhead byte stuffing, the result contains no zero bytes.
+    works on zero delimited segments and 254 byte blocks, not single bytes.
+    """
+    encoded = bytearray()
+    segments = bytes(data).split(COBS_SEP)
+    last = len(segments) - 1
+
+    for i, segment in enumerate(segments):
+        start = 0
+        remaining = len(segment)
+
+        while remaining >= _COBS_MAX_BLOCK:
+            encoded.append(_COBS_MAX_BLOCK + 1)
+            encoded += segment[start : start + _COBS_MAX_BLOCK]
+            start += _COBS_MAX_BLOCK
+            remaining -= _COBS_MAX_BLOCK
+
+        if remaining or start == 0 or i != last:
+            encoded.append(remaining + 1)
+            encoded += segment[start:]
+
+    return bytes(encoded)
+
+
+def cobs_decode(data: bytes | bytearray | memoryview) -> bytes:
+    """reverse of `cobs_encode`, the frame delimiter must already be removed"""
+    src = bytes(data)
+    if COBS_SEP in src:
+        raise DecodingError("COBS data contains a zero byte")
+
+    decoded = bytearray()
+    end = len(src)
+    idx = 0
+
+    while idx < end:
+        code = src[idx]
+        block_end = idx + code
+        if block_end > end:
+            raise DecodingError("COBS block runs past the end of the frame")
+
+        decoded += src[idx + 1 : block_end]
+        idx = block_end
 
-    precision_format = "f" if precision == "single" else "d"
+        if code <= _COBS_MAX_BLOCK and idx < end:
+            decoded += COBS_SEP
 
-    data_len = int_from_bytes(len_bytes, signed=False)
-    return list(struct.unpack(f"{DATA_STRUCT_ENDIAN}{data_len}{precision_format}", data_bytes))
+    return bytes(decoded)
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import Future
+from functools import partial
+
+from PySide6.QtCore import QObject, QTimer
+
+from pyside_app_core.errors.serial_errors import SerialRequestError, SerialRequestTimeoutError
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.types import CorrelatedMessage, Decodable
+from pyside_app_core.services.serial_service.write_queue import WritePriority
+from pyside_app_core.utils.time_ms import SECONDS
+
+DEFAULT_REQUEST_TIMEOUT_MS = 1 * SECONDS
+
+_MAX_REQUEST_ID = 0xFFFF
+
+
+class RequestTracker(QObject):
+    """
+    pairs requests sent through a SerialService with the results that answer them.
+
+    every request is tagged with a fresh `request_id` before it is encoded, a result
+    whose `request_id` matches a pending request completes its future. any number of
+    requests can be in flight, results that match nothing are left to `com_data`.
+
+    futures are `concurrent.futures.Future`, use `add_done_callback` or await
+    `request_async` on a Qt asyncio loop. pending requests fail with
+    `SerialRequestError` on disconnect and `SerialRequestTimeoutError` on timeout.
+    """
+
+    def __init__(
+        self,
+        service: SerialService,
+        timeout_ms: int = DEFAULT_REQUEST_TIMEOUT_MS,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent=parent or service)
+
+        self._service = service
+        self._timeout_ms = timeout_ms
+        self._pending: dict[int, tuple[Future[Decodable], QTimer]] = {}
+        self._last_id = 0
+
+        service.com_data.connect(self._on_result)
+        service.com_disconnect.connect(self.cancel_all)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def request(
+        self,
+        message: CorrelatedMessage,
+        timeout_ms: int | None = None,
+        priority: WritePriority = WritePriority.BULK,
+    ) -> Future[Decodable]:
+        future: Future[Decodable] = Future()
+        request_id = self._new_id()
+        message.request_id = request_id
+
+        timeout_ms = self._timeout_ms if timeout_ms is None else timeout_ms
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(partial(self._on_timeout, request_id, timeout_ms))
+
+        # registered first, a reply can't beat its own request
+        self._pending[request_id] = (future, timer)
+        if not self._service.send_data(message, priority):
+            self._fail(request_id, SerialRequestError(f"Serial request {request_id} was not sent"))
+            return future
+
+        timer.start(timeout_ms)
+        return future
+
+    async def request_async(
+        self,
+        message: CorrelatedMessage,
+        timeout_ms: int | None = None,
+        priority: WritePriority = WritePriority.BULK,
+    ) -> Decodable:
+        """`request` for a running asyncio loop, eg. `PySide6.QtAsyncio`"""
+        return await asyncio.wrap_future(self.request(message, timeout_ms, priority))
+
+    def cancel_all(self) -> None:
+        for request_id in list(self._pending):
+            self._fail(request_id, SerialRequestError(f"Serial request {request_id} cancelled, connection closed"))
+
+    def _new_id(self) -> int:
+        request_id = self._last_id
+        while True:
+            request_id = request_id % _MAX_REQUEST_ID + 1
+            if request_id not in self._pending:
+                break
+
+        self._last_id = request_id
+        return request_id
+
+    def _pop(self, request_id: int) -> Future[Decodable] | None:
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return None
+
+        future, timer = pending
+        timer.stop()
+        timer.deleteLater()
+
+        # the caller may have cancelled it
+        return None if future.done() else future
+
+    def _fail(self, request_id: int, error: SerialRequestError) -> None:
+        if future := self._pop(request_id):
+            future.set_exception(error)
+
+    def _on_timeout(self, request_id: int, timeout_ms: int) -> None:
+        self._fail(request_id, SerialRequestTimeoutError(request_id, timeout_ms))
+
+    def _on_result(self, result: Decodable) -> None:
+        request_id = getattr(result, "request_id", None)
+        if request_id is None:
+            return
+
+        if future := self._pop(request_id):
+            future.set_result(result)
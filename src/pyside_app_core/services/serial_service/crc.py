@@ -0,0 +1,155 @@
+import binascii
+from collections.abc import Callable
+from typing import ClassVar
+
+from pyside_app_core.constants import DATA_ENCODING_ENDIAN
+from pyside_app_core.errors.encode_errors import ChecksumError
+from pyside_app_core.services.serial_service.transcoder import RawTranscoder
+
+Buffer = bytes | bytearray | memoryview
+CrcFunction = Callable[[Buffer], int]
+
+
+def _reflect(value: int, width: int) -> int:
+    return int(f"{value:0{width}b}"[::-1], 2)
+
+
+class Crc:
+    """
+    a CRC with the usual catalogue parameters (`poly` not reflected, as listed
+    for the algorithm). computed a byte at a time from a 256 entry table built
+    once, or by `func` where the stdlib already implements the same algorithm in C.
+    """
+
+    __slots__ = ("_func", "_table", "init", "name", "poly", "reflected", "size", "width", "xorout")
+
+    def __init__(
+        self,
+        name: str,
+        width: int,
+        poly: int,
+        init: int = 0,
+        *,
+        reflected: bool = False,
+        xorout: int = 0,
+        func: CrcFunction | None = None,
+    ):
+        if width not in (8, 16, 32):
+            raise ValueError("CRC width must be 8, 16 or 32 bits")
+
+        self.name = name
+        self.width = width
+        self.size = width // 8
+        self.poly = poly
+        self.init = init
+        self.reflected = reflected
+        self.xorout = xorout
+        self._func = func
+        self._table = self._build_table()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({self.name})>"
+
+    def __call__(self, data: Buffer) -> int:
+        if self._func:
+            return self._func(data)
+
+        table = self._table
+        crc = _reflect(self.init, self.width) if self.reflected else self.init
+
+        if self.reflected:
+            for byte in data:
+                crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        else:
+            shift = self.width - 8
+            mask = (1 << self.width) - 1
+            for byte in data:
+                crc = ((crc << 8) & mask) ^ table[((crc >> shift) ^ byte) & 0xFF]
+
+        return crc ^ self.xorout
+
+    def table_crc(self) -> "Crc":
+        """the same CRC always computed from the table, to check `func` against"""
+        return Crc(self.name, self.width, self.poly, self.init, reflected=self.reflected, xorout=self.xorout)
+
+    def _build_table(self) -> tuple[int, ...]:
+        table = []
+        if self.reflected:
+            poly = _reflect(self.poly, self.width)
+            for i in range(256):
+                crc = i
+                for _ in range(8):
+                    crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+                table.append(crc)
+        else:
+            top = 1 << (self.width - 1)
+            mask = (1 << self.width) - 1
+            for i in range(256):
+                crc = i << (self.width - 8)
+                for _ in range(8):
+                    crc = ((crc << 1) ^ self.poly if crc & top else crc << 1) & mask
+                table.append(crc)
+
+        return tuple(table)
+
+
+def _crc_hqx(data: Buffer) -> int:
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def _crc_xmodem(data: Buffer) -> int:
+    return binascii.crc_hqx(data, 0)
+
+
+CRC8_SMBUS = Crc("CRC-8/SMBUS", 8, 0x07)
+CRC16_CCITT_FALSE = Crc("CRC-16/CCITT-FALSE", 16, 0x1021, 0xFFFF, func=_crc_hqx)
+CRC16_XMODEM = Crc("CRC-16/XMODEM", 16, 0x1021, func=_crc_xmodem)
+CRC16_MODBUS = Crc("CRC-16/MODBUS", 16, 0x8005, 0xFFFF, reflected=True)
+CRC32 = Crc("CRC-32", 32, 0x04C11DB7, 0xFFFFFFFF, reflected=True, xorout=0xFFFFFFFF, func=binascii.crc32)
+CRC32C = Crc("CRC-32C", 32, 0x1EDC6F41, 0xFFFFFFFF, reflected=True, xorout=0xFFFFFFFF)
+
+
+class CrcFraming(RawTranscoder):
+    """
+    appends a CRC of `CRC` to every payload before it is framed and checks it
+    after unframing, corrupted frames raise a `ChecksumError` instead of being
+    decoded. mix it in ahead of a transcoder:
+
+        class DeviceTranscoder(CrcFraming, CobsTranscoder):
+            CRC = CRC32
+
+    or wrap an existing one with `with_crc`. the CRC is `CRC.size` bytes, little
+    endian, so the framing has to be binary safe (eg. COBS, not `RawTranscoder`'s
+    line endings). a bad frame only costs that frame, framing picks up again at
+    the next delimiter without going back over the buffer.
+    """
+
+    CRC: ClassVar[Crc] = CRC16_CCITT_FALSE
+
+    @classmethod
+    def frame(cls, payload: bytes) -> bytes:
+        crc = cls.CRC
+        return super().frame(payload + crc(payload).to_bytes(crc.size, DATA_ENCODING_ENDIAN))
+
+    @classmethod
+    def unframe(cls, raw: bytearray | memoryview) -> bytes:
+        data = super().unframe(raw)
+        crc = cls.CRC
+
+        end = len(data) - crc.size
+        if end < 0:
+            raise ChecksumError(f"{len(data)} byte frame is shorter than its {crc.name}")
+
+        expected = int.from_bytes(data[end:], DATA_ENCODING_ENDIAN)
+        actual = crc(memoryview(data)[:end])
+        if actual != expected:
+            raise ChecksumError(f"{crc.name} is {actual:#x}, frame says {expected:#x}")
+
+        return data[:end]
+
+
+def with_crc(transcoder: type[RawTranscoder], crc: Crc = CRC16_CCITT_FALSE) -> type[RawTranscoder]:
+    """`transcoder` with a `crc` checked on every frame, see `CrcFraming`"""
+    return type(
+        f"Crc{transcoder.__name__}", (CrcFraming, transcoder), {"CRC": crc, "__module__": transcoder.__module__}
+    )
@@ -0,0 +1,57 @@
+from collections.abc import Callable
+from typing import Any
+
+from pyside_app_core import log
+from pyside_app_core.services.serial_service.types import Decodable
+
+ResultCallback = Callable[[Any], None]
+
+
+class ResultDispatcher:
+    """
+    routes decoded results to the callbacks subscribed to their type.
+
+    a callback subscribed to a base class also gets its subclasses, the
+    callbacks for each concrete result type are resolved once and cached so
+    dispatching a result is one dict lookup however many types are subscribed.
+    """
+
+    __slots__ = ("_resolved", "_subscribers")
+
+    def __init__(self) -> None:
+        self._subscribers: dict[type, list[ResultCallback]] = {}
+        self._resolved: dict[type, tuple[ResultCallback, ...]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def subscribe(self, result_type: type, callback: ResultCallback) -> None:
+        self._subscribers.setdefault(result_type, []).append(callback)
+        self._resolved.clear()
+
+    def unsubscribe(self, result_type: type, callback: ResultCallback) -> None:
+        callbacks = self._subscribers.get(result_type)
+        if not callbacks or callback not in callbacks:
+            raise ValueError(f"{callback!r} is not subscribed to {result_type.__name__}")
+
+        callbacks.remove(callback)
+        if not callbacks:
+            del self._subscribers[result_type]
+        self._resolved.clear()
+
+    def dispatch(self, result: Decodable) -> None:
+        result_type = type(result)
+        callbacks = self._resolved.get(result_type)
+        if callbacks is None:
+            callbacks = self._resolved[result_type] = self._resolve(result_type)
+
+        for callback in callbacks:
+            try:
+                callback(result)
+            except Exception as e:  # noqa: BLE001
+                # like a slot, one failing subscriber doesn't stop the others or the receive path
+                log.exception(e)
+
+    def _resolve(self, result_type: type) -> tuple[ResultCallback, ...]:
+        # most specific type first
+        return tuple(cb for cls in result_type.__mro__ for cb in self._subscribers.get(cls, ()))
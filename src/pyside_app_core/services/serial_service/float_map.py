@@ -1,30 +1,74 @@
 import struct
+import sys
+from array import array
+from bisect import bisect_left
 from collections.abc import Iterator, Mapping
-from decimal import Decimal
-from typing import Any, TypeVar
+from functools import lru_cache
+from itertools import chain, pairwise
+from typing import Any, NamedTuple, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
 
 from pyside_app_core.constants import (
+    DATA_ENCODING_ENDIAN,
     DATA_STRUCT_ENDIAN,
     FLOAT_PRECISION,
     STRUCT_FLOAT_FMT,
 )
-from pyside_app_core.services.serial_service import conversion_utils
+from pyside_app_core.errors.encode_errors import DecodingError, DeltaSequenceError
+from pyside_app_core.services.serial_service.conversion_utils import STRUCT_CACHE_SIZE
 from pyside_app_core.utils import compare
 
 K = TypeVar("K", bound=int)
 
 _TWO_BYTE_LEN = 65535
 
+# single precision values are rounded on unpack to hide float32 noise (1.100000023841858)
+_SINGLE_PRECISION_DIGITS = 6
+
+# below this many pairs plain struct is faster than setting up numpy arrays
+_NUMPY_MIN_ITEMS = 64
+
+
+@lru_cache(maxsize=STRUCT_CACHE_SIZE)
+def _pairs_struct(count: int, key_fmt: str, float_fmt: str, endian: str) -> struct.Struct:
+    return struct.Struct(f"{endian}{f'{key_fmt}{float_fmt}' * count}")
+
+
+@lru_cache(maxsize=STRUCT_CACHE_SIZE)
+def _count_struct(count_fmt: str, endian: str) -> struct.Struct:
+    return struct.Struct(f"{endian}{count_fmt}")
+
+
+class DeltaHeader(NamedTuple):
+    version: int
+    base_seq: int
+    seq: int
+
+
+DELTA_VERSION = 1
+DELTA_HEADER = struct.Struct(f"{DATA_STRUCT_ENDIAN}BHH")
+# sequence numbers are sent as "H" and wrap around
+DELTA_SEQ_MODULO = 1 << 16
+
 
 class FloatMap(Mapping[K, float]):
+    __slots__ = ("_data",)
+
     _count_fmt = "H"  # unsigned short, 2 bytes
     _key_fmt = "H"  # unsigned short, 2 bytes
 
     def __init__(self, data: Mapping[K, float]):
+        self._check_data(data)
         self._data = data
 
+    @classmethod
+    def _check_data(cls, data: Mapping[K, float]) -> None:
         if not data:
-            raise ValueError(f"can't create an empty {self.__class__.__name__}")
+            raise ValueError(f"can't create an empty {cls.__name__}")
 
         if len(data) > _TWO_BYTE_LEN:
             raise ValueError("data has too many values, must fit in 2 bytes")
@@ -51,20 +95,43 @@ class FloatMap(Mapping[K, float]):
     def __str__(self) -> str:
         return self._data.__str__()
 
-    def __eq__(self, other: "FloatMap[K]") -> bool:  # type: ignore[override]
-        val_eq: list[bool] = []
-        for k, v in self.items():
-            other_v = other.get(k)
-            if other_v:
-                val_eq.append(compare.float_approx(v, other_v))
-
-        return all(
-            [
-                sorted(self.keys()) == sorted(other.keys()),
-                *val_eq,
-            ]
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        # same size and every key of self matched means the key sets are equal
+        return len(self) == len(other) and not self._changed_keys(
+            other, stop_early=True, tolerance=compare.ABS_TOLERANCE
         )
 
+    def diff(self, other: Mapping[K, float], *, exact: bool = False) -> dict[K, float]:
+        """
+        entries of self that are missing from `other` or differ by more than the
+        `compare.float_approx` tolerance (by anything with `exact`), keys only in
+        `other` are not reported
+        """
+        tolerance = 0.0 if exact else compare.ABS_TOLERANCE
+        return {k: self[k] for k in self._changed_keys(other, stop_early=False, tolerance=tolerance)}
+
+    def _lookup(self) -> Mapping[K, float]:
+        """fastest mapping to read the values from"""
+        return self._data
+
+    def _changed_keys(self, other: Mapping[K, float], *, stop_early: bool, tolerance: float) -> list[K]:
+        ours = self._lookup()
+        get = (other._lookup() if isinstance(other, FloatMap) else other).get
+
+        changed = []
+        for k, v in ours.items():
+            # inlined compare.float_approx
+            other_v = get(k)
+            if other_v is None or not (v == other_v or abs(v - other_v) <= tolerance):
+                changed.append(k)
+                if stop_early:
+                    break
+
+        return changed
+
     @classmethod
     def _key_xform(cls, key: int) -> Any:
         return key
@@ -80,6 +147,15 @@ class FloatMap(Mapping[K, float]):
 
         return accum_fmt
 
+    @classmethod
+    def pairs_struct(cls, item_count: int) -> struct.Struct:
+        """compiled (and cached) struct for `item_count` key/value pairs, without the count header"""
+        return _pairs_struct(item_count, cls._key_fmt, STRUCT_FLOAT_FMT, DATA_STRUCT_ENDIAN)
+
+    @classmethod
+    def _count_struct(cls) -> struct.Struct:
+        return _count_struct(cls._count_fmt, DATA_STRUCT_ENDIAN)
+
     def pack(self) -> bytearray:
         """
         pattern:
@@ -95,24 +171,49 @@ class FloatMap(Mapping[K, float]):
             raise AttributeError("Command had no data")
 
         count = len(self)
-        flattened_data = []
 
-        for key, value in self._data.items():
-            flattened_data.extend([key, value])
+        if np is not None and count >= _NUMPY_MIN_ITEMS:
+            return self._np_pack(count)
 
-        raw = struct.pack(self.pack_format(count), count, *flattened_data)
-        return bytearray(raw)
+        count_struct = self._count_struct()
+        pairs_struct = self.pairs_struct(count)
+
+        raw = bytearray(count_struct.size + pairs_struct.size)
+        count_struct.pack_into(raw, 0, count)
+        pairs_struct.pack_into(raw, count_struct.size, *chain.from_iterable(self._data.items()))
+
+        return raw
+
+    def _np_pack(self, count: int) -> bytearray:
+        raw = bytearray(_COUNT_SIZE + count * _PAIR_DTYPE.itemsize)
+        self._count_struct().pack_into(raw, 0, count)
+
+        # write the pairs straight into the output buffer
+        pairs = np.frombuffer(raw, dtype=_PAIR_DTYPE, count=count, offset=_COUNT_SIZE)
+        pairs["key"] = np.fromiter(self._data.keys(), dtype=np.int64, count=count)
+        pairs["value"] = np.fromiter(self._data.values(), dtype=np.float64, count=count)
+
+        return raw
 
     @classmethod
     def unpack(cls, raw_data: bytes) -> "FloatMap[K]":
-        count_bytes = 2
-        raw_pair_count = raw_data[:count_bytes]
-        raw_key_val = raw_data[count_bytes:]
+        return cls(data=cls._unpack_pairs(raw_data, 0))
+
+    @classmethod
+    def _unpack_pairs(cls, raw_data: bytes, offset: int) -> dict[K, float]:
+        """count header and pairs at `offset`, they must run to the end of `raw_data`"""
+        count_struct = cls._count_struct()
+        (pair_count,) = count_struct.unpack_from(raw_data, offset)
+        offset += count_struct.size
+
+        if np is not None and pair_count >= _NUMPY_MIN_ITEMS:
+            return cls._np_unpack_pairs(raw_data, offset, pair_count)
 
-        pair_count = conversion_utils.int_from_bytes(raw_pair_count, signed=False)
-        fmt_chars = [cls._key_fmt, STRUCT_FLOAT_FMT] * pair_count
+        pairs_struct = cls.pairs_struct(pair_count)
+        if len(raw_data) != offset + pairs_struct.size:
+            raise struct.error(f"unpack requires a buffer of {pair_count} key/value pairs")
 
-        flat_pairs = struct.unpack(f"{DATA_STRUCT_ENDIAN}{''.join(fmt_chars)}", raw_key_val)
+        flat_pairs = pairs_struct.unpack_from(raw_data, offset)
 
         data = {}
         iterable = iter(flat_pairs)
@@ -120,7 +221,252 @@ class FloatMap(Mapping[K, float]):
         for key in iterable:
             val = next(iterable)
             if FLOAT_PRECISION == "single":
-                val = float(Decimal(val).quantize(Decimal("0.000000")))
+                val = round(val, _SINGLE_PRECISION_DIGITS)
             data[cls._key_xform(key)] = val
 
-        return cls(data=data)
+        return data
+
+    @classmethod
+    def _np_unpack_pairs(cls, raw_data: bytes, offset: int, pair_count: int) -> dict[K, float]:
+        if len(raw_data) != offset + pair_count * _PAIR_DTYPE.itemsize:
+            raise struct.error(f"unpack requires a buffer of {pair_count} key/value pairs")
+
+        pairs = np.frombuffer(raw_data, dtype=_PAIR_DTYPE, count=pair_count, offset=offset)
+
+        values = pairs["value"].astype(np.float64)
+        if FLOAT_PRECISION == "single":
+            values = values.round(_SINGLE_PRECISION_DIGITS)
+
+        keys = pairs["key"].tolist()
+        return {cls._key_xform(k): v for k, v in zip(keys, values.tolist(), strict=True)}
+
+    def pack_delta(self, base: Mapping[K, float], base_seq: int, seq: int) -> bytearray:
+        """
+        pattern:
+        version,base_seq,seq,removed count,key,key,...,count,key,value,key,value,...
+        B - delta format version
+        H - sequence number of the snapshot the receiver must hold
+        H - sequence number of the snapshot after applying the delta
+        H - number of keys of `base` that were removed, followed by the keys
+        followed by the `pack` table of the entries that differ from `base`,
+        the table is empty (count 0) when nothing changed.
+
+        values are compared exactly, any change is sent so the receiver can't
+        drift. sequence numbers are taken modulo `DELTA_SEQ_MODULO`
+        """
+        raw = bytearray(DELTA_HEADER.pack(DELTA_VERSION, base_seq % DELTA_SEQ_MODULO, seq % DELTA_SEQ_MODULO))
+
+        removed = [k for k in base if k not in self]
+        count_struct = self._count_struct()
+        raw += count_struct.pack(len(removed))
+        raw += struct.pack(f"{DATA_STRUCT_ENDIAN}{self._key_fmt * len(removed)}", *removed)
+
+        if changes := self.diff(base, exact=True):
+            raw += type(self)(changes).pack()
+        else:
+            raw += count_struct.pack(0)
+
+        return raw
+
+    @classmethod
+    def delta_header(cls, raw_data: bytes) -> DeltaHeader:
+        header = DeltaHeader(*DELTA_HEADER.unpack_from(raw_data, 0))
+        if header.version != DELTA_VERSION:
+            raise DecodingError(f"unsupported delta version: {header.version}")
+        return header
+
+    @classmethod
+    def unpack_delta(cls, raw_data: bytes, base: Mapping[K, float], base_seq: int) -> tuple["FloatMap[K]", int]:
+        """
+        apply a `pack_delta` payload to the `base` snapshot held at `base_seq`.
+        returns the new snapshot and its sequence number
+        """
+        header = cls.delta_header(raw_data)
+        if header.base_seq != base_seq % DELTA_SEQ_MODULO:
+            raise DeltaSequenceError(base_seq % DELTA_SEQ_MODULO, header.base_seq)
+
+        count_struct = cls._count_struct()
+        offset = DELTA_HEADER.size
+        (removed_count,) = count_struct.unpack_from(raw_data, offset)
+        offset += count_struct.size
+
+        removed_struct = struct.Struct(f"{DATA_STRUCT_ENDIAN}{cls._key_fmt * removed_count}")
+        removed = {cls._key_xform(k) for k in removed_struct.unpack_from(raw_data, offset)}
+        offset += removed_struct.size
+
+        changes = cls._unpack_pairs(raw_data, offset)
+        data = {k: v for k, v in base.items() if k not in removed} if removed else dict(base)
+        data.update(changes)
+        return cls(data=data), header.seq
+
+
+_COUNT_SIZE = struct.calcsize(f"{DATA_STRUCT_ENDIAN}{FloatMap._count_fmt}")
+
+if np is not None:
+    # matches the struct wire format, count header followed by packed key/value pairs
+    _PAIR_DTYPE = np.dtype(
+        [
+            ("key", f"{DATA_STRUCT_ENDIAN}u2"),
+            ("value", f"{DATA_STRUCT_ENDIAN}f{struct.calcsize(STRUCT_FLOAT_FMT)}"),
+        ]
+    )
+
+
+def _wire_bytes(values: "array[Any]") -> bytes:
+    if sys.byteorder != DATA_ENCODING_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_wire(typecode: str, raw: bytes | bytearray) -> "array[Any]":
+    values = array(typecode, raw)
+    if sys.byteorder != DATA_ENCODING_ENDIAN:
+        values.byteswap()
+    return values
+
+
+class CompactFloatMap(FloatMap[K]):
+    """
+    FloatMap held in two typed arrays sorted by key instead of a dict of boxed floats.
+
+    lookups are a binary search over the keys and `pack` interleaves the raw array
+    bytes, the wire format is the same as FloatMap with pairs in ascending key order.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    _value_fmt = STRUCT_FLOAT_FMT
+
+    def __init__(self, data: Mapping[K, float]):
+        self._check_data(data)
+
+        keys = sorted(data)
+        self._keys = array(self._key_fmt, keys)
+        self._values = array(self._value_fmt, [data[k] for k in keys])
+
+    @classmethod
+    def _from_arrays(cls, keys: "array[int]", values: "array[float]") -> "CompactFloatMap[K]":
+        if not keys:
+            raise ValueError(f"can't create an empty {cls.__name__}")
+
+        if any(a >= b for a, b in pairwise(keys)):
+            # unsorted or repeated keys on the wire, last value wins like a dict
+            return cls(dict(zip(keys, values, strict=True)))  # type: ignore[arg-type]
+
+        fm = cls.__new__(cls)
+        fm._keys = keys
+        fm._values = values
+        return fm
+
+    def _index(self, k: K) -> int:
+        try:
+            i = bisect_left(self._keys, k)
+        except TypeError:
+            raise KeyError(k) from None
+
+        if i == len(self._keys) or self._keys[i] != k:
+            raise KeyError(k)
+        return i
+
+    def __getitem__(self, k: K) -> float:
+        val = self._values[self._index(k)]
+        if self._value_fmt == "f":
+            return round(val, _SINGLE_PRECISION_DIGITS)
+        return val
+
+    def __contains__(self, k: object) -> bool:
+        try:
+            self._index(k)  # type: ignore[arg-type]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[K]:
+        return map(self._key_xform, self._keys)
+
+    def __repr__(self) -> str:
+        return dict(self.items()).__repr__()
+
+    def __str__(self) -> str:
+        return dict(self.items()).__str__()
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.pack())
+
+    def _lookup(self) -> Mapping[K, float]:
+        return self
+
+    def _changed_keys(self, other: Mapping[K, float], *, stop_early: bool, tolerance: float) -> list[K]:
+        if (
+            not isinstance(other, CompactFloatMap)
+            or self._values.typecode != other._values.typecode
+            or self._keys != other._keys
+        ):
+            return super()._changed_keys(other, stop_early=stop_early, tolerance=tolerance)
+
+        # same keys, compare the value arrays element wise
+        if np is not None and len(self._keys) >= _NUMPY_MIN_ITEMS:
+            ours = np.frombuffer(self._values, dtype=self._values.typecode).astype(np.float64)
+            theirs = np.frombuffer(other._values, dtype=other._values.typecode).astype(np.float64)
+            with np.errstate(invalid="ignore"):
+                same = (ours == theirs) | (np.abs(ours - theirs) <= tolerance)
+
+            changed_idx = np.flatnonzero(~same).tolist()
+            if stop_early:
+                changed_idx = changed_idx[:1]
+        else:
+            changed_idx = []
+            for i, (v, other_v) in enumerate(zip(self._values, other._values, strict=True)):
+                if not (v == other_v or abs(v - other_v) <= tolerance):
+                    changed_idx.append(i)
+                    if stop_early:
+                        break
+
+        return [self._key_xform(self._keys[i]) for i in changed_idx]
+
+    def pack(self) -> bytearray:
+        """same layout as `FloatMap.pack`, filled with strided copies of the array bytes"""
+        count = len(self._keys)
+        key_size = self._keys.itemsize
+        value_size = self._values.itemsize
+        stride = key_size + value_size
+
+        raw = bytearray(_COUNT_SIZE + count * stride)
+        self._count_struct().pack_into(raw, 0, count)
+
+        keys = _wire_bytes(self._keys)
+        for i in range(key_size):
+            raw[_COUNT_SIZE + i :: stride] = keys[i::key_size]
+
+        values = _wire_bytes(self._values)
+        for i in range(value_size):
+            raw[_COUNT_SIZE + key_size + i :: stride] = values[i::value_size]
+
+        return raw
+
+    @classmethod
+    def unpack(cls, raw_data: bytes) -> "CompactFloatMap[K]":
+        (pair_count,) = cls._count_struct().unpack_from(raw_data, 0)
+
+        keys = array(cls._key_fmt)
+        values = array(cls._value_fmt)
+        key_size = keys.itemsize
+        value_size = values.itemsize
+        stride = key_size + value_size
+
+        if len(raw_data) != _COUNT_SIZE + pair_count * stride:
+            raise struct.error(f"unpack requires a buffer of {pair_count} key/value pairs")
+
+        raw_keys = bytearray(pair_count * key_size)
+        for i in range(key_size):
+            raw_keys[i::key_size] = raw_data[_COUNT_SIZE + i :: stride]
+
+        raw_values = bytearray(pair_count * value_size)
+        for i in range(value_size):
+            raw_values[i::value_size] = raw_data[_COUNT_SIZE + key_size + i :: stride]
+
+        return cls._from_arrays(_from_wire(cls._key_fmt, raw_keys), _from_wire(cls._value_fmt, raw_values))
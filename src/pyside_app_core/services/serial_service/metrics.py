@@ -0,0 +1,227 @@
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from pyside_app_core.utils.time_ms import SECONDS
+
+DEFAULT_METRICS_INTERVAL_MS = 1 * SECONDS
+DEFAULT_RATE_WINDOW_MS = 5 * SECONDS
+
+_BUCKETS = 64
+
+
+class Histogram:
+    """
+    power of two buckets, bucket `i` counts values below `2 ** i`, values are
+    non-negative and below `2 ** 63`. coarse, but adding a value is a couple of
+    integer operations.
+    """
+
+    __slots__ = ("_buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        self._buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(count={self.count}, p50={self.percentile(50)}, max={self.max})>"
+
+    @property
+    def buckets(self) -> list[int]:
+        return list(self._buckets)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: int) -> None:
+        self._buckets[value.bit_length()] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p: float) -> int:
+        """upper bound of the bucket holding the `p`th percentile, capped at the largest value"""
+        if not self.count:
+            return 0
+
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self._buckets):
+            seen += n
+            if n and seen >= rank:
+                return min((1 << i) - 1, self.max)
+
+        return self.max
+
+    def copy(self) -> "Histogram":
+        other = Histogram()
+        other._buckets = list(self._buckets)
+        other.count, other.total, other.max = self.count, self.total, self.max
+        return other
+
+
+class LinkCounters:
+    """
+    raw counters, updated on the receive path (which can be a worker thread)
+    and on the write path. plain attributes, no locking, a read may be a frame behind.
+
+    the histograms get a sample for every decoded frame, its size and how long
+    the transcoder took to decode it.
+    """
+
+    __slots__ = (
+        "buffer_high_water",
+        "bytes_in",
+        "bytes_out",
+        "decode_errors",
+        "decode_ns",
+        "dropped_frames",
+        "frame_size",
+        "frames",
+        "rejected_frames",
+        "write_high_water",
+    )
+
+    def __init__(self) -> None:
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.frames = 0
+        self.decode_errors = 0
+        # failed a checksum, also counted in decode_errors
+        self.rejected_frames = 0
+        self.dropped_frames = 0
+        self.buffer_high_water = 0
+        self.write_high_water = 0
+        self.decode_ns = Histogram()
+        self.frame_size = Histogram()
+
+    def add_frames(self, sizes: Sequence[int], decode_ns: Sequence[int]) -> None:
+        """frames decoded in one pass over the receive buffer, their sizes and decode times"""
+        self.frames += len(sizes)
+        for size, elapsed_ns in zip(sizes, decode_ns, strict=True):
+            self.frame_size.add(size)
+            self.decode_ns.add(elapsed_ns)
+
+
+class SerialMetricsSnapshot(NamedTuple):
+    bytes_in: int
+    bytes_out: int
+    frames: int
+    decode_errors: int
+    rejected_frames: int
+    dropped_frames: int
+    buffer_high_water: int
+    write_high_water: int
+    bytes_in_per_second: float
+    bytes_out_per_second: float
+    frames_per_second: float
+    decode_ns: Histogram
+    frame_size: Histogram
+
+
+class SerialMetrics(QObject):
+    """
+    link metrics of a `SerialService`, see `SerialService.metrics`.
+
+    totals and histograms cover the lifetime of the service (or since `reset`),
+    rates are averaged over the last `rate_window_ms`. `updated` carries a
+    snapshot every `interval_ms` while connected, `snapshot` can be called any time.
+    """
+
+    updated = Signal(object)
+
+    def __init__(
+        self,
+        interval_ms: int = DEFAULT_METRICS_INTERVAL_MS,
+        rate_window_ms: int = DEFAULT_RATE_WINDOW_MS,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent=parent)
+
+        self._counters = LinkCounters()
+        self._rate_window_s = rate_window_ms / SECONDS
+        # (monotonic s, bytes in, bytes out, frames)
+        self._samples: deque[tuple[float, int, int, int]] = deque()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._emit_update)
+
+    @property
+    def counters(self) -> LinkCounters:
+        return self._counters
+
+    @property
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    def start(self) -> None:
+        self._record_sample()
+        self._timer.start()
+
+    def stop(self) -> None:
+        if self._timer.isActive():
+            self._timer.stop()
+            self._emit_update()
+            # rates restart with the next connection
+            self._samples.clear()
+
+    def reset(self) -> None:
+        c = self._counters
+        c.bytes_in = c.bytes_out = c.frames = 0
+        c.decode_errors = c.rejected_frames = c.dropped_frames = 0
+        c.buffer_high_water = c.write_high_water = 0
+        c.decode_ns = Histogram()
+        c.frame_size = Histogram()
+        self._samples.clear()
+
+    def on_write_depth(self, depth: int) -> None:
+        self._counters.write_high_water = max(self._counters.write_high_water, depth)
+
+    def snapshot(self) -> SerialMetricsSnapshot:
+        c = self._counters
+        now, bytes_in, bytes_out, frames = self._sample()
+        then, bytes_in_then, bytes_out_then, frames_then = self._samples[0] if self._samples else (now, 0, 0, 0)
+        elapsed = now - then
+
+        def _rate(current: int, previous: int) -> float:
+            return (current - previous) / elapsed if elapsed > 0 else 0.0
+
+        return SerialMetricsSnapshot(
+            bytes_in=bytes_in,
+            bytes_out=bytes_out,
+            frames=frames,
+            decode_errors=c.decode_errors,
+            rejected_frames=c.rejected_frames,
+            dropped_frames=c.dropped_frames,
+            buffer_high_water=c.buffer_high_water,
+            write_high_water=c.write_high_water,
+            bytes_in_per_second=_rate(bytes_in, bytes_in_then),
+            bytes_out_per_second=_rate(bytes_out, bytes_out_then),
+            frames_per_second=_rate(frames, frames_then),
+            decode_ns=c.decode_ns.copy(),
+            frame_size=c.frame_size.copy(),
+        )
+
+    def _sample(self) -> tuple[float, int, int, int]:
+        c = self._counters
+        return time.monotonic(), c.bytes_in, c.bytes_out, c.frames
+
+    def _record_sample(self) -> None:
+        sample = self._sample()
+        self._samples.append(sample)
+
+        # the oldest sample kept is the last one at least a window old
+        while len(self._samples) > 1 and sample[0] - self._samples[1][0] >= self._rate_window_s:
+            self._samples.popleft()
+
+    def _emit_update(self) -> None:
+        snapshot = self.snapshot()
+        self._record_sample()
+        self.updated.emit(snapshot)
@@ -0,0 +1,177 @@
+import os
+from collections import Counter
+from functools import partial
+from typing import NamedTuple
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal
+from PySide6.QtSerialPort import QSerialPortInfo
+
+from pyside_app_core import log
+from pyside_app_core.errors.serial_errors import SerialError
+from pyside_app_core.services.serial_service.port import SerialPortConfig
+from pyside_app_core.services.serial_service.ring_buffer import DEFAULT_CAPACITY
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.types import Decodable, Encodable, SerialReader, TranscoderInterface
+from pyside_app_core.services.serial_service.write_queue import WritePriority
+
+DEFAULT_THREAD_COUNT = min(4, os.cpu_count() or 1)
+
+
+class PortStats(NamedTuple):
+    results: int = 0
+    errors: int = 0
+
+
+class MultiSerialService(QObject):
+    """
+    many simultaneous connections, one threaded SerialService per port.
+
+    the services share a fixed pool of worker threads, each port keeps its own
+    transcoder, receive buffer, write queue and readers (see `service`).
+    every decoded result is also fanned in on `port_data` as (port name, result).
+    """
+
+    port_connect = Signal(str)
+    port_disconnect = Signal(str)
+    port_data = Signal(str, object)
+    port_error = Signal(str, Exception)
+
+    def __init__(
+        self,
+        thread_count: int = DEFAULT_THREAD_COUNT,
+        parent: QObject | None = None,
+        *,
+        buffer_capacity: int = DEFAULT_CAPACITY,
+    ):
+        super().__init__(parent=parent)
+
+        if thread_count < 1:
+            raise ValueError("at least 1 worker thread is needed")
+
+        self._buffer_capacity = buffer_capacity
+        self._services: dict[str, SerialService] = {}
+        self._retired: list[SerialService] = []
+        self._service_threads: dict[str, QThread] = {}
+        self._results: Counter[str] = Counter()
+        self._errors: Counter[str] = Counter()
+
+        self._threads: list[QThread] = []
+        for i in range(thread_count):
+            thread = QThread(self)
+            thread.setObjectName(f"{self.__class__.__name__}Worker{i}")
+            thread.start()
+            self._threads.append(thread)
+
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.connect(self.stop)
+
+    @property
+    def ports(self) -> list[str]:
+        return list(self._services)
+
+    def service(self, port_name: str) -> SerialService | None:
+        return self._services.get(port_name)
+
+    def stats(self) -> dict[str, PortStats]:
+        return {name: PortStats(self._results[name], self._errors[name]) for name in self._services}
+
+    def total_stats(self) -> PortStats:
+        return PortStats(self._results.total(), self._errors.total())
+
+    def open_connection(
+        self,
+        port_info: QSerialPortInfo,
+        transcoder: type[TranscoderInterface],
+        config: SerialPortConfig | None = None,
+    ) -> bool:
+        name = port_info.portName()
+        self.close_connection(name)
+
+        thread = self._least_busy_thread()
+        svc = SerialService(transcoder, parent=self, buffer_capacity=self._buffer_capacity, worker_thread=thread)
+        svc.com_data.connect(partial(self._on_data, name))
+        svc.com_error.connect(partial(self._on_error, name))
+
+        try:
+            opened = svc.open_connection(port_info, config)
+        except SerialError as e:
+            log.warning(f"failed to open {name}: {e}")
+            opened = False
+
+        if not opened:
+            self._release(svc, opened=False)
+            return False
+
+        self._services[name] = svc
+        self._service_threads[name] = thread
+        self._results[name] = self._errors[name] = 0
+
+        # connected after opening, a failed open is not a disconnect
+        svc.com_disconnect.connect(partial(self._on_disconnect, name))
+        self.port_connect.emit(name)
+        return True
+
+    def close_connection(self, port_name: str) -> None:
+        if svc := self._services.get(port_name):
+            # reported and cleaned up by _on_disconnect
+            svc.close_connection()
+
+    def close_all(self) -> None:
+        for name in list(self._services):
+            self.close_connection(name)
+
+    def register_reader(self, port_name: str, reader: SerialReader) -> None:
+        if svc := self._services.get(port_name):
+            svc.register_reader(reader)
+        else:
+            log.warning(f"can't register reader, {port_name} not connected")
+
+    def send_data(self, port_name: str, data: Encodable, priority: WritePriority = WritePriority.BULK) -> bool:
+        svc = self._services.get(port_name)
+        return svc.send_data(data, priority) if svc else False
+
+    def stop(self) -> None:
+        self.close_all()
+        # workers must be handed back to their threads before those stop
+        self._delete_retired()
+
+        for thread in self._threads:
+            thread.quit()
+            thread.wait()
+        self._threads = []
+
+    def _least_busy_thread(self) -> QThread:
+        load = Counter(self._service_threads.values())
+        return min(self._threads, key=lambda t: load[t])
+
+    def _on_data(self, port_name: str, result: Decodable) -> None:
+        self._results[port_name] += 1
+        self.port_data.emit(port_name, result)
+
+    def _on_error(self, port_name: str, error: Exception) -> None:
+        self._errors[port_name] += 1
+        self.port_error.emit(port_name, error)
+
+    def _on_disconnect(self, port_name: str) -> None:
+        self._service_threads.pop(port_name, None)
+        if svc := self._services.pop(port_name, None):
+            # still inside svc.close_connection, let it finish first
+            self._retired.append(svc)
+            QTimer.singleShot(0, self, self._delete_retired)
+
+        self.port_disconnect.emit(port_name)
+
+    def _delete_retired(self) -> None:
+        while self._retired:
+            self._release(self._retired.pop())
+
+    @staticmethod
+    def _release(svc: SerialService, *, opened: bool = True) -> None:
+        # the partial slots hold this object, a service deleted while still connected can
+        # drop the last reference to its own parent mid-destruction
+        svc.com_data.disconnect()
+        svc.com_error.disconnect()
+        if opened:
+            svc.com_disconnect.disconnect()
+
+        svc.deleteLater()
@@ -0,0 +1,53 @@
+from typing import NamedTuple, cast
+
+from PySide6.QtCore import QIODevice, QObject
+from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
+
+
+class SerialPortConfig(NamedTuple):
+    """
+    settings applied to a port before it is opened.
+    `baud_rate` can be any rate the driver accepts, not only the QSerialPort.BaudRate values.
+    a `read_buffer_size` of 0 leaves Qt's receive buffer unbounded.
+    """
+
+    baud_rate: int = 115200
+    data_bits: QSerialPort.DataBits = QSerialPort.DataBits.Data8
+    parity: QSerialPort.Parity = QSerialPort.Parity.NoParity
+    stop_bits: QSerialPort.StopBits = QSerialPort.StopBits.OneStop
+    flow_control: QSerialPort.FlowControl = QSerialPort.FlowControl.NoFlowControl
+    read_buffer_size: int = 0
+
+
+DEFAULT_PORT_CONFIG = SerialPortConfig()
+
+
+def configure_serial_port(com: QSerialPort, config: SerialPortConfig) -> None:
+    com.setBaudRate(config.baud_rate)
+    com.setDataBits(config.data_bits)
+    com.setParity(config.parity)
+    com.setStopBits(config.stop_bits)
+    com.setFlowControl(config.flow_control)
+    com.setReadBufferSize(config.read_buffer_size)
+
+
+def open_serial_port(
+    port_info: QSerialPortInfo | QIODevice,
+    parent: QObject | None = None,
+    config: SerialPortConfig = DEFAULT_PORT_CONFIG,
+) -> tuple[QSerialPort, QSerialPort.SerialPortError | None]:
+    """
+    `port_info` can also be a device standing in for a port (see `ReplaySerialPort`),
+    it is adopted by `parent` and opened as is, `config` doesn't apply to it.
+    """
+    if isinstance(port_info, QIODevice):
+        device = cast(QSerialPort, port_info)
+        device.setParent(parent)
+        open_ok = device.isOpen() or device.open(QIODevice.OpenModeFlag.ReadWrite)
+        return device, None if open_ok else QSerialPort.SerialPortError.OpenError
+
+    com = QSerialPort(port_info, parent=parent)
+    configure_serial_port(com, config)
+    open_ok = com.open(QIODevice.OpenModeFlag.ReadWrite)
+
+    return com, None if open_ok else com.error()
@@ -0,0 +1,74 @@
+from PySide6.QtCore import QIODevice, QObject, QTimer, Signal
+from PySide6.QtSerialPort import QSerialPort
+
+
+class PortDevice(QIODevice):
+    """
+    base for in-process devices standing in for a QSerialPort, they can be passed
+    to `SerialService.open_connection` in place of a QSerialPortInfo.
+
+    subclasses `_push` received bytes, writes are reported on `bytesWritten`
+    from the event loop like a real port and handed to `_on_write`.
+    """
+
+    errorOccurred = Signal(QSerialPort.SerialPortError)
+
+    def __init__(self, name: str, parent: QObject | None = None):
+        super().__init__()
+        self.setParent(parent)
+
+        self._name = name
+        self._pending = bytearray()
+        self._written = 0
+
+    def portName(self) -> str:
+        return self._name
+
+    def close(self) -> None:
+        self._pending.clear()
+        super().close()
+
+    def flush(self) -> bool:
+        return True
+
+    def isSequential(self) -> bool:
+        return True
+
+    def bytesAvailable(self) -> int:
+        return len(self._pending) + super().bytesAvailable()
+
+    def readData(self, maxlen: int) -> bytes:
+        data = bytes(self._pending[:maxlen])
+        del self._pending[:maxlen]
+        return data
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        # PySide hands writeData binary data as str, writes are handled here instead
+        if not self.isWritable():
+            return -1
+
+        self._on_write(bytes(data))
+
+        # reported on the next event loop pass like a real port, not from inside write()
+        if not self._written:
+            QTimer.singleShot(0, self, self._report_written)
+
+        self._written += len(data)
+        return len(data)
+
+    def writeData(self, _data: object, _size: int) -> int:
+        return -1
+
+    def _on_write(self, data: bytes) -> None:
+        """bytes written by the host, dropped unless overridden"""
+
+    def _push(self, data: bytes | bytearray | memoryview) -> None:
+        if not self.isOpen() or not data:
+            return
+
+        self._pending += data
+        self.readyRead.emit()
+
+    def _report_written(self) -> None:
+        written, self._written = self._written, 0
+        self.bytesWritten.emit(written)
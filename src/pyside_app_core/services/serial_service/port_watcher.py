@@ -0,0 +1,213 @@
+import os
+import sys
+from collections.abc import Callable
+from functools import partial
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal, Slot
+from PySide6.QtSerialPort import QSerialPortInfo
+
+from pyside_app_core.utils.time_ms import SECONDS
+
+DEFAULT_POLL_INTERVAL_MS = 1 * SECONDS
+# udev fills in serial numbers etc. a little after the tty node appears
+UDEV_SETTLE_MS = SECONDS // 2
+SYSFS_TTY = "/sys/class/tty"
+
+PortLister = Callable[[], list[QSerialPortInfo]]
+PortKey = tuple[str, str, int, int]
+
+
+def port_key(port: QSerialPortInfo) -> PortKey:
+    """identifies a plugged in port, a different adapter on the same path is a different port"""
+    return port.systemLocation(), port.serialNumber(), port.vendorIdentifier(), port.productIdentifier()
+
+
+def sysfs_tty_signature(root: str = SYSFS_TTY) -> frozenset[tuple[str, str]] | None:
+    """
+    the ttys backed by a device and the device each is attached to, None
+    without sysfs. a few hundred directory reads, much cheaper than a full
+    enumeration which also queries udev and USB descriptors for every port.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return None
+
+    signature = set()
+    with entries:
+        for entry in entries:
+            try:
+                signature.add((entry.name, os.readlink(os.path.join(entry.path, "device"))))
+            except OSError:
+                # virtual consoles, ptys etc. have no device
+                continue
+
+    return frozenset(signature)
+
+
+def _stop_thread(thread: QThread, *_keep_alive: QObject) -> None:
+    thread.quit()
+    thread.wait()
+
+
+class _PortScanner(QObject):
+    """enumerates ports in the watcher thread, only when sysfs says something changed if it can"""
+
+    scanned = Signal(list)
+
+    def __init__(self, interval_ms: int, list_ports: PortLister, sysfs_root: str | None):
+        super().__init__()
+
+        self._interval_ms = interval_ms
+        self._list_ports = list_ports
+        self._sysfs_root = sysfs_root
+        self._signature: frozenset[tuple[str, str]] | None = None
+        self._timer: QTimer | None = None
+        self._settle_timer: QTimer | None = None
+
+    @Slot()
+    def start(self) -> None:
+        if not self._timer:
+            # created here so they live in the watcher thread
+            self._timer = QTimer(self)
+            self._timer.setInterval(self._interval_ms)
+            self._timer.timeout.connect(self.poll)
+
+            self._settle_timer = QTimer(self)
+            self._settle_timer.setSingleShot(True)
+            self._settle_timer.setInterval(UDEV_SETTLE_MS)
+            self._settle_timer.timeout.connect(self.scan)
+
+        self.scan()
+        self._timer.start()
+
+    @Slot()
+    def stop(self) -> None:
+        if self._timer:
+            self._timer.stop()
+        if self._settle_timer:
+            self._settle_timer.stop()
+
+    @Slot()
+    def poll(self) -> None:
+        if self._sysfs_root is not None:
+            signature = sysfs_tty_signature(self._sysfs_root)
+            if signature is not None:
+                if signature == self._signature:
+                    return
+                self._signature = signature
+
+                # once more when udev is done, sysfs won't change again for it
+                if self._settle_timer:
+                    self._settle_timer.start()
+
+        self.scan()
+
+    @Slot()
+    def scan(self) -> None:
+        self.scanned.emit(self._list_ports())
+
+
+class PortWatcher(QObject):
+    """
+    keeps a cached list of serial ports up to date from a background thread.
+
+    `ports` is always available without blocking, `port_added` and
+    `port_removed` report hot plug changes and `ports_changed` carries the
+    full list after any change. on linux the ports are only enumerated when
+    /sys/class/tty changes, elsewhere (or without sysfs) every `interval_ms`,
+    off the calling thread either way. see `SerialService.set_port_watcher`.
+    """
+
+    ports_changed = Signal(list)
+    port_added = Signal(object)
+    port_removed = Signal(object)
+
+    # requests to the scanner thread
+    _start_requested = Signal()
+    _stop_requested = Signal()
+    _scan_requested = Signal()
+
+    def __init__(
+        self,
+        interval_ms: int = DEFAULT_POLL_INTERVAL_MS,
+        parent: QObject | None = None,
+        *,
+        list_ports: PortLister = QSerialPortInfo.availablePorts,
+        sysfs_root: str | None = SYSFS_TTY if sys.platform.startswith("linux") else None,
+    ):
+        super().__init__(parent=parent)
+
+        self._ports: dict[PortKey, QSerialPortInfo] = {}
+        self._ready = False
+
+        self._thread: QThread | None = QThread(self)
+        self._thread.setObjectName(self.__class__.__name__)
+
+        scanner = _PortScanner(interval_ms, list_ports, sysfs_root)
+        scanner.moveToThread(self._thread)
+        self._thread.finished.connect(scanner.deleteLater)
+
+        self._start_requested.connect(scanner.start)
+        self._stop_requested.connect(scanner.stop)
+        self._scan_requested.connect(scanner.scan)
+        scanner.scanned.connect(self._on_scanned)
+
+        # the thread has to stop before the watcher is destroyed, however that happens. this connection
+        # keeps the scanner, an attribute would be released (from this thread) while the thread still runs
+        self.destroyed.connect(partial(_stop_thread, self._thread, scanner))
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.connect(self.close)
+
+    @property
+    def ports(self) -> list[QSerialPortInfo]:
+        """the ports found by the last scan, empty until `is_ready`"""
+        return list(self._ports.values())
+
+    @property
+    def is_ready(self) -> bool:
+        """the first scan has finished"""
+        return self._ready
+
+    def start(self) -> None:
+        if not self._thread:
+            return
+
+        if not self._thread.isRunning():
+            self._thread.start()
+        self._start_requested.emit()
+
+    def stop(self) -> None:
+        """stop polling, the cached ports are kept"""
+        self._stop_requested.emit()
+
+    def refresh(self) -> None:
+        """enumerate again now whatever sysfs says, the result arrives on the usual signals"""
+        if self._thread and self._thread.isRunning():
+            self._scan_requested.emit()
+
+    @Slot()
+    def close(self) -> None:
+        """stop the watcher thread for good, the cached ports are kept"""
+        if not self._thread:
+            return
+
+        _stop_thread(self._thread)
+        self._thread = None
+
+    def _on_scanned(self, ports: list[QSerialPortInfo]) -> None:
+        current = {port_key(p): p for p in ports}
+        removed = [p for key, p in self._ports.items() if key not in current]
+        added = [p for key, p in current.items() if key not in self._ports]
+
+        first = not self._ready
+        self._ports = current
+        self._ready = True
+
+        for port in removed:
+            self.port_removed.emit(port)
+        for port in added:
+            self.port_added.emit(port)
+
+        if first or removed or added:
+            self.ports_changed.emit(list(current.values()))
@@ -0,0 +1,164 @@
+import time
+from collections.abc import Callable
+from typing import cast
+
+from pyside_app_core import log
+from pyside_app_core.errors.encode_errors import ChecksumError
+from pyside_app_core.errors.serial_errors import SerialBufferOverflowError
+from pyside_app_core.services.serial_service.metrics import LinkCounters
+from pyside_app_core.services.serial_service.ring_buffer import DEFAULT_CAPACITY, RingBuffer
+from pyside_app_core.services.serial_service.types import Decodable, FrameSpans, TranscoderInterface
+
+ResultCallback = Callable[[Decodable], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class FrameReceiver:
+    """
+    receive state machine shared by every serial connection type.
+    buffers raw reads, frames them with the transcoder and hands decoded results
+    (or decode errors) to the callbacks.
+    """
+
+    def __init__(
+        self,
+        transcoder: type[TranscoderInterface] | None,
+        on_result: ResultCallback,
+        on_error: ErrorCallback,
+        capacity: int = DEFAULT_CAPACITY,
+        counters: LinkCounters | None = None,
+    ):
+        self._transcoder = transcoder
+        self._on_result = on_result
+        self._on_error = on_error
+        self._counters = counters
+
+        self._buffer = RingBuffer(capacity)
+        self._scan_offset = 0
+        self._resync = False
+
+    @property
+    def buffer(self) -> RingBuffer:
+        return self._buffer
+
+    @property
+    def transcoder(self) -> type[TranscoderInterface] | None:
+        return self._transcoder
+
+    def set_transcoder(self, transcoder: type[TranscoderInterface] | None) -> None:
+        self._transcoder = transcoder
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._scan_offset = 0
+        self._resync = False
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        if not self._transcoder:
+            return
+
+        pending = memoryview(data).cast("B")
+        counters = self._counters
+        if counters:
+            counters.bytes_in += len(pending)
+
+        while pending:
+            written = self._buffer.write(pending)
+            pending = pending[written:]
+            if counters and len(self._buffer) > counters.buffer_high_water:
+                counters.buffer_high_water = len(self._buffer)
+
+            consumed = self._process_buffer(self._transcoder)
+
+            if not self._buffer.free and not consumed:
+                self._drop_overflow(self._transcoder)
+
+    def _drop_overflow(self, transcoder: type[TranscoderInterface]) -> None:
+        """a single frame can't fit, drop it and resync on the next one"""
+        # keep enough of the tail to catch a separator split across the boundary,
+        # like `RawTranscoder.scan_frames` backs up
+        keep = min(len(getattr(transcoder, "SEP", b"")) - 1, self._buffer.capacity - 1)
+        self._buffer.consume(len(self._buffer) - max(0, keep))
+        self._scan_offset = 0
+
+        if self._resync:
+            # still the same oversized frame
+            return
+
+        self._resync = True
+        if self._counters:
+            self._counters.dropped_frames += 1
+        self._on_error(SerialBufferOverflowError(self._buffer.capacity))
+
+    def _skip_dropped_tail(self, sep: bytes) -> int:
+        """after an overflow, discard up to the separator ending the dropped frame, -1 until it arrives"""
+        end = self._buffer.find(sep, self._scan_offset)
+        if end < 0:
+            self._scan_offset = max(0, len(self._buffer) - len(sep) + 1)
+            return -1
+
+        self._buffer.consume(end + len(sep))
+        self._scan_offset = 0
+        self._resync = False
+        return end + len(sep)
+
+    def _process_buffer(self, transcoder: type[TranscoderInterface]) -> int:
+        skipped = 0
+        sep: bytes | None = getattr(transcoder, "SEP", None)
+        # resync on the raw data, an empty tail (the dropped frame ended at the
+        # boundary) is never a frame once scanned
+        if self._resync and sep and (skipped := self._skip_dropped_tail(sep)) < 0:
+            return 0
+
+        frames, consumed, scanned = self._scan_buffer(transcoder)
+
+        if self._resync and frames:
+            # without a separator, the first frame after an overflow is the tail end of the dropped one
+            self._resync = False
+            frames = frames[1:]
+
+        counters = self._counters
+        # only the transcoder is timed, not the result handlers
+        sizes: list[int] = []
+        decode_ns: list[int] = []
+
+        for frame in frames:
+            try:
+                start = time.perf_counter_ns()
+                result = transcoder.decode(cast(bytearray, frame))
+                decode_ns.append(time.perf_counter_ns() - start)
+                sizes.append(len(frame))
+                self._on_result(result)
+            except ChecksumError as e:
+                # expected on a noisy line, not worth a traceback
+                if counters:
+                    counters.decode_errors += 1
+                    counters.rejected_frames += 1
+                log.debug(str(e))
+                self._on_error(e)
+            except Exception as e:  # noqa: BLE001
+                if counters:
+                    counters.decode_errors += 1
+                log.exception(e)
+                self._on_error(e)
+
+        if counters and sizes:
+            counters.add_frames(sizes, decode_ns)
+
+        self._buffer.consume(consumed)
+        self._scan_offset = scanned - consumed
+        return skipped + consumed
+
+    def _scan_buffer(self, transcoder: type[TranscoderInterface]) -> FrameSpans:
+        if scan_frames := getattr(transcoder, "scan_frames", None):
+            return cast(FrameSpans, scan_frames(self._buffer, self._scan_offset))
+
+        # legacy transcoders split a copy of the buffer
+        data = bytearray(self._buffer.view())
+        chunks, remainder = transcoder.process_buffer(data)
+        if not chunks:
+            return [], 0, 0
+
+        consumed = len(data) - (len(remainder) if remainder is not None else 0)
+        return chunks, consumed, consumed
@@ -0,0 +1,209 @@
+import random
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from PySide6.QtCore import QIODevice, QObject, Qt, QTimer, Signal
+from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
+
+from pyside_app_core import log
+from pyside_app_core.errors.serial_errors import SerialDisconnectedError, SerialError, SerialReconnectError
+from pyside_app_core.services.serial_service.metrics import Histogram
+from pyside_app_core.services.serial_service.port_watcher import PortLister
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.utils.time_ms import SECONDS
+
+_NS_PER_MS = 1_000_000
+
+
+class ReconnectPolicy(NamedTuple):
+    """
+    attempt `n` (from 1) waits `initial_delay_ms * multiplier ** (n - 1)`, capped
+    at `max_delay_ms`, then spread by +/- `jitter` so many ports dropped together
+    don't retry in lockstep. `max_attempts` None retries until cancelled.
+    """
+
+    initial_delay_ms: int = 250
+    max_delay_ms: int = 10 * SECONDS
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    max_attempts: int | None = None
+
+    def delay_ms(self, attempt: int, uniform: Callable[[float, float], float] = random.uniform) -> int:
+        backoff = min(self.max_delay_ms, self.initial_delay_ms * self.multiplier ** (attempt - 1))
+        return max(0, round(backoff * uniform(1 - self.jitter, 1 + self.jitter)))
+
+
+DEFAULT_RECONNECT_POLICY = ReconnectPolicy()
+
+
+class ReconnectStats(NamedTuple):
+    reconnects: int
+    failed_attempts: int
+    gave_up: int
+    last_latency_ms: int
+    # from the port dropping to it being open again
+    latency_ms: Histogram
+
+
+class ReconnectSupervisor(QObject):
+    """
+    reopens the port of a SerialService when it drops (a `SerialDisconnectedError`).
+
+    the port is found again by its serial number, so an adapter that comes
+    back under another name is still picked up, ports without a serial number
+    must come back on the same path. the service keeps its transcoder, readers,
+    batching, metrics and port config across the reconnect, only a partial
+    frame received before the drop is discarded.
+
+    any connection, including one opened by hand, ends the attempts, and a
+    port closed with `close_connection` isn't reopened. devices standing in
+    for a port (eg. `VirtualSerialPort`) can't be reopened and are ignored.
+    """
+
+    reconnecting = Signal(int, int)  # attempt, delay ms
+    reconnected = Signal(int)  # ms since the port dropped
+    gave_up = Signal(Exception)
+
+    def __init__(
+        self,
+        service: SerialService,
+        policy: ReconnectPolicy = DEFAULT_RECONNECT_POLICY,
+        parent: QObject | None = None,
+        *,
+        list_ports: PortLister | None = None,
+    ):
+        """
+        ports are looked up with `list_ports`, by default from the service's
+        `PortWatcher` if it has one, otherwise `QSerialPortInfo.availablePorts`
+        """
+        super().__init__(parent=parent or service)
+
+        self._service = service
+        self._policy = policy
+        self._list_ports = list_ports
+
+        # serial number, system location and name of the port being reconnected
+        self._target: tuple[str, str, str] | None = None
+        self._lost_ns = 0
+        self._attempt = 0
+
+        self._reconnects = 0
+        self._failed_attempts = 0
+        self._gave_up = 0
+        self._last_latency_ms = 0
+        self._latency_ms = Histogram()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._try_reconnect)
+
+        service.com_error.connect(self._on_error)
+        service.com_connect.connect(self._on_connect)
+
+    @property
+    def is_reconnecting(self) -> bool:
+        return self._target is not None
+
+    @property
+    def attempt(self) -> int:
+        """the current (or last) attempt of the current reconnect"""
+        return self._attempt
+
+    def stats(self) -> ReconnectStats:
+        return ReconnectStats(
+            reconnects=self._reconnects,
+            failed_attempts=self._failed_attempts,
+            gave_up=self._gave_up,
+            last_latency_ms=self._last_latency_ms,
+            latency_ms=self._latency_ms.copy(),
+        )
+
+    def cancel(self) -> None:
+        self._timer.stop()
+        self._target = None
+
+    def _on_error(self, error: Exception) -> None:
+        if not isinstance(error, SerialDisconnectedError) or self._target:
+            return
+
+        port = self._service.port_info
+        if port is None or isinstance(port, QIODevice):
+            return
+
+        self._target = port.serialNumber(), port.systemLocation(), port.portName()
+        self._lost_ns = time.monotonic_ns()
+        self._attempt = 0
+        self._schedule()
+
+    def _on_connect(self, _: QSerialPort) -> None:
+        if not self._target:
+            return
+
+        self._timer.stop()
+        self._target = None
+
+        latency_ms = (time.monotonic_ns() - self._lost_ns) // _NS_PER_MS
+        self._reconnects += 1
+        self._last_latency_ms = latency_ms
+        self._latency_ms.add(latency_ms)
+
+        log.info(f"Serial port reconnected after {latency_ms}ms, {self._attempt} attempts")
+        self.reconnected.emit(latency_ms)
+
+    def _schedule(self) -> None:
+        if not self._target:
+            return
+
+        max_attempts = self._policy.max_attempts
+        if max_attempts is not None and self._attempt >= max_attempts:
+            _, _, name = self._target
+            self._target = None
+            self._gave_up += 1
+            self.gave_up.emit(SerialReconnectError(name, self._attempt))
+            return
+
+        self._attempt += 1
+        delay_ms = self._policy.delay_ms(self._attempt)
+        self.reconnecting.emit(self._attempt, delay_ms)
+        self._timer.start(delay_ms)
+
+    def _try_reconnect(self) -> None:
+        if not self._target:
+            return
+
+        opened = False
+        if port := self._find_port():
+            try:
+                # a successful open ends up in `_on_connect`
+                opened = self._service.open_connection(port)
+            except SerialError as e:
+                log.debug(f"Serial reconnect attempt {self._attempt} failed: {e}")
+
+        if not opened:
+            self._failed_attempts += 1
+            self._schedule()
+
+    def _find_port(self) -> QSerialPortInfo | None:
+        if not self._target:
+            return None
+
+        serial, location, _ = self._target
+        for port in self._available_ports():
+            if serial and port.serialNumber() == serial:
+                return port
+            if not serial and port.systemLocation() == location:
+                return port
+
+        return None
+
+    def _available_ports(self) -> list[QSerialPortInfo]:
+        if self._list_ports:
+            return self._list_ports()
+
+        watcher = self._service.port_watcher
+        if watcher and watcher.is_ready:
+            return watcher.ports
+
+        return QSerialPortInfo.availablePorts()
@@ -0,0 +1,161 @@
+import os
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from PySide6.QtCore import QIODevice, QObject, Qt, QTimer, Signal
+
+from pyside_app_core.services.serial_service.capture import CaptureDirection, CaptureRecord, read_capture
+from pyside_app_core.services.serial_service.port_device import PortDevice
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.types import Decodable, TranscoderInterface
+
+MAX_SPEED_CHUNK = 64 * 1024
+
+_NS_PER_MS = 1_000_000
+
+
+class ReplayStats(NamedTuple):
+    bytes_read: int
+    results: int
+    errors: int
+    seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.seconds if self.seconds else 0.0
+
+    @property
+    def results_per_second(self) -> float:
+        return self.results / self.seconds if self.seconds else 0.0
+
+
+class ReplaySerialPort(PortDevice):
+    """
+    plays back the inbound side of a capture as if it was a serial port, pass it
+    to `SerialService.open_connection` in place of a QSerialPortInfo.
+
+    `speed` scales the recorded timing, 1.0 is real time and 10.0 ten times faster.
+    with None the capture is delivered as fast as it is read, in reads of up to
+    `chunk_size` bytes. writes are accepted and dropped.
+    """
+
+    replay_finished = Signal()
+
+    def __init__(
+        self,
+        capture: str | os.PathLike[str] | Iterable[CaptureRecord],
+        speed: float | None = 1.0,
+        parent: QObject | None = None,
+        *,
+        chunk_size: int = MAX_SPEED_CHUNK,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("replay speed must be positive, use None for maximum speed")
+
+        if isinstance(capture, (str, os.PathLike)):
+            super().__init__(Path(capture).name, parent=parent)
+            capture = read_capture(capture)
+        else:
+            super().__init__("replay", parent=parent)
+
+        self._records: Iterator[CaptureRecord] = (r for r in capture if r.direction == CaptureDirection.INBOUND)
+        self._next: CaptureRecord | None = next(self._records, None)
+        self._speed = speed
+        self._chunk_size = chunk_size
+
+        self._first_ns = 0 if self._next is None else self._next.timestamp_ns
+        self._start_ns = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._deliver)
+
+    @property
+    def is_finished(self) -> bool:
+        return self._next is None
+
+    def open(self, mode: QIODevice.OpenModeFlag) -> bool:
+        if not super().open(mode):
+            return False
+
+        self._start_ns = time.monotonic_ns()
+        self._timer.start(0)
+        return True
+
+    def close(self) -> None:
+        self._timer.stop()
+        super().close()
+
+    def readData(self, maxlen: int) -> bytes:
+        data = super().readData(maxlen)
+
+        if self._speed is None and not self._pending and not self._timer.isActive():
+            self._timer.start(0)
+
+        return data
+
+    def _deliver(self) -> None:
+        chunk = bytearray()
+        if self._speed is None:
+            while self._next and len(self._pending) + len(chunk) < self._chunk_size:
+                chunk += self._next.data
+                self._next = next(self._records, None)
+        else:
+            now_ns = time.monotonic_ns()
+            while self._next and self._due_ns(self._next) <= now_ns:
+                chunk += self._next.data
+                self._next = next(self._records, None)
+
+        self._push(chunk)
+
+        if self._next is None:
+            self.replay_finished.emit()
+        elif self._speed is not None:
+            wait_ms = (self._due_ns(self._next) - time.monotonic_ns()) // _NS_PER_MS
+            self._timer.start(max(0, wait_ms))
+        elif not self._pending:
+            self._timer.start(0)
+
+    def _due_ns(self, record: CaptureRecord) -> int:
+        # records appended by a later session can go back in time, they are due straight away
+        elapsed_ns = max(0, record.timestamp_ns - self._first_ns)
+        return self._start_ns + int(elapsed_ns / (self._speed or 1.0))
+
+
+def replay_benchmark(
+    capture: str | os.PathLike[str] | Iterable[CaptureRecord],
+    transcoder: type[TranscoderInterface],
+    chunk_size: int | None = None,
+) -> ReplayStats:
+    """
+    feed the inbound side of a capture through `transcoder` as fast as possible,
+    no event loop or hardware needed. reads are replayed as they were captured,
+    or re-split into `chunk_size` reads.
+    """
+    records = read_capture(capture) if isinstance(capture, (str, os.PathLike)) else capture
+    reads = [r.data for r in records if r.direction == CaptureDirection.INBOUND]
+    if chunk_size:
+        inbound = b"".join(reads)
+        reads = [inbound[i : i + chunk_size] for i in range(0, len(inbound), chunk_size)]
+
+    results = errors = 0
+
+    def _on_result(_: Decodable) -> None:
+        nonlocal results
+        results += 1
+
+    def _on_error(_: Exception) -> None:
+        nonlocal errors
+        errors += 1
+
+    receiver = FrameReceiver(transcoder, on_result=_on_result, on_error=_on_error)
+
+    start = time.perf_counter()
+    for data in reads:
+        receiver.feed(data)
+    seconds = time.perf_counter() - start
+
+    return ReplayStats(sum(map(len, reads)), results, errors, seconds)
@@ -0,0 +1,99 @@
+DEFAULT_CAPACITY = 64 * 1024
+
+
+class RingBuffer:
+    """
+    fixed capacity receive buffer.
+
+    unread data always lives in one contiguous region of a preallocated
+    bytearray so frames can be handed out as memoryview slices instead of
+    copies. instead of wrapping around the end of the storage, the unread
+    region is moved back to the front only when a write would not fit.
+
+    views returned by `view` are only valid until the next `write`,
+    `consume` or `clear` call, copy them if they need to outlive that.
+    """
+
+    __slots__ = ("_data", "_head", "_tail", "_view")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1 byte")
+
+        self._data = bytearray(capacity)
+        self._view = memoryview(self._data)
+        self._head = 0
+        self._tail = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def free(self) -> int:
+        return self.capacity - len(self)
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._view[self._head : self._tail])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RingBuffer):
+            return self.view() == other.view()
+        if isinstance(other, bytes | bytearray | memoryview):
+            return self.view() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}({len(self)}/{self.capacity})>"
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """
+        copy as much of `data` as fits into the buffer,
+        returns the number of bytes written
+        """
+        src = memoryview(data).cast("B")
+        count = min(len(src), self.free)
+        if not count:
+            return 0
+
+        if self._tail + count > self.capacity:
+            self._compact()
+
+        self._view[self._tail : self._tail + count] = src[:count]
+        self._tail += count
+
+        return count
+
+    def view(self, start: int = 0, end: int | None = None) -> memoryview:
+        """zero copy view of unread data, offsets are relative to the first unread byte"""
+        stop = self._tail if end is None else self._head + end
+        return self._view[self._head + start : stop]
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """offset of `sub` in the unread data at or after `start`, -1 if not found"""
+        idx = self._data.find(sub, self._head + start, self._tail)
+        return idx if idx < 0 else idx - self._head
+
+    def consume(self, count: int) -> None:
+        """discard `count` bytes from the front of the unread data"""
+        if count < 0 or count > len(self):
+            raise ValueError(f"can't consume {count} bytes, only {len(self)} available")
+
+        self._head += count
+
+        if self._head == self._tail:
+            # empty, rewind for free instead of compacting later
+            self._head = self._tail = 0
+
+    def clear(self) -> None:
+        self._head = self._tail = 0
+
+    def _compact(self) -> None:
+        size = len(self)
+        # copy out first, source and destination may overlap
+        self._view[:size] = bytes(self._view[self._head : self._tail])
+        self._head = 0
+        self._tail = size
@@ -0,0 +1,313 @@
+import struct
+from collections.abc import Callable, Iterable, Mapping
+from enum import Enum
+from functools import partial
+from operator import attrgetter
+from typing import Any, ClassVar, NamedTuple, Self
+
+from pyside_app_core.constants import DATA_STRUCT_ENDIAN, FLOAT_PRECISION
+from pyside_app_core.errors.encode_errors import DecodingError, EncodingError
+from pyside_app_core.services.serial_service.conversion_utils import decode_float_list_from, encode_float_list
+from pyside_app_core.services.serial_service.float_map import FloatMap
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder
+from pyside_app_core.types.numeric import FloatPrecision
+
+MSG_ID_FMT = "B"
+MSG_ID_MAX = 0xFF
+
+# (buffer, offset) -> (value, bytes consumed)
+FieldDecoder = Callable[[bytes | bytearray | memoryview, int], tuple[Any, int]]
+FieldEncoder = Callable[[Any], bytes | bytearray]
+
+
+class Field(NamedTuple):
+    """
+    one message field, made with the functions below rather than directly.
+    fixed size fields have a struct format, variable length ones encode and decode themselves
+    """
+
+    fmt: str = ""
+    enum: type[Enum] | None = None
+    encode: FieldEncoder | None = None
+    decode: FieldDecoder | None = None
+
+
+def u8() -> Any:
+    return Field("B")
+
+
+def u16() -> Any:
+    return Field("H")
+
+
+def u32() -> Any:
+    return Field("I")
+
+
+def u64() -> Any:
+    return Field("Q")
+
+
+def i8() -> Any:
+    return Field("b")
+
+
+def i16() -> Any:
+    return Field("h")
+
+
+def i32() -> Any:
+    return Field("i")
+
+
+def i64() -> Any:
+    return Field("q")
+
+
+def f32() -> Any:
+    return Field("f")
+
+
+def f64() -> Any:
+    return Field("d")
+
+
+def boolean() -> Any:
+    return Field("?")
+
+
+def fixed_bytes(size: int) -> Any:
+    """exactly `size` bytes, shorter values are zero padded"""
+    return Field(f"{size}s")
+
+
+def enum_of(enum: type[Enum], fmt: str = "B") -> Any:
+    """an int valued enum (IntEnum, IntFlag) sent as the integer format `fmt`"""
+    if not issubclass(enum, int):
+        raise TypeError(f"{enum.__name__} must be an int enum, eg. IntEnum")
+    return Field(fmt, enum=enum)
+
+
+def float_list(precision: FloatPrecision = FLOAT_PRECISION) -> Any:
+    """length prefixed floats, see `conversion_utils.encode_float_list`"""
+    return Field(
+        encode=partial(encode_float_list, precision=precision),
+        decode=partial(decode_float_list_from, precision=precision),
+    )
+
+
+def float_map(map_cls: type[FloatMap[Any]] = FloatMap) -> Any:
+    """a packed `FloatMap` (or `map_cls`), plain mappings are converted on encode"""
+    return Field(encode=partial(_encode_float_map, map_cls), decode=partial(_decode_float_map, map_cls))
+
+
+def _encode_float_map(map_cls: type[FloatMap[Any]], value: Mapping[int, float]) -> bytearray:
+    return (value if isinstance(value, FloatMap) else map_cls(value)).pack()
+
+
+def _decode_float_map(
+    map_cls: type[FloatMap[Any]],
+    buffer: bytes | bytearray | memoryview,
+    offset: int,
+) -> tuple[FloatMap[Any], int]:
+    count_struct = map_cls._count_struct()
+    (count,) = count_struct.unpack_from(buffer, offset)
+
+    end = offset + count_struct.size + map_cls.pairs_struct(count).size
+    if len(buffer) < end:
+        raise struct.error(f"unpack requires a buffer of {count} key/value pairs")
+
+    return map_cls.unpack(bytes(buffer[offset:end])), end - offset
+
+
+class _Schema:
+    """a message class compiled once, the id and every fixed size field go through one struct"""
+
+    __slots__ = ("enums", "fixed", "fixed_names", "get_fixed", "names", "variable")
+
+    def __init__(self, fields: dict[str, Field]):
+        self.names = tuple(fields)
+        self.fixed_names = tuple(name for name, f in fields.items() if f.fmt)
+        self.variable = tuple((name, f) for name, f in fields.items() if not f.fmt)
+        self.enums = tuple((name, f.enum) for name, f in fields.items() if f.enum)
+
+        if self.variable and self.names.index(self.variable[0][0]) < len(self.fixed_names):
+            raise TypeError("variable length fields must come after all fixed size fields")
+
+        self.fixed = struct.Struct(DATA_STRUCT_ENDIAN + MSG_ID_FMT + "".join(f.fmt for f in fields.values() if f.fmt))
+
+        get_fixed: Callable[[object], Any] = attrgetter(*self.fixed_names) if self.fixed_names else lambda _: ()
+        if len(self.fixed_names) == 1:
+            self.get_fixed: Callable[[object], tuple[Any, ...]] = lambda obj: (get_fixed(obj),)
+        else:
+            self.get_fixed = get_fixed
+
+
+class SchemaMessage:
+    """
+    a message declared as typed fields, eg.
+
+        class SetSpeed(SchemaMessage, msg_id=0x10):
+            axis: int = u8()
+            speed: float = f32()
+            mode: Mode = enum_of(Mode)
+            profile: list[float] = float_list()
+
+    every class is compiled once when it is defined: its id and all fixed size
+    fields are packed and unpacked by a single `struct.Struct`, variable length
+    fields (float lists, FloatMaps) follow them in order. on the wire a message
+    is its 1 byte id then the fields, little endian. see `SchemaTranscoder`
+    to decode many message types from one port.
+
+    a subclass keeps its parent's id only if it keeps its fields, one that adds
+    or changes fields needs its own `msg_id`. a class without an id is only a
+    base for other messages, its fields are shared but it can't be sent.
+    """
+
+    MSG_ID: ClassVar[int]
+    _fields: ClassVar[dict[str, Field]] = {}
+    _schema: ClassVar[_Schema]
+
+    def __init_subclass__(cls, msg_id: int | None = None, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+
+        fields = dict(cls._fields)
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, Field):
+                fields[name] = value
+                # instances keep their values in __dict__
+                delattr(cls, name)
+
+        if msg_id is not None:
+            if not 0 <= msg_id <= MSG_ID_MAX:
+                raise ValueError(f"message id {msg_id} doesn't fit in {MSG_ID_FMT!r}")
+            cls.MSG_ID = msg_id
+        elif hasattr(cls, "MSG_ID") and fields != cls._fields:
+            raise TypeError(f"{cls.__name__} changes the fields of message id {cls.MSG_ID}, it needs its own msg_id")
+
+        cls._fields = fields
+        cls._schema = _Schema(fields)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        _message_id(self.__class__)
+
+        names = self._schema.names
+        if len(args) > len(names):
+            raise TypeError(f"{self.__class__.__name__} takes {len(names)} fields, got {len(args)}")
+
+        values = dict(zip(names, args, strict=False))
+        if repeated := values.keys() & kwargs.keys():
+            raise TypeError(f"{self.__class__.__name__} got {sorted(repeated)} more than once")
+
+        values.update(kwargs)
+        if missing := [n for n in names if n not in values]:
+            raise TypeError(f"{self.__class__.__name__} is missing {missing}")
+        if unknown := values.keys() - set(names):
+            raise TypeError(f"{self.__class__.__name__} has no fields {sorted(unknown)}")
+
+        self.__dict__.update(values)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._schema.names)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self._schema.names)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def encode(self) -> bytes:
+        schema = self._schema
+        try:
+            data = schema.fixed.pack(self.MSG_ID, *schema.get_fixed(self))
+
+            if schema.variable:
+                data += b"".join(f.encode(getattr(self, name)) for name, f in schema.variable)  # type: ignore[misc]
+        except struct.error as e:
+            raise EncodingError(f"{self.__class__.__name__}: {e}") from e
+
+        return data
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray | memoryview) -> Self:
+        expected_id = _message_id(cls)
+        schema = cls._schema
+        try:
+            msg_id, *values = schema.fixed.unpack_from(data)
+            fields = dict(zip(schema.fixed_names, values, strict=True))
+
+            offset = schema.fixed.size
+            for name, field in schema.variable:
+                fields[name], consumed = field.decode(data, offset)  # type: ignore[misc]
+                offset += consumed
+        except (struct.error, ValueError) as e:
+            # ValueError from variable fields, eg. FloatMap keys that don't convert
+            raise DecodingError(f"{cls.__name__}: {e}") from e
+
+        if msg_id != expected_id:
+            raise DecodingError(f"{cls.__name__}: message id {msg_id}, expected {expected_id}")
+        if offset != len(data):
+            raise DecodingError(f"{cls.__name__}: {len(data) - offset} unexpected trailing bytes")
+
+        for name, enum in schema.enums:
+            try:
+                fields[name] = enum(fields[name])
+            except ValueError as e:
+                raise DecodingError(f"{cls.__name__}.{name}: {e}") from e
+
+        msg = cls.__new__(cls)
+        msg.__dict__ = fields
+        return msg
+
+
+def _message_id(msg_cls: type[SchemaMessage]) -> int:
+    try:
+        return msg_cls.MSG_ID
+    except AttributeError:
+        raise TypeError(f"{msg_cls.__name__} has no msg_id, it can only be a base for other messages") from None
+
+
+def message_table(messages: Iterable[type[SchemaMessage]]) -> dict[int, Callable[[bytes], SchemaMessage]]:
+    """message id -> decoder, for dispatching frames with one lookup"""
+    table: dict[int, Callable[[bytes], SchemaMessage]] = {}
+    for msg_cls in messages:
+        msg_id = _message_id(msg_cls)
+        if msg_id in table:
+            raise ValueError(f"message id {msg_id} is used by more than one message")
+        table[msg_id] = msg_cls.decode
+
+    return table
+
+
+class SchemaTranscoder(CobsTranscoder):
+    """
+    COBS framed `SchemaMessage`s, each frame is decoded by the message class
+    registered for its id:
+
+        class DeviceTranscoder(SchemaTranscoder):
+            MESSAGES = (Status, Reading, SetSpeed)
+    """
+
+    MESSAGES: ClassVar[Iterable[type[SchemaMessage]]] = ()
+    _decoders: ClassVar[dict[int, Callable[[bytes], SchemaMessage]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._decoders = message_table(cls.MESSAGES)
+
+    @classmethod
+    def decode(cls, raw: bytearray) -> SchemaMessage:  # type: ignore[override]
+        payload = cls.unframe(raw)
+        if not payload:
+            raise DecodingError("empty frame")
+
+        decoder = cls._decoders.get(payload[0])
+        if decoder is None:
+            raise DecodingError(f"unknown message id {payload[0]}")
+
+        return decoder(payload)
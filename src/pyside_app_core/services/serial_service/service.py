@@ -1,7 +1,10 @@
+import asyncio
+from collections.abc import AsyncIterator
 from typing import cast
 
-from PySide6.QtCore import QIODevice, QObject, Signal
+from PySide6.QtCore import QCoreApplication, QIODevice, QObject, Qt, QThread, Signal, Slot
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
+from shiboken6 import isValid
 
 from pyside_app_core import log
 from pyside_app_core.errors.serial_errors import (
@@ -12,12 +15,34 @@ from pyside_app_core.errors.serial_errors import (
     SerialUnknownError,
     SerialWriteError,
 )
+from pyside_app_core.services.serial_service.batching import DEFAULT_BATCH_SIZE, ResultBatcher
+from pyside_app_core.services.serial_service.capture import CaptureDirection, CaptureRecorder
+from pyside_app_core.services.serial_service.dispatch import ResultCallback, ResultDispatcher
+from pyside_app_core.services.serial_service.metrics import DEFAULT_METRICS_INTERVAL_MS, SerialMetrics
+from pyside_app_core.services.serial_service.port import (
+    DEFAULT_PORT_CONFIG,
+    SerialPortConfig,
+    configure_serial_port,
+    open_serial_port,
+)
+from pyside_app_core.services.serial_service.port_watcher import PortWatcher
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.ring_buffer import DEFAULT_CAPACITY, RingBuffer
 from pyside_app_core.services.serial_service.types import (
+    BatchSerialReader,
+    Decodable,
     Encodable,
     PortFilter,
     SerialReader,
     TranscoderInterface,
 )
+from pyside_app_core.services.serial_service.worker import SerialWorker
+from pyside_app_core.services.serial_service.write_queue import (
+    DEFAULT_HIGH_WATER,
+    DEFAULT_IN_FLIGHT,
+    WritePriority,
+    WriteQueue,
+)
 
 
 def _noop(ports: list[QSerialPortInfo]) -> list[QSerialPortInfo]:
@@ -29,99 +54,516 @@ class SerialService(QObject):
     com_connect = Signal(QSerialPort)
     com_disconnect = Signal()
     com_data = Signal(object)
+    com_data_batch = Signal(list)
     com_error = Signal(Exception)
-
-    DEBUG = True
-
-    def __init__(self, transcoder: type[TranscoderInterface] | None = None, parent: QObject | None = None):
+    com_write_depth = Signal(int)
+    com_backpressure = Signal(bool)
+    com_metrics = Signal(object)
+
+    # requests to the worker when running threaded
+    _open_requested = Signal(object, object)
+    _close_requested = Signal()
+    _write_requested = Signal(bytes)
+    _transcoder_requested = Signal(object)
+    _batching_requested = Signal(int, int)
+    _recorder_requested = Signal(object)
+
+    # trace serial traffic to the debug log, set on the class or an instance at any time
+    DEBUG = False
+
+    def __init__(
+        self,
+        transcoder: type[TranscoderInterface] | None = None,
+        parent: QObject | None = None,
+        *,
+        buffer_capacity: int = DEFAULT_CAPACITY,
+        threaded: bool = False,
+        worker_thread: QThread | None = None,
+        write_high_water: int = DEFAULT_HIGH_WATER,
+        write_in_flight: int = DEFAULT_IN_FLIGHT,
+        metrics_interval_ms: int = DEFAULT_METRICS_INTERVAL_MS,
+    ):
+        """
+        with `threaded` the port, buffering and decoding live in a dedicated
+        QThread and only decoded results are delivered to this thread.
+        `worker_thread` does the same on a running thread shared with other
+        services, it is not stopped with this service. `com_connect` then
+        carries an unopened stand-in with the port's name and settings, the
+        real port never leaves the worker thread.
+
+        outgoing messages are queued, see `WriteQueue` for `write_high_water`
+        and `write_in_flight`.
+
+        link metrics are always collected, a snapshot is sent on `com_metrics`
+        every `metrics_interval_ms` while connected, see `metrics`.
+        """
         super().__init__(parent=parent)
 
+        # follows DEBUG whether it's set on the class or this instance
+        self._trace = log.Tracer(__name__, enabled=lambda: self.DEBUG)
         self._port_filter: PortFilter = _noop
+        self._port_watcher: PortWatcher | None = None
 
         self._transcoder: type[TranscoderInterface] | None = transcoder
         self._com: QSerialPort | None = None
-        self._buffer = bytearray()
+        self._port_config = DEFAULT_PORT_CONFIG
+        self._port_info: QSerialPortInfo | QIODevice | None = None
+
+        self._metrics = SerialMetrics(metrics_interval_ms, parent=self)
+        self._metrics.updated.connect(self.com_metrics)
+
+        self._receiver = FrameReceiver(
+            transcoder,
+            on_result=self._emit_result,
+            on_error=self._emit_error,
+            capacity=buffer_capacity,
+            counters=self._metrics.counters,
+        )
+
+        self._write_queue = WriteQueue(
+            self._write,
+            high_water=write_high_water,
+            in_flight=write_in_flight,
+            parent=self,
+        )
+        self._write_queue.depth_changed.connect(self.com_write_depth)
+        self._write_queue.backpressure.connect(self.com_backpressure)
+        self._write_queue.depth_changed.connect(self._metrics.on_write_depth)
+
+        # readers and the result types they subscribed to, empty for every result
+        self._readers: list[tuple[SerialReader, tuple[type, ...]]] = []
+        # batch readers subscribed to result types while batching, see `_emit_batch`
+        self._batch_subscribers: list[tuple[BatchSerialReader, tuple[type, ...]]] = []
+        self._dispatcher = ResultDispatcher()
+        self._batcher: ResultBatcher | None = None
+        self._batching = False
+        self._recorder: CaptureRecorder | None = None
+
+        self._thread: QThread | None = None
+        self._owns_thread = False
+        self._worker: SerialWorker | None = None
+        if threaded or worker_thread:
+            self._start_worker(buffer_capacity, worker_thread)
 
     @property
     def is_connected(self) -> bool:
-        return self._com is not None and self._com.isOpen()
+        # a threaded service only holds a stand-in for a port the worker opened
+        return self._com is not None and (self._worker is not None or self._com.isOpen())
+
+    @property
+    def is_threaded(self) -> bool:
+        return self._worker is not None
 
-    def _new_com(self, port_info: QSerialPortInfo) -> tuple[QSerialPort, QSerialPort.SerialPortError | None]:
-        com = QSerialPort(port_info, parent=self)
-        com.setBaudRate(QSerialPort.BaudRate.Baud115200)
-        open_ok = com.open(QIODevice.OpenModeFlag.ReadWrite)
+    @property
+    def is_batching(self) -> bool:
+        return self._batching
 
-        return com, None if open_ok else com.error()
+    @property
+    def write_queue_depth(self) -> int:
+        """bytes waiting to be handed to the port"""
+        return self._write_queue.depth
+
+    @property
+    def port_config(self) -> SerialPortConfig:
+        """settings used for the current (or last) connection"""
+        return self._port_config
+
+    @property
+    def port_info(self) -> QSerialPortInfo | QIODevice | None:
+        """the port (or device) of the current (or last) connection"""
+        return self._port_info
+
+    @property
+    def port_watcher(self) -> PortWatcher | None:
+        return self._port_watcher
+
+    @property
+    def metrics(self) -> SerialMetrics:
+        """link counters, histograms and rates, `metrics.snapshot()` pulls them at any time"""
+        return self._metrics
+
+    @property
+    def _buffer(self) -> RingBuffer:
+        return self._receiver.buffer
+
+    def _new_com(
+        self,
+        port_info: QSerialPortInfo | QIODevice,
+        config: SerialPortConfig,
+    ) -> tuple[QSerialPort, QSerialPort.SerialPortError | None]:
+        if self._worker:
+            if isinstance(port_info, QIODevice) and self._thread:
+                # adopted by the worker, it has to live in the worker thread
+                port_info.setParent(None)
+                port_info.moveToThread(self._thread)
+
+            # blocks until the worker thread has tried to open the port
+            self._open_requested.emit(port_info, config)
+            return self._stand_in_com(port_info, config), self._worker.open_error
+
+        com, error = open_serial_port(port_info, parent=self, config=config)
+        # connected even if opening failed, `close_connection` disconnects them either way
+        com.readyRead.connect(self._on_data)
+        com.bytesWritten.connect(self._write_queue.on_bytes_written)
+        com.errorOccurred.connect(self._on_error)
+
+        return com, error
+
+    def _stand_in_com(self, port_info: QSerialPortInfo | QIODevice, config: SerialPortConfig) -> QSerialPort:
+        """
+        the worker's port belongs to the worker thread, readers in this thread get
+        an unopened port with the same name and settings, all I/O goes through the service
+        """
+        com = QSerialPort(self)
+        if isinstance(port_info, QSerialPortInfo):
+            com.setPort(port_info)
+        elif port_name := getattr(port_info, "portName", None):
+            com.setPortName(port_name())
+        configure_serial_port(com, config)
+        return com
+
+    def _start_worker(self, buffer_capacity: int, thread: QThread | None) -> None:
+        self._owns_thread = thread is None
+        self._thread = thread or QThread(self)
+        if self._owns_thread:
+            self._thread.setObjectName(f"{self.__class__.__name__}Worker")
+
+        self._worker = SerialWorker(self._transcoder, buffer_capacity, counters=self._metrics.counters)
+        self._worker.moveToThread(self._thread)
+        if self._owns_thread:
+            self._thread.finished.connect(self._worker.deleteLater)
+
+        blocking = Qt.ConnectionType.BlockingQueuedConnection
+        self._open_requested.connect(self._worker.open_port, blocking)
+        self._close_requested.connect(self._worker.close_port, blocking)
+        self._write_requested.connect(self._worker.write)
+        self._transcoder_requested.connect(self._worker.set_transcoder)
+        self._recorder_requested.connect(self._worker.set_recorder)
+        self._batching_requested.connect(self._worker.set_batching)
+
+        # results are queued back to this thread
+        self._worker.result.connect(self._emit_result)
+        self._worker.result_batch.connect(self._emit_batch)
+        self._worker.decode_error.connect(self._emit_error)
+        self._worker.bytes_written.connect(self._write_queue.on_bytes_written)
+        self._worker.port_error.connect(self._on_error)
+
+        if self._owns_thread:
+            if app := QCoreApplication.instance():
+                app.aboutToQuit.connect(self._stop_worker)
+
+            self._thread.start()
+
+    def _stop_worker(self) -> None:
+        if not self._thread or not self._worker:
+            return
+
+        if self._owns_thread:
+            self._thread.quit()
+            self._thread.wait()
+        else:
+            # deleted in the shared thread, which keeps running
+            self._worker.deleteLater()
+
+        self._thread = None
+        self._worker = None
 
     def set_transcoder(self, transcoder: type[TranscoderInterface]) -> None:
         self._transcoder = transcoder
+        self._receiver.set_transcoder(transcoder)
+        self._transcoder_requested.emit(transcoder)
+
+    def set_recorder(self, recorder: CaptureRecorder | None) -> None:
+        """
+        capture raw inbound and outbound bytes, see `ReplaySerialPort` to play them back.
+        the recorder is not closed with the connection, pass None to stop recording
+        """
+        self._recorder = recorder
+        self._recorder_requested.emit(recorder)
 
     def set_port_filter(self, func: PortFilter) -> None:
         self._port_filter = func
 
-    def open_connection(self, port_info: QSerialPortInfo | None) -> bool:
+    def set_batching(self, window_ms: int | None, max_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        coalesce decoded results and deliver them on `com_data_batch` at most
+        every `window_ms` or `max_size` results. readers implementing
+        `handle_serial_data_batch` are switched to batches, `com_data` still
+        fires for every result. pass None to go back to per result delivery.
+        """
+        readers_changed = self._batching != (window_ms is not None)
+        if readers_changed:
+            for reader, result_types in self._readers:
+                self._connect_reader_data(reader, result_types, connect=False)
+
+        if self._batcher:
+            self._batcher.flush()
+            self._batcher.deleteLater()
+            self._batcher = None
+
+        if self._worker:
+            self._batching_requested.emit(-1 if window_ms is None else window_ms, max_size)
+        elif window_ms is not None:
+            self._batcher = ResultBatcher(self._emit_batch, window_ms, max_size, parent=self)
+
+        self._batching = window_ms is not None
+        if readers_changed:
+            for reader, result_types in self._readers:
+                self._connect_reader_data(reader, result_types, connect=True)
+
+    def open_connection(
+        self,
+        port_info: QSerialPortInfo | QIODevice | None,
+        config: SerialPortConfig | None = None,
+    ) -> bool:
+        """
+        `config` is kept for later connections, without one the previous settings
+        (115200 8N1 to start with) are used. see `probe_serial_port` to find the
+        fastest baud rate a device supports.
+
+        a device standing in for a port, eg. `ReplaySerialPort`, can be passed
+        instead of a port info, the service takes ownership of it.
+        """
         if port_info is None:
             return False
 
         self.close_connection()
 
-        self._com, error = self._new_com(port_info)
+        if config is not None:
+            self._port_config = config
+
+        self._port_info = port_info
+        self._com, error = self._new_com(port_info, self._port_config)
         if error:
             self._on_error(error)
             return False
 
-        self._com.readyRead.connect(self._on_data)
-        self._com.errorOccurred.connect(self._on_error)
-
+        self._metrics.start()
         self.com_connect.emit(self._com)
 
         return True
 
-    def register_reader(self, reader: SerialReader) -> None:
-        if self.DEBUG:
-            log.debug(f"Registering reader {reader}")
+    def register_reader(self, reader: SerialReader, result_types: tuple[type, ...] = ()) -> None:
+        """
+        with `result_types` the reader's `handle_serial_data` is subscribed to
+        just those types (see `subscribe`) rather than receiving every result,
+        while batching a batch reader gets the batches filtered to those types.
+
+        readers that are QObjects are unregistered when they are destroyed,
+        anything else has to be passed to `unregister_reader`
+        """
+        self._trace("Registering reader %s", reader)
         self.com_connect.connect(reader.handle_serial_connect)
         self.com_disconnect.connect(reader.handle_serial_disconnect)
         self.com_ports.connect(reader.handle_serial_ports)
-        self.com_data.connect(reader.handle_serial_data)
         self.com_error.connect(reader.handle_serial_error)
 
+        self._readers.append((reader, result_types))
+        self._connect_reader_data(reader, result_types, connect=True)
+
+        if isinstance(reader, QObject):
+            reader.destroyed.connect(self._forget_destroyed_readers)
+
+    def unregister_reader(self, reader: SerialReader) -> None:
+        index = next((i for i, (r, _) in enumerate(self._readers) if r is reader), None)
+        if index is None:
+            raise ValueError(f"{reader!r} is not registered")
+
+        self._trace("Unregistering reader %s", reader)
+        _, result_types = self._readers.pop(index)
+        self._connect_reader_data(reader, result_types, connect=False)
+
+        self.com_connect.disconnect(reader.handle_serial_connect)
+        self.com_disconnect.disconnect(reader.handle_serial_disconnect)
+        self.com_ports.disconnect(reader.handle_serial_ports)
+        self.com_error.disconnect(reader.handle_serial_error)
+
+        if isinstance(reader, QObject):
+            reader.destroyed.disconnect(self._forget_destroyed_readers)
+
+    def _connect_reader_data(self, reader: SerialReader, result_types: tuple[type, ...], *, connect: bool) -> None:
+        batch = self.is_batching and isinstance(reader, BatchSerialReader)
+
+        if result_types and batch:
+            entry = (cast(BatchSerialReader, reader), result_types)
+            if connect:
+                self._batch_subscribers.append(entry)
+            else:
+                self._batch_subscribers.remove(entry)
+            return
+
+        if result_types:
+            for result_type in result_types:
+                if connect:
+                    self.subscribe(result_type, reader.handle_serial_data)
+                else:
+                    self.unsubscribe(result_type, reader.handle_serial_data)
+            return
+
+        signal, slot = self.com_data, reader.handle_serial_data
+        if batch:
+            signal, slot = self.com_data_batch, cast(BatchSerialReader, reader).handle_serial_data_batch
+
+        if connect:
+            signal.connect(slot)
+        else:
+            signal.disconnect(slot)
+
+    @Slot()
+    def _forget_destroyed_readers(self) -> None:
+        # Qt already dropped the destroyed reader's connections, not its result subscriptions.
+        # readers are also destroyed while a collected service clears its attributes
+        readers: list[tuple[SerialReader, tuple[type, ...]]] = getattr(self, "_readers", [])
+        for reader, result_types in [(r, t) for r, t in readers if isinstance(r, QObject) and not isValid(r)]:
+            self._readers.remove((reader, result_types))
+            if result_types:
+                self._connect_reader_data(reader, result_types, connect=False)
+
+    def subscribe(self, result_type: type, callback: ResultCallback) -> None:
+        """
+        call `callback` with every decoded result that is a `result_type`,
+        in this thread and before `com_data`. unlike readers on `com_data`
+        it costs nothing for results of other types.
+        """
+        self._dispatcher.subscribe(result_type, callback)
+
+    def unsubscribe(self, result_type: type, callback: ResultCallback) -> None:
+        self._dispatcher.unsubscribe(result_type, callback)
+
+    def set_port_watcher(self, watcher: PortWatcher | None) -> None:
+        """
+        take ports from a `PortWatcher` (started here if it isn't running)
+        instead of enumerating them on this thread. `com_ports` then fires on
+        every hot plug change and `scan_for_ports` answers from its cache.
+        """
+        if self._port_watcher:
+            self._port_watcher.ports_changed.disconnect(self._emit_ports)
+
+        self._port_watcher = watcher
+        if watcher:
+            watcher.ports_changed.connect(self._emit_ports)
+            watcher.start()
+
     def scan_for_ports(self) -> None:
-        log.debug("Scanning for ports...")
-        ports = QSerialPortInfo.availablePorts()
+        if self._port_watcher:
+            if self._port_watcher.is_ready:
+                self._emit_ports(self._port_watcher.ports)
+            # anything the watcher hasn't noticed yet follows on com_ports
+            self._port_watcher.refresh()
+            return
+
+        self._trace("Scanning for ports...")
+        self._emit_ports(QSerialPortInfo.availablePorts())
 
+    def _emit_ports(self, ports: list[QSerialPortInfo]) -> None:
         self._debug_ports(ports)
 
         filtered_ports = self._port_filter(ports)
 
-        if self.DEBUG:
-            log.debug(f"Sending ports: {[p.portName() for p in filtered_ports]}")
+        if self._trace:
+            self._trace("Sending ports: %s", [p.portName() for p in filtered_ports])
 
         self.com_ports.emit(filtered_ports)
 
-    def send_data(self, data: Encodable) -> None:
-        """send data to the connected port"""
+    def send_data(self, data: Encodable, priority: WritePriority = WritePriority.BULK) -> bool:
+        """
+        queue data for the connected port. returns False if it was not queued,
+        bulk data is refused while the write queue is over its high water mark
+        (see `com_backpressure`), control data always goes ahead of bulk data.
+        """
         if not self._transcoder:
-            return
+            return False
 
-        if self.DEBUG:
-            log.debug(f"sending data: {data}")
+        self._trace("sending data: %s", data)
 
         if not self._com:
             log.warning("can't send data, com port not connected")
+            return False
+
+        return self._write_queue.enqueue(self._transcoder.encode(data), priority)
+
+    def _write(self, data: bytes) -> int | None:
+        self._metrics.counters.bytes_out += len(data)
+        if self._recorder:
+            self._recorder.record(CaptureDirection.OUTBOUND, data)
+
+        if self._worker:
+            self._write_requested.emit(data)
+            return None
+
+        return self._com.write(data) if self._com else -1
+
+    async def send(self, data: Encodable, priority: WritePriority = WritePriority.BULK) -> None:
+        """
+        `send_data` for coroutines, waits for room in the write queue instead of
+        refusing the data. raises SerialDisconnectedError without a connection
+        """
+        while not self.send_data(data, priority):
+            if not self._com or not self._transcoder:
+                raise SerialDisconnectedError(self._com, QSerialPort.SerialPortError.NotOpenError)
+
+            await self._write_queue_changed()
+
+    async def frames(self) -> AsyncIterator[Decodable]:
+        """
+        decoded results as an async iterator, it ends when the connection closes.
+        needs an asyncio loop in this thread, see `BaseApp.launch(use_asyncio=True)`
+        """
+        if not self._com:
             return
 
-        self._com.write(self._transcoder.encode(data))
+        results: asyncio.Queue[Decodable | None] = asyncio.Queue()
+        put = results.put_nowait
+
+        def _closed() -> None:
+            put(None)
+
+        self.com_data.connect(put)
+        self.com_disconnect.connect(_closed)
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+        finally:
+            self.com_data.disconnect(put)
+            self.com_disconnect.disconnect(_closed)
+
+    async def _write_queue_changed(self) -> None:
+        changed = asyncio.get_running_loop().create_future()
+
+        def _wake(*_: object) -> None:
+            if not changed.done():
+                changed.set_result(None)
+
+        self.com_write_depth.connect(_wake)
+        self.com_disconnect.connect(_wake)
+        try:
+            await changed
+        finally:
+            self.com_write_depth.disconnect(_wake)
+            self.com_disconnect.disconnect(_wake)
 
     def close_connection(self) -> None:
         if not self._com:
             return
 
+        if self._batcher:
+            self._batcher.flush()
+
+        self._write_queue.clear()
+        self._metrics.stop()
         self.com_disconnect.emit()
 
+        if self._worker:
+            # the worker owns the port, it is deleted in the worker thread
+            self._close_requested.emit()
+            self._com.deleteLater()
+            self._com = None
+            return
+
         try:
             self._com.errorOccurred.disconnect()
             self._com.readyRead.disconnect()
+            self._com.bytesWritten.disconnect()
         except Exception as e:  # noqa: BLE001
             log.exception(e)
 
@@ -131,9 +573,11 @@ class SerialService(QObject):
 
         self._com.deleteLater()
         self._com = None
+        self._receiver.reset()
 
     def deleteLater(self) -> None:
         self.close_connection()
+        self._stop_worker()
         super().deleteLater()
 
     def _on_data(self, *_: object, **__: object) -> None:
@@ -141,34 +585,52 @@ class SerialService(QObject):
             return
 
         raw = self._com.readAll()
-        if self.DEBUG:
-            log.debug(f"serial data: {raw!r}")
-        self._buffer.extend(cast(bytearray, raw))
-
-        chunks, remainder = self._transcoder.process_buffer(self._buffer)
-
-        for chunk in chunks:
-            try:
-                result = self._transcoder.decode(chunk)
-                if self.DEBUG:
-                    log.debug(f"transcoded chunk: {result}")
-                self.com_data.emit(result)
-            except Exception as e:  # noqa: BLE001
-                log.exception(e)
-                self.com_error.emit(e)
-
-            self._buffer.clear()
-            if remainder is not None:
-                self._buffer.extend(remainder)
+        self._trace("serial data: %r", raw)
+        if self._recorder:
+            self._recorder.record(CaptureDirection.INBOUND, cast(bytes, raw))
+
+        self._receiver.feed(cast(bytes, raw))
+
+    def _emit_result(self, result: Decodable) -> None:
+        if self._batcher:
+            self._batcher.add(result)
+            return
+
+        self._trace("transcoded chunk: %s", result)
+        if self._dispatcher:
+            self._dispatcher.dispatch(result)
+        self.com_data.emit(result)
+
+    def _emit_batch(self, batch: list[Decodable]) -> None:
+        for result in batch:
+            self._trace("transcoded chunk: %s", result)
+            if self._dispatcher:
+                self._dispatcher.dispatch(result)
+            self.com_data.emit(result)
+
+        self.com_data_batch.emit(batch)
+
+        for reader, result_types in self._batch_subscribers:
+            if results := [result for result in batch if isinstance(result, result_types)]:
+                try:
+                    reader.handle_serial_data_batch(results)
+                except Exception as e:  # noqa: BLE001
+                    # as with `subscribe`, a failing reader doesn't stop the receive path
+                    log.exception(e)
+
+    def _emit_error(self, error: Exception) -> None:
+        self.com_error.emit(error)
 
     def _on_error(self, error: QSerialPort.SerialPortError | None) -> None:
-        if self.DEBUG:
-            log.debug(f"serial error: {error}")
+        self._trace("serial error: %s", error)
 
         exception: SerialError
 
         if error is None or error == QSerialPort.SerialPortError.NoError:
             return
+        if self._worker and not self._com:
+            # queued from a worker port that has already been closed
+            return
         if error == QSerialPort.SerialPortError.OpenError:
             exception = SerialConnectionError(self._com, error)
         elif error == QSerialPort.SerialPortError.ReadError:
@@ -182,20 +644,19 @@ class SerialService(QObject):
 
         self.close_connection()
 
-        # QTimer.singleShot(3 * SECONDS, self.scan_for_ports)
-
+        # see `ReconnectSupervisor` to reopen dropped ports
         self.com_error.emit(exception)
         raise exception
 
     def _debug_ports(self, ports: list[QSerialPortInfo]) -> None:
-        if not self.DEBUG:
+        if not self._trace:
             return
 
         for p in ports:
-            log.debug("-----------------------------")
-            log.debug(f"name:         {p.portName()}")
-            log.debug(f"manufacturer: {p.manufacturer()}")
-            log.debug(f"productId:    {p.productIdentifier()}")
-            log.debug(f"serialNumber: {p.serialNumber()}")
-            log.debug(f"vendorId:     {p.vendorIdentifier()}")
-            log.debug(f"systemLoc:    {p.systemLocation()}")
+            self._trace("-----------------------------")
+            self._trace("name:         %s", p.portName())
+            self._trace("manufacturer: %s", p.manufacturer())
+            self._trace("productId:    %s", p.productIdentifier())
+            self._trace("serialNumber: %s", p.serialNumber())
+            self._trace("vendorId:     %s", p.vendorIdentifier())
+            self._trace("systemLoc:    %s", p.systemLocation())
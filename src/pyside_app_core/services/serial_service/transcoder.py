@@ -1,4 +1,13 @@
-from pyside_app_core.services.serial_service.types import ChunkedData, Decodable, Encodable, TranscoderInterface
+from pyside_app_core.constants import COBS_SEP
+from pyside_app_core.services.serial_service import conversion_utils
+from pyside_app_core.services.serial_service.ring_buffer import RingBuffer
+from pyside_app_core.services.serial_service.types import (
+    ChunkedData,
+    Decodable,
+    Encodable,
+    FrameScanner,
+    FrameSpans,
+)
 
 
 class Message(Encodable):
@@ -28,9 +37,22 @@ class Result(Decodable):
         return f"<{self.__class__.__name__}>({self._raw_data!r})"
 
 
-class RawTranscoder(TranscoderInterface):
+class RawTranscoder(FrameScanner):
     SEP = b"\r\n"
 
+    @classmethod
+    def scan_frames(cls, buffer: RingBuffer, scan_from: int = 0) -> FrameSpans:
+        frames: list[memoryview] = []
+        start = 0
+        sep_len = len(cls.SEP)
+
+        while (end := buffer.find(cls.SEP, scan_from)) >= 0:
+            frames.append(buffer.view(start, end))
+            start = scan_from = end + sep_len
+
+        # a separator may be split across reads, back up enough to catch it
+        return frames, start, max(start, len(buffer) - sep_len + 1)
+
     @classmethod
     def process_buffer(cls, buffer: bytearray) -> ChunkedData:
         if cls.SEP in buffer:
@@ -41,10 +63,42 @@ class RawTranscoder(TranscoderInterface):
 
         return [], None
 
+    @classmethod
+    def frame(cls, payload: bytes) -> bytes:
+        """wrap an encoded message for the wire"""
+        return payload
+
+    @classmethod
+    def unframe(cls, raw: bytearray | memoryview) -> bytes:
+        """recover the encoded message from a received frame"""
+        # frames may be views into the receive buffer, don't hold on to them
+        return bytes(raw)
+
     @classmethod
     def encode(cls, data: Encodable) -> bytes:
-        return data.encode()
+        return cls.frame(data.encode())
 
     @classmethod
     def decode(cls, raw: bytearray) -> Result:
-        return Result.decode(raw)
+        return Result.decode(cls.unframe(raw))
+
+
+class CobsTranscoder(RawTranscoder):
+    """binary safe framing, messages are COBS encoded and delimited by a zero byte"""
+
+    SEP = COBS_SEP
+
+    @classmethod
+    def scan_frames(cls, buffer: RingBuffer, scan_from: int = 0) -> FrameSpans:
+        frames, consumed, scanned = super().scan_frames(buffer, scan_from)
+
+        # senders may emit extra delimiters to flush the line, they aren't messages
+        return [f for f in frames if f], consumed, scanned
+
+    @classmethod
+    def frame(cls, payload: bytes) -> bytes:
+        return conversion_utils.cobs_encode(payload) + cls.SEP
+
+    @classmethod
+    def unframe(cls, raw: bytearray | memoryview) -> bytes:
+        return conversion_utils.cobs_decode(raw)
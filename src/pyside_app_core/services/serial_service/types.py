@@ -1,9 +1,11 @@
 from collections.abc import Sequence
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from PySide6.QtCore import Slot
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
 
+from pyside_app_core.services.serial_service.ring_buffer import RingBuffer
+
 
 class Encodable(Protocol):
     def encode(self) -> bytes: ...
@@ -18,8 +20,25 @@ class Decodable(Protocol):
     def __str__(self) -> str: ...
 
 
+class CorrelatedMessage(Encodable, Protocol):
+    """a message that carries the id of the request it belongs to, see `RequestTracker`"""
+
+    request_id: int
+
+
+class CorrelatedResult(Decodable, Protocol):
+    """a reply that echoes the id of the request it answers, None for unsolicited data"""
+
+    @property
+    def request_id(self) -> int | None: ...
+
+
 ChunkedData = tuple[Sequence[bytearray], bytearray | None]
 
+# frames (usually views into the receive buffer), number of bytes consumed,
+# offset up to which the buffer has been inspected
+FrameSpans = tuple[Sequence[memoryview | bytearray], int, int]
+
 
 class TranscoderInterface(Protocol):
     @classmethod
@@ -32,6 +51,20 @@ class TranscoderInterface(Protocol):
     def decode(cls, raw: bytearray) -> Decodable: ...
 
 
+class FrameScanner(TranscoderInterface, Protocol):
+    """
+    a transcoder that can frame data in place,
+    the returned frames are only valid until the consumed bytes are discarded.
+
+    scanning is incremental, `scan_from` is where the previous call stopped
+    inspecting bytes (adjusted for consumed bytes) so data that arrives in many
+    small reads is only searched once.
+    """
+
+    @classmethod
+    def scan_frames(cls, buffer: RingBuffer, scan_from: int = 0) -> FrameSpans: ...
+
+
 class SerialReader(Protocol):
     @Slot()
     def handle_serial_connect(self, com: QSerialPort) -> None: ...
@@ -49,5 +82,13 @@ class SerialReader(Protocol):
     def handle_serial_error(self, error: Exception) -> None: ...
 
 
+@runtime_checkable
+class BatchSerialReader(SerialReader, Protocol):
+    """a reader that can consume coalesced results in one call, see `SerialService.set_batching`"""
+
+    @Slot()
+    def handle_serial_data_batch(self, data: list[Decodable]) -> None: ...
+
+
 class PortFilter(Protocol):
     def __call__(self, ports: list[QSerialPortInfo]) -> list[QSerialPortInfo]: ...
@@ -0,0 +1,130 @@
+import itertools
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+
+from PySide6.QtCore import QIODevice, QObject, Qt, QTimer, Signal
+
+from pyside_app_core.services.serial_service.port_device import PortDevice
+
+_NS_PER_S = 1_000_000_000
+_NS_PER_MS = 1_000_000
+
+
+class VirtualSerialPort(PortDevice):
+    """
+    in-process serial link for tests and benchmarks, pass it to
+    `SerialService.open_connection` in place of a QSerialPortInfo.
+
+    bytes sent from the device side with `inject` (and, with `loopback`, every
+    write from the host) reach the host through a simulated link:
+      - `bandwidth` bytes per second are serialised, None is unlimited
+      - every chunk arrives `latency_ms` after it was sent
+      - `fragments` cycles through read sizes, each fragment is its own readyRead.
+        without it everything due is delivered in one read
+
+    `host_data` reports what the host wrote, eg. to script a device reply.
+    a threaded service moves the port to its worker thread, `inject` from there.
+    """
+
+    host_data = Signal(bytes)
+
+    def __init__(
+        self,
+        name: str = "virtual",
+        parent: QObject | None = None,
+        *,
+        bandwidth: int | None = None,
+        latency_ms: float = 0,
+        fragments: Sequence[int] | None = None,
+        loopback: bool = True,
+    ):
+        super().__init__(name, parent=parent)
+
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError("bandwidth must be positive, use None for unlimited")
+        if fragments is not None and (not fragments or min(fragments) < 1):
+            raise ValueError("fragment sizes must be at least 1 byte")
+
+        self._bandwidth = bandwidth
+        self._latency_ns = int(latency_ms * _NS_PER_MS)
+        self._fragments: Iterator[int] | None = itertools.cycle(fragments) if fragments else None
+        self._loopback = loopback
+
+        # (due ns, chunk), the link is serial so chunks are due in the order they were sent
+        self._in_transit: deque[tuple[int, bytes]] = deque()
+        self._link_free_ns = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._deliver)
+
+    @property
+    def in_transit(self) -> int:
+        """bytes sent that haven't arrived yet"""
+        return sum(len(chunk) for _, chunk in self._in_transit)
+
+    def open(self, mode: QIODevice.OpenModeFlag) -> bool:
+        self._link_free_ns = time.monotonic_ns()
+        return super().open(mode)
+
+    def close(self) -> None:
+        self._timer.stop()
+        self._in_transit.clear()
+        super().close()
+
+    def inject(self, data: bytes | bytearray | memoryview) -> None:
+        """send `data` from the device side"""
+        if not self.isOpen() or not data:
+            return
+
+        data = bytes(data)
+        now_ns = time.monotonic_ns()
+        sent_ns = max(now_ns, self._link_free_ns)
+
+        for chunk in self._split(data):
+            if self._bandwidth:
+                sent_ns += len(chunk) * _NS_PER_S // self._bandwidth
+            self._in_transit.append((sent_ns + self._latency_ns, chunk))
+
+        self._link_free_ns = sent_ns
+        self._schedule()
+
+    def _on_write(self, data: bytes) -> None:
+        self.host_data.emit(data)
+        if self._loopback:
+            self.inject(data)
+
+    def _split(self, data: bytes) -> Iterator[bytes]:
+        if not self._fragments:
+            yield data
+            return
+
+        offset = 0
+        while offset < len(data):
+            size = next(self._fragments)
+            yield data[offset : offset + size]
+            offset += size
+
+    def _schedule(self) -> None:
+        if not self._in_transit:
+            return
+
+        # rounded up, a timer firing early would only have to be started again
+        wait_ms = -((time.monotonic_ns() - self._in_transit[0][0]) // _NS_PER_MS)
+        self._timer.start(max(0, wait_ms))
+
+    def _deliver(self) -> None:
+        now_ns = time.monotonic_ns()
+        due = bytearray()
+
+        while self._in_transit and self._in_transit[0][0] <= now_ns:
+            _, chunk = self._in_transit.popleft()
+            if self._fragments:
+                self._push(chunk)
+            else:
+                due += chunk
+
+        self._push(due)
+        self._schedule()
@@ -0,0 +1,139 @@
+from typing import cast
+
+from PySide6.QtCore import QIODevice, QObject, Signal, Slot
+from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
+
+from pyside_app_core import log
+from pyside_app_core.services.serial_service.batching import ResultBatcher
+from pyside_app_core.services.serial_service.capture import CaptureDirection, CaptureRecorder
+from pyside_app_core.services.serial_service.metrics import LinkCounters
+from pyside_app_core.services.serial_service.port import SerialPortConfig, open_serial_port
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.ring_buffer import DEFAULT_CAPACITY
+from pyside_app_core.services.serial_service.types import Decodable, TranscoderInterface
+
+
+class SerialWorker(QObject):
+    """
+    owns a serial port and its receive buffer, meant to live in a QThread.
+
+    only decoded results and errors leave the worker, they are delivered to
+    objects in other threads through queued connections.
+    """
+
+    result = Signal(object)
+    result_batch = Signal(list)
+    decode_error = Signal(Exception)
+    bytes_written = Signal(int)
+    port_error = Signal(QSerialPort.SerialPortError)
+
+    def __init__(
+        self,
+        transcoder: type[TranscoderInterface] | None = None,
+        buffer_capacity: int = DEFAULT_CAPACITY,
+        parent: QObject | None = None,
+        *,
+        counters: LinkCounters | None = None,
+    ):
+        super().__init__(parent=parent)
+
+        self._com: QSerialPort | None = None
+        self._open_error: QSerialPort.SerialPortError | None = None
+        self._batcher: ResultBatcher | None = None
+        self._recorder: CaptureRecorder | None = None
+        self._receiver = FrameReceiver(
+            transcoder,
+            on_result=self._on_result,
+            on_error=self.decode_error.emit,
+            capacity=buffer_capacity,
+            counters=counters,
+        )
+
+    @property
+    def com(self) -> QSerialPort | None:
+        return self._com
+
+    @property
+    def open_error(self) -> QSerialPort.SerialPortError | None:
+        return self._open_error
+
+    @Slot(object, object)
+    def open_port(self, port_info: QSerialPortInfo | QIODevice, config: SerialPortConfig) -> None:
+        self.close_port()
+
+        com, self._open_error = open_serial_port(port_info, parent=self, config=config)
+        if self._open_error:
+            com.deleteLater()
+            return
+
+        self._com = com
+        com.readyRead.connect(self._on_data)
+        com.bytesWritten.connect(self.bytes_written.emit)
+        com.errorOccurred.connect(self.port_error.emit)
+
+    @Slot()
+    def close_port(self) -> None:
+        if not self._com:
+            return
+
+        if self._batcher:
+            self._batcher.flush()
+
+        try:
+            self._com.errorOccurred.disconnect()
+            self._com.readyRead.disconnect()
+            self._com.bytesWritten.disconnect()
+        except Exception as e:  # noqa: BLE001
+            log.exception(e)
+
+        if self._com.isOpen():
+            self._com.flush()
+            self._com.close()
+
+        self._com.deleteLater()
+        self._com = None
+        self._receiver.reset()
+
+    @Slot(bytes)
+    def write(self, data: bytes) -> None:
+        if not self._com:
+            log.warning("can't send data, com port not connected")
+            return
+
+        self._com.write(data)
+
+    @Slot(object)
+    def set_transcoder(self, transcoder: type[TranscoderInterface]) -> None:
+        self._receiver.set_transcoder(transcoder)
+
+    @Slot(object)
+    def set_recorder(self, recorder: CaptureRecorder | None) -> None:
+        self._recorder = recorder
+
+    @Slot(int, int)
+    def set_batching(self, window_ms: int, max_size: int) -> None:
+        """a negative window disables batching"""
+        if self._batcher:
+            self._batcher.flush()
+            self._batcher.deleteLater()
+            self._batcher = None
+
+        if window_ms >= 0:
+            self._batcher = ResultBatcher(self.result_batch.emit, window_ms, max_size, parent=self)
+
+    def _on_result(self, result: Decodable) -> None:
+        if self._batcher:
+            self._batcher.add(result)
+        else:
+            self.result.emit(result)
+
+    @Slot()
+    def _on_data(self) -> None:
+        if not self._com:
+            return
+
+        raw = self._com.readAll()
+        if self._recorder:
+            self._recorder.record(CaptureDirection.INBOUND, cast(bytes, raw))
+
+        self._receiver.feed(cast(bytes, raw))
@@ -0,0 +1,113 @@
+from collections import deque
+from collections.abc import Callable
+from enum import IntEnum
+
+from PySide6.QtCore import QObject, Signal
+
+from pyside_app_core import log
+
+DEFAULT_HIGH_WATER = 16 * 1024
+DEFAULT_IN_FLIGHT = 512
+
+
+class WritePriority(IntEnum):
+    """lanes are drained in this order, a lower value always goes first"""
+
+    CONTROL = 0
+    BULK = 1
+
+
+class WriteQueue(QObject):
+    """
+    outbound messages waiting for the port.
+
+    only `in_flight` bytes are handed to the port at a time, more are written as
+    the port reports `bytesWritten`, so control messages don't wait behind a burst
+    sitting in the OS buffer. messages are never split, frames stay intact.
+
+    bulk messages are refused once `high_water` bytes are queued, `backpressure`
+    turns on at the high water mark and off again at half of it.
+    """
+
+    depth_changed = Signal(int)
+    backpressure = Signal(bool)
+
+    def __init__(
+        self,
+        write: Callable[[bytes], object],
+        high_water: int = DEFAULT_HIGH_WATER,
+        in_flight: int = DEFAULT_IN_FLIGHT,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent=parent)
+
+        self._write = write
+        self._high_water = high_water
+        self._in_flight_limit = in_flight
+
+        self._lanes: dict[WritePriority, deque[bytes]] = {p: deque() for p in sorted(WritePriority)}
+        self._depth = 0
+        self._in_flight = 0
+        self._throttled = False
+
+    @property
+    def depth(self) -> int:
+        """bytes queued and not yet handed to the port"""
+        return self._depth
+
+    @property
+    def in_flight(self) -> int:
+        """bytes handed to the port that it hasn't reported as written"""
+        return self._in_flight
+
+    @property
+    def is_throttled(self) -> bool:
+        return self._throttled
+
+    def enqueue(self, data: bytes, priority: WritePriority = WritePriority.BULK) -> bool:
+        """returns False when a bulk message is refused because the queue is full"""
+        if priority != WritePriority.CONTROL and self._depth and self._depth + len(data) > self._high_water:
+            return False
+
+        self._lanes[priority].append(data)
+        self._drain(self._depth + len(data))
+        return True
+
+    def on_bytes_written(self, count: int) -> None:
+        self._in_flight = max(0, self._in_flight - count)
+        self._drain(self._depth)
+
+    def clear(self) -> None:
+        for lane in self._lanes.values():
+            lane.clear()
+
+        self._in_flight = 0
+        self._set_depth(0)
+
+    def _drain(self, depth: int) -> None:
+        for lane in self._lanes.values():
+            while lane and self._in_flight < self._in_flight_limit:
+                data = lane.popleft()
+                depth -= len(data)
+
+                if self._write(data) == -1:
+                    log.warning(f"serial write of {len(data)} bytes failed")
+                    continue
+
+                self._in_flight += len(data)
+
+        self._set_depth(depth)
+
+    def _set_depth(self, depth: int) -> None:
+        if depth == self._depth:
+            return
+
+        self._depth = depth
+        self.depth_changed.emit(depth)
+
+        if not self._throttled and depth >= self._high_water:
+            self._throttled = True
+            self.backpressure.emit(True)
+        elif self._throttled and depth <= self._high_water // 2:
+            self._throttled = False
+            self.backpressure.emit(False)
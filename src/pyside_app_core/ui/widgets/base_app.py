@@ -41,6 +41,7 @@ class BaseApp(QApplication, Generic[M]):
         )
 
         self._main_window: M = self.build_main_window()
+        self._exit_code = 0
 
     def configure_preferences(self) -> None:
         raise NotImplementedError
@@ -51,7 +52,14 @@ class BaseApp(QApplication, Generic[M]):
     def on_show_main_window(self) -> None:
         pass
 
-    def launch(self) -> None:
+    async def run_async(self) -> None:
+        """started once the asyncio loop runs, when launched with `use_asyncio`"""
+
+    def launch(self, *, use_asyncio: bool = False) -> None:
+        """
+        with `use_asyncio` the Qt event loop is driven by QtAsyncio so coroutines
+        (eg. `SerialService.frames`) can run alongside signals and slots
+        """
         if not self._main_window:
             raise ApplicationError(f"Must subclass {BaseApp.__name__} and define a main window")
 
@@ -59,11 +67,23 @@ class BaseApp(QApplication, Generic[M]):
         self.on_show_main_window()
 
         try:
-            self.about_to_exit(self.exec())
+            self.about_to_exit(self._exec_asyncio() if use_asyncio else self.exec())
         except Exception as e:  # noqa:BLE001
             log.exception(e)
             sys.exit(1)
 
+    def exec(self) -> int:  # type: ignore[override]
+        # QtAsyncio runs the event loop through this and drops the exit code, keep it
+        self._exit_code = super().exec()
+        return self._exit_code
+
+    def _exec_asyncio(self) -> int:
+        from PySide6 import QtAsyncio
+
+        self._exit_code = 0
+        QtAsyncio.run(self.run_async(), keep_running=True, quit_qapp=True, handle_sigint=True)
+        return self._exit_code
+
     def before_exit(self) -> None:
         pass
 
@@ -1,7 +1,7 @@
 from collections.abc import Callable
 from typing import NamedTuple, cast
 
-from PySide6.QtCore import QRect, QSize, Qt, QTimer, Signal, Slot
+from PySide6.QtCore import QRect, QSignalBlocker, QSize, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPalette, QStandardItem, QStandardItemModel
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
 from PySide6.QtWidgets import QComboBox, QHBoxLayout, QPushButton, QVBoxLayout, QWidget
@@ -39,9 +39,15 @@ class ConnectionManager(SettingsMixin, QWidget):
         port_data_mapper: PortDataMapper = _default_port_data_mapper,
         remember_last_connection: bool = False,  # noqa: FBT002
         parent: QWidget | None = None,
+        *,
+        refresh_delay_ms: int = int(0.5 * SECONDS),
     ):
         super().__init__(parent=parent)
 
+        # how long the refresh button waits before asking for ports,
+        # 0 suits a service with a `PortWatcher` since its answer is cached
+        self._refresh_delay_ms = refresh_delay_ms
+
         # autoconnect will automatically connect to a port the first time the app is opened
         # if there is only one port
         self._autoconnect = autoconnect
@@ -90,6 +96,8 @@ class ConnectionManager(SettingsMixin, QWidget):
         self._port_list = QComboBox(self)
         self._port_list.setPlaceholderText("Choose A Device")
         self._port_list.setFixedHeight(self.SIZE.height())
+        # replaced on every port list, the previous one is deleted
+        self._port_model: QStandardItemModel | None = None
         _ly_list.addWidget(self._port_list, stretch=9)
 
         # --------
@@ -138,8 +146,11 @@ class ConnectionManager(SettingsMixin, QWidget):
     @Slot()
     def handle_serial_ports(self, ports: list[QSerialPortInfo]) -> None:
         self.setEnabled(True)
-        self._port_list.clear()
 
+        # hot plug updates can arrive at any time, keep the selected port selected
+        previous = self.current_port
+        previous_location = previous.systemLocation() if previous else None
+        selected_index = -1
         remembered_index = -1
 
         model = QStandardItemModel(parent=self)
@@ -156,8 +167,20 @@ class ConnectionManager(SettingsMixin, QWidget):
 
             if self._remember_last_connection and self._last_port_serial == port.serialNumber():
                 remembered_index = i
+            if previous_location and port.systemLocation() == previous_location:
+                selected_index = i
+
+        if selected_index >= 0:
+            with QSignalBlocker(self._port_list):
+                self._port_list.setModel(model)
+                self._port_list.setCurrentIndex(selected_index)
+        else:
+            self._port_list.clear()
+            self._port_list.setModel(model)
 
-        self._port_list.setModel(model)
+        if self._port_model:
+            self._port_model.deleteLater()
+        self._port_model = model
 
         if remembered_index >= 0:
             # clear it out so only happens first time
@@ -177,6 +200,10 @@ class ConnectionManager(SettingsMixin, QWidget):
     def handle_serial_data(self, _: object) -> None:
         self._activity.tick()
 
+    @Slot()
+    def handle_serial_data_batch(self, _: list[object]) -> None:
+        self._activity.tick()
+
     @Slot()
     def handle_serial_error(self, error: Exception) -> None:
         pass
@@ -184,7 +211,7 @@ class ConnectionManager(SettingsMixin, QWidget):
     def request_port_refresh(self) -> None:
         self.setDisabled(True)
         self._connect_btn.setChecked(False)
-        QTimer.singleShot(int(0.5 * SECONDS), self.refresh_ports.emit)
+        QTimer.singleShot(self._refresh_delay_ms, self.refresh_ports.emit)
 
     def request_connection_change(self, connect: bool) -> None:
         if not self.current_port:
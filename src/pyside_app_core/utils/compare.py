@@ -1,8 +1,8 @@
-__abs_tolerance = 1e-6
+ABS_TOLERANCE = 1e-6
 
 
 def float_approx(a: float, b: float) -> bool:
     if a == b:
         return True
 
-    return abs(a - b) <= __abs_tolerance
+    return abs(a - b) <= ABS_TOLERANCE
@@ -0,0 +1,38 @@
+"""
+receive throughput of a transcoder on a recorded capture, see `CaptureRecorder`.
+
+the inbound side of the capture is decoded as fast as possible, once with the
+reads as they were captured and once re-split into fixed size reads.
+
+    PYTHONPATH=src python tests/benchmarks/bench_replay.py session.cap [raw|cobs]
+"""
+
+import sys
+
+from pyside_app_core.services.serial_service.replay import ReplayStats, replay_benchmark
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, RawTranscoder
+
+READ_SIZE = 512
+
+TRANSCODERS = {"raw": RawTranscoder, "cobs": CobsTranscoder}
+
+
+def _row(label: str, stats: ReplayStats) -> str:
+    return f"{label:<16}{stats.results_per_second:>14,.0f}{stats.bytes_per_second / 1e6:>14.2f}{stats.errors:>10}"
+
+
+def main() -> None:
+    path = sys.argv[1]
+    transcoder = TRANSCODERS[sys.argv[2] if len(sys.argv) > 2 else "cobs"]
+
+    captured = replay_benchmark(path, transcoder)
+    fixed = replay_benchmark(path, transcoder, chunk_size=READ_SIZE)
+
+    print(f"{path}: {captured.bytes_read} bytes, {captured.results} frames, {transcoder.__name__}")
+    print(f"{'reads':<16}{'frames/s':>14}{'MB/s':>14}{'errors':>10}")
+    print(_row("as captured", captured))
+    print(_row(f"{READ_SIZE} bytes", fixed))
+
+
+if __name__ == "__main__":
+    main()
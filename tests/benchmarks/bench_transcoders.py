@@ -0,0 +1,81 @@
+"""
+throughput of the serial receive path for the built-in transcoders.
+
+frames are pushed through `SerialService._on_data` in fixed size reads,
+the way a port would deliver them, no hardware required.
+
+    PYTHONPATH=src:tests python tests/benchmarks/bench_transcoders.py
+"""
+
+import os
+import time
+from collections.abc import Iterator
+
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, RawTranscoder
+from pyside_app_core.services.serial_service.types import TranscoderInterface
+
+from helpers import Payload
+
+FRAME_COUNT = 20_000
+PAYLOAD_SIZE = 64
+READ_SIZE = 512
+
+
+class _StubPort:
+    def __init__(self, reads: list[bytes]):
+        self._reads: Iterator[bytes] = iter(reads)
+
+    def readAll(self) -> bytes:
+        return next(self._reads)
+
+
+def _payload(transcoder: type[TranscoderInterface]) -> bytes:
+    data = os.urandom(PAYLOAD_SIZE)
+    if transcoder is RawTranscoder:
+        # text protocol, keep separators out of the payload
+        data = data.replace(b"\r", b"r").replace(b"\n", b"n")
+    return data
+
+
+def bench_encode(transcoder: type[RawTranscoder]) -> float:
+    msg = Payload(_payload(transcoder))
+
+    start = time.perf_counter()
+    for _ in range(FRAME_COUNT):
+        transcoder.encode(msg)
+    return time.perf_counter() - start
+
+
+def bench_receive(transcoder: type[RawTranscoder]) -> tuple[float, int]:
+    sep = b"" if transcoder is CobsTranscoder else transcoder.SEP
+    stream = b"".join(transcoder.encode(Payload(_payload(transcoder))) + sep for _ in range(FRAME_COUNT))
+    reads = [stream[i : i + READ_SIZE] for i in range(0, len(stream), READ_SIZE)]
+
+    svc = SerialService(transcoder=transcoder)
+    svc.DEBUG = False
+    svc._com = _StubPort(reads)  # type: ignore[assignment]
+
+    start = time.perf_counter()
+    for _ in reads:
+        svc._on_data()
+    return time.perf_counter() - start, len(stream)
+
+
+def main() -> None:
+    print(f"{FRAME_COUNT} frames, {PAYLOAD_SIZE} byte payload, {READ_SIZE} byte reads")
+    print(f"{'transcoder':<16}{'encode fr/s':>14}{'receive fr/s':>14}{'receive MB/s':>14}")
+
+    for transcoder in (RawTranscoder, CobsTranscoder):
+        encode_s = bench_encode(transcoder)
+        receive_s, size = bench_receive(transcoder)
+        print(
+            f"{transcoder.__name__:<16}"
+            f"{FRAME_COUNT / encode_s:>14,.0f}"
+            f"{FRAME_COUNT / receive_s:>14,.0f}"
+            f"{size / receive_s / 1e6:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+end to end receive throughput of `SerialService` over a `VirtualSerialPort`.
+
+frames are injected on the device side and delivered through the event loop
+in different read patterns, the way a USB serial adapter might split them.
+
+    PYTHONPATH=src QT_QPA_PLATFORM=offscreen python tests/benchmarks/bench_virtual_port.py
+"""
+
+import os
+import time
+from collections.abc import Sequence
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder
+from pyside_app_core.services.serial_service.types import Decodable
+from pyside_app_core.services.serial_service.virtual_port import VirtualSerialPort
+
+FRAME_COUNT = 20_000
+PAYLOAD_SIZE = 64
+
+PATTERNS: dict[str, Sequence[int] | None] = {
+    "one read": None,
+    "4096 bytes": [4096],
+    "512 bytes": [512],
+    "64 bytes": [64],
+    "mixed": [1, 63, 7, 200, 33],
+}
+
+
+def bench_receive(fragments: Sequence[int] | None, *, threaded: bool) -> float:
+    stream = b"".join(CobsTranscoder.frame(os.urandom(PAYLOAD_SIZE)) for _ in range(FRAME_COUNT))
+
+    svc = SerialService(transcoder=CobsTranscoder, threaded=threaded)
+    svc.DEBUG = False
+    port = VirtualSerialPort(fragments=fragments)
+
+    loop = QEventLoop()
+    received = 0
+
+    def _on_result(_: Decodable) -> None:
+        nonlocal received
+        received += 1
+        if received == FRAME_COUNT:
+            loop.quit()
+
+    svc.com_data.connect(_on_result)
+    svc.open_connection(port)
+
+    start = time.perf_counter()
+    # the port lives in the worker thread when threaded, inject from there
+    QTimer.singleShot(0, port, lambda: port.inject(stream))
+    loop.exec()
+    elapsed = time.perf_counter() - start
+
+    svc.close_connection()
+    svc.deleteLater()
+    return elapsed
+
+
+def main() -> None:
+    app = QCoreApplication([])
+
+    print(f"{FRAME_COUNT} frames, {PAYLOAD_SIZE} byte payload, CobsTranscoder")
+    print(f"{'reads':<16}{'fr/s':>14}{'threaded fr/s':>16}")
+
+    for label, fragments in PATTERNS.items():
+        direct = bench_receive(fragments, threaded=False)
+        threaded = bench_receive(fragments, threaded=True)
+        print(f"{label:<16}{FRAME_COUNT / direct:>14,.0f}{FRAME_COUNT / threaded:>16,.0f}")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""shared by the unit tests and benchmarks, `tests` is on the path for both"""
+
+from pyside_app_core.services.serial_service.transcoder import Message
+
+
+class Payload(Message):
+    """a message that encodes to the given bytes"""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def encode(self) -> bytes:
+        return self._data
@@ -0,0 +1,87 @@
+from typing import cast
+
+from PySide6.QtSerialPort import QSerialPort
+
+from pyside_app_core.services.serial_service.baud_probe import probe_baud_rate
+from pyside_app_core.services.serial_service.port import SerialPortConfig, configure_serial_port
+
+
+class _EchoPort:
+    """echoes writes back, mangled above `max_baud`, delivered in small reads"""
+
+    def __init__(self, max_baud: int, rejected: tuple[int, ...] = ()):
+        self._max_baud = max_baud
+        self._rejected = rejected
+        self._baud = 115200
+        self._pending = b""
+        self.tried: list[int] = []
+
+    def baudRate(self) -> int:
+        return self._baud
+
+    def setBaudRate(self, baud: int) -> bool:
+        self.tried.append(baud)
+        if baud in self._rejected:
+            return False
+        self._baud = baud
+        return True
+
+    def clear(self) -> bool:
+        self._pending = b""
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._pending += data if self._baud <= self._max_baud else data[::-1]
+        return len(data)
+
+    def waitForReadyRead(self, _msecs: int) -> bool:
+        return bool(self._pending)
+
+    def readAll(self) -> bytes:
+        data, self._pending = self._pending[:50], self._pending[50:]
+        return data
+
+
+def test_probe_baud_rate() -> None:
+    port = _EchoPort(max_baud=230400)
+
+    result = probe_baud_rate(cast(QSerialPort, port), (9600, 921600, 230400, 460800))
+
+    assert result == 230400
+    assert port.tried == [921600, 460800, 230400]
+    assert port.baudRate() == 230400
+
+
+def test_probe_baud_rate_rejected() -> None:
+    # the loopback would pass at the 115200 the port is still at
+    port = _EchoPort(max_baud=115200, rejected=(460800,))
+
+    result = probe_baud_rate(cast(QSerialPort, port), (460800, 115200))
+
+    assert result == 115200
+    assert port.tried == [460800, 115200]
+
+
+def test_probe_baud_rate_fails() -> None:
+    port = _EchoPort(max_baud=0)
+
+    assert probe_baud_rate(cast(QSerialPort, port), (9600, 19200)) is None
+    assert port.baudRate() == 115200
+
+
+def test_configure_serial_port() -> None:
+    com = QSerialPort()
+    config = SerialPortConfig(
+        baud_rate=1_000_000,
+        parity=QSerialPort.Parity.EvenParity,
+        flow_control=QSerialPort.FlowControl.HardwareControl,
+        read_buffer_size=4096,
+    )
+
+    configure_serial_port(com, config)
+
+    assert com.baudRate() == 1_000_000
+    assert com.dataBits() == QSerialPort.DataBits.Data8
+    assert com.parity() == QSerialPort.Parity.EvenParity
+    assert com.flowControl() == QSerialPort.FlowControl.HardwareControl
+    assert com.readBufferSize() == 4096
@@ -0,0 +1,126 @@
+from pathlib import Path
+from typing import cast
+
+import pytest
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.errors.serial_errors import SerialCaptureError
+from pyside_app_core.services.serial_service.capture import (
+    CaptureDirection,
+    CaptureRecord,
+    CaptureRecorder,
+    read_capture,
+)
+from pyside_app_core.services.serial_service.replay import ReplaySerialPort, replay_benchmark
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import Message, RawTranscoder, Result
+from pyside_app_core.services.serial_service.types import Decodable
+
+_MS = 1_000_000
+
+
+class _Text(Message):
+    def __init__(self, text: bytes):
+        self._text = text
+
+    def encode(self) -> bytes:
+        return self._text
+
+
+def _inbound(*reads: bytes, step_ms: int = 0) -> list[CaptureRecord]:
+    return [CaptureRecord(i * step_ms * _MS, CaptureDirection.INBOUND, r) for i, r in enumerate(reads)]
+
+
+def test_capture_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "session.cap"
+
+    with CaptureRecorder(path) as recorder:
+        recorder.record(CaptureDirection.OUTBOUND, b"ping\r\n")
+        recorder.record(CaptureDirection.INBOUND, b"po")
+        recorder.record(CaptureDirection.INBOUND, b"")
+
+    # a later session appends
+    with CaptureRecorder(path) as recorder:
+        recorder.record(CaptureDirection.INBOUND, b"ng\r\n")
+
+    # cut short mid record, eg. by a crash
+    with path.open("ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    records = list(read_capture(path))
+    assert [(r.direction, r.data) for r in records] == [
+        (CaptureDirection.OUTBOUND, b"ping\r\n"),
+        (CaptureDirection.INBOUND, b"po"),
+        (CaptureDirection.INBOUND, b"ng\r\n"),
+    ]
+    assert records[0].timestamp_ns <= records[1].timestamp_ns <= records[2].timestamp_ns
+
+
+def test_capture_bad_file(tmp_path: Path, mocker: MockerFixture) -> None:
+    path = tmp_path / "not_a.cap"
+    path.write_bytes(b"hello world")
+
+    with pytest.raises(SerialCaptureError):
+        list(read_capture(path))
+    open_spy = mocker.spy(Path, "open")
+    with pytest.raises(SerialCaptureError):
+        CaptureRecorder(path)
+    assert all(f.closed for f in open_spy.spy_return_list)
+
+
+def test_replay_benchmark() -> None:
+    records = _inbound(b"a\r\nb", b"\r\nc\r", b"\n")
+    records.append(CaptureRecord(0, CaptureDirection.OUTBOUND, b"x\r\n"))
+
+    stats = replay_benchmark(records, RawTranscoder)
+    assert (stats.bytes_read, stats.results, stats.errors) == (9, 3, 0)
+
+    stats = replay_benchmark(records, RawTranscoder, chunk_size=1)
+    assert (stats.bytes_read, stats.results) == (9, 3)
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_serial_service_replay(qtbot: QtBot, tmp_path: Path, threaded: bool) -> None:
+    frames = [f"frame {i}".encode() for i in range(500)]
+    stream = b"".join(f + b"\r\n" for f in frames)
+    reads = [stream[i : i + 7] for i in range(0, len(stream), 7)]
+
+    svc = SerialService(transcoder=RawTranscoder, threaded=threaded)
+    svc.DEBUG = False
+    received: list[Decodable] = []
+    svc.com_data.connect(received.append)
+
+    port = ReplaySerialPort(_inbound(*reads), speed=None, chunk_size=64)
+    recorder = CaptureRecorder(tmp_path / "replayed.cap")
+    svc.set_recorder(recorder)
+
+    assert svc.open_connection(port)
+    assert svc.send_data(_Text(b"hello\r\n"))
+
+    qtbot.waitUntil(lambda: len(received) == len(frames))
+    assert [cast(Result, r)._raw_data for r in received] == frames
+
+    svc.close_connection()
+    svc.deleteLater()
+    recorder.close()
+
+    recorded = list(read_capture(tmp_path / "replayed.cap"))
+    outbound = [r.data for r in recorded if r.direction == CaptureDirection.OUTBOUND]
+    assert outbound == [b"hello\r\n"]
+    assert b"".join(r.data for r in recorded if r.direction == CaptureDirection.INBOUND) == stream
+
+
+def test_replay_timing(qtbot: QtBot) -> None:
+    port = ReplaySerialPort(_inbound(b"a", b"b", b"c", step_ms=200), speed=4.0)
+    received = bytearray()
+    port.readyRead.connect(lambda: received.extend(bytes(port.readAll())))
+
+    port.open(ReplaySerialPort.OpenModeFlag.ReadWrite)
+    assert received == b""
+
+    # 400ms of capture at 4x
+    with qtbot.waitSignal(port.replay_finished, timeout=1000):
+        pass
+    assert received == b"abc"
+    assert port.is_finished
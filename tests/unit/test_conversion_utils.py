@@ -1,10 +1,20 @@
 import math
+import struct
 
 import pytest
 
+from pyside_app_core.errors.encode_errors import DecodingError
 from pyside_app_core.services.serial_service.conversion_utils import (
+    cobs_decode,
+    cobs_encode,
+    decode_float_array_from,
     decode_float_list,
+    decode_float_list_from,
     encode_float_list,
+    encode_float_list_into,
+    encoded_float_list_size,
+    float_list_struct,
+    float_list_view,
 )
 from pyside_app_core.types.numeric import FloatPrecision
 
@@ -56,3 +66,75 @@ def test_decode_float_list(encoded: bytes, precision: FloatPrecision, expected:
 
     for original, decoded in zip(expected, result, strict=False):
         assert original == pytest.approx(decoded)
+
+
+@pytest.mark.parametrize(
+    ("raw", "encoded"),
+    [
+        (b"", b"\x01"),
+        (b"\x00", b"\x01\x01"),
+        (b"\x00\x00", b"\x01\x01\x01"),
+        (b"\x11\x22\x00\x33", b"\x03\x11\x22\x02\x33"),
+        (b"\x11\x00\x00\x00", b"\x02\x11\x01\x01\x01"),
+        (bytes(range(1, 255)), b"\xff" + bytes(range(1, 255))),
+        (bytes(range(255)), b"\x01\xff" + bytes(range(1, 255))),
+        (bytes(range(1, 256)), b"\xff" + bytes(range(1, 255)) + b"\x02\xff"),
+        (bytes(range(2, 256)) + b"\x00", b"\xff" + bytes(range(2, 256)) + b"\x01\x01"),
+    ],
+)
+def test_cobs_round_trip(raw: bytes, encoded: bytes) -> None:
+    assert cobs_encode(raw) == encoded
+    assert cobs_decode(encoded) == raw
+
+
+@pytest.mark.parametrize("encoded", [b"\x03\x11", b"\x02\x00", b"\x05\x11\x22"])
+def test_cobs_decode_invalid(encoded: bytes) -> None:
+    with pytest.raises(DecodingError):
+        cobs_decode(encoded)
+
+
+def test_float_list_struct_cached() -> None:
+    assert float_list_struct(3, "single") is float_list_struct(3, "single")
+    assert float_list_struct(3, "single") is not float_list_struct(3, "double")
+    assert float_list_struct(3, "single").format == "<3f"
+
+
+def test_encode_float_list_into() -> None:
+    floats = [1.1, 1.2, 1.3]
+    size = encoded_float_list_size(len(floats), "single")
+    buffer = bytearray(b"\xff" * (size + 2))
+
+    written = encode_float_list_into(buffer, 1, floats, "single")
+
+    assert written == size
+    assert buffer[1 : 1 + size] == encode_float_list(floats, "single")
+    assert buffer[0] == buffer[-1] == 0xFF
+
+
+def test_decode_float_list_wrong_size() -> None:
+    with pytest.raises(struct.error):
+        decode_float_list(b"\x03\x00\xcd\xcc\x8c?\x9a\x99\x99?", "single")
+
+
+@pytest.mark.parametrize("precision", ["single", "double"])
+def test_decode_float_list_streaming(precision: FloatPrecision) -> None:
+    first = encode_float_list([1.5, -2.0, 3.25], precision)
+    second = encode_float_list([4.0], precision)
+    stream = memoryview(b"\xff" + first + second + b"\xff")
+
+    floats, consumed = decode_float_list_from(stream, 1, precision)
+    assert floats == [1.5, -2.0, 3.25]
+    assert consumed == len(first)
+
+    values, consumed = decode_float_array_from(stream, 1 + len(first), precision)
+    assert values.tolist() == [4.0]
+    assert values.typecode == ("f" if precision == "single" else "d")
+    assert consumed == len(second)
+
+    view, consumed = float_list_view(stream, 1, precision)
+    assert view.tolist() == [1.5, -2.0, 3.25]
+    assert view.obj is stream.obj
+    assert consumed == len(first)
+
+    with pytest.raises(struct.error):
+        decode_float_list_from(stream[:-2], 1 + len(first), precision)
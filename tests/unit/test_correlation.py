@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.errors.serial_errors import SerialRequestError, SerialRequestTimeoutError
+from pyside_app_core.services.serial_service.correlation import RequestTracker
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import Message, RawTranscoder, Result
+
+
+class _Ping(Message):
+    def __init__(self) -> None:
+        self.request_id = 0
+
+    def encode(self) -> bytes:
+        return f"ping:{self.request_id}".encode()
+
+
+class _Pong(Result):
+    def __init__(self, request_id: int | None):
+        super().__init__(b"pong")
+        self.request_id = request_id
+
+
+@pytest.fixture
+def service(mocker: MockerFixture) -> SerialService:
+    svc = SerialService(transcoder=RawTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.write.side_effect = len
+    return svc
+
+
+def test_request_tracker_pipelined(qtbot: QtBot, service: SerialService) -> None:
+    tracker = RequestTracker(service)
+
+    first = tracker.request(_Ping())
+    second = tracker.request(_Ping())
+    assert tracker.in_flight == 2
+
+    done: list[object] = []
+    first.add_done_callback(lambda f: done.append(f.result()))
+
+    # replies can come back out of order, unsolicited data is ignored
+    reply_2, reply_1 = _Pong(2), _Pong(1)
+    service.com_data.emit(_Pong(None))
+    service.com_data.emit(reply_2)
+    service.com_data.emit(reply_1)
+
+    assert second.result(timeout=0) is reply_2
+    assert first.result(timeout=0) is reply_1
+    assert done == [reply_1]
+    assert tracker.in_flight == 0
+
+
+def test_request_tracker_timeout_and_cancel(qtbot: QtBot, service: SerialService) -> None:
+    tracker = RequestTracker(service, timeout_ms=10)
+
+    timed_out = tracker.request(_Ping())
+    qtbot.waitUntil(timed_out.done)
+    assert isinstance(timed_out.exception(), SerialRequestTimeoutError)
+
+    pending = tracker.request(_Ping(), timeout_ms=10_000)
+    service.close_connection()
+    assert isinstance(pending.exception(timeout=0), SerialRequestError)
+    assert tracker.in_flight == 0
+
+    not_sent = tracker.request(_Ping())
+    assert isinstance(not_sent.exception(timeout=0), SerialRequestError)
+
+
+def test_request_tracker_async(qtbot: QtBot, service: SerialService) -> None:
+    tracker = RequestTracker(service)
+    reply = _Pong(1)
+
+    async def _round_trip() -> object:
+        task = asyncio.ensure_future(tracker.request_async(_Ping()))
+        await asyncio.sleep(0)
+        service.com_data.emit(reply)
+        return await task
+
+    assert asyncio.run(_round_trip()) is reply
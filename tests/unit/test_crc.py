@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from pyside_app_core.errors.encode_errors import ChecksumError
+from pyside_app_core.services.serial_service.crc import (
+    CRC8_SMBUS,
+    CRC16_CCITT_FALSE,
+    CRC16_MODBUS,
+    CRC16_XMODEM,
+    CRC32,
+    CRC32C,
+    Crc,
+    CrcFraming,
+    with_crc,
+)
+from pyside_app_core.services.serial_service.metrics import LinkCounters
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, Result
+from pyside_app_core.services.serial_service.types import Decodable
+
+
+@pytest.mark.parametrize(
+    ("crc", "check"),
+    [
+        (CRC8_SMBUS, 0xF4),
+        (CRC16_CCITT_FALSE, 0x29B1),
+        (CRC16_XMODEM, 0x31C3),
+        (CRC16_MODBUS, 0x4B37),
+        (CRC32, 0xCBF43926),
+        (CRC32C, 0xE3069283),
+    ],
+)
+def test_crc_check_values(crc: Crc, check: int) -> None:
+    assert crc(b"123456789") == check
+    assert crc.table_crc()(b"123456789") == check
+
+    data = os.urandom(300)
+    assert crc(memoryview(data)) == crc.table_crc()(data)
+
+
+class _Transcoder(CrcFraming, CobsTranscoder):
+    CRC = CRC32
+
+
+def test_crc_framing() -> None:
+    frame = _Transcoder.frame(b"\x00payload")
+    assert frame.endswith(b"\x00")
+    assert CobsTranscoder.unframe(frame[:-1])[-4:] == CRC32(b"\x00payload").to_bytes(4, "little")
+    assert _Transcoder.unframe(frame[:-1]) == b"\x00payload"
+
+    wrapped = with_crc(CobsTranscoder, CRC16_MODBUS)
+    assert wrapped.__name__ == "CrcCobsTranscoder"
+    assert len(wrapped.frame(b"abc")) == len(CobsTranscoder.frame(b"abc")) + 2
+
+    corrupted = bytearray(frame[:-1])
+    corrupted[3] ^= 0x10
+    with pytest.raises(ChecksumError):
+        _Transcoder.unframe(corrupted)
+    with pytest.raises(ChecksumError, match="shorter"):
+        _Transcoder.unframe(bytearray(CobsTranscoder.frame(b"ab")[:-1]))
+
+
+def test_crc_rejected_frames() -> None:
+    results: list[Decodable] = []
+    errors: list[Exception] = []
+    counters = LinkCounters()
+    receiver = FrameReceiver(_Transcoder, results.append, errors.append, counters=counters)
+
+    frames = [_Transcoder.frame(f"frame {i}".encode()) for i in range(3)]
+    bad = bytearray(frames[1])
+    bad[2] ^= 0xFF
+
+    receiver.feed(frames[0] + bad + frames[2])
+    assert [str(r) for r in results] == ["<Result>(b'frame 0')", "<Result>(b'frame 2')"]
+    assert isinstance(results[0], Result)
+    assert [type(e) for e in errors] == [ChecksumError]
+    assert counters.rejected_frames == counters.decode_errors == 1
@@ -1,6 +1,11 @@
+import struct
+from itertools import chain
+
 import pytest
 
-from pyside_app_core.services.serial_service.float_map import FloatMap
+from pyside_app_core.errors.encode_errors import DecodingError, DeltaSequenceError
+from pyside_app_core.services.serial_service import float_map
+from pyside_app_core.services.serial_service.float_map import CompactFloatMap, FloatMap
 
 
 def test_float_map__init() -> None:
@@ -88,3 +93,182 @@ def test_float_map__pack(data: dict[int, float], expected: bytes) -> None:
 def test_float_map__unpack(raw: bytes, expected: dict[int, float]) -> None:
     result = FloatMap[int].unpack(raw)
     assert result == expected
+
+
+@pytest.fixture(params=["struct", "numpy"])
+def pack_path(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(float_map, "_NUMPY_MIN_ITEMS", 1)
+    else:
+        monkeypatch.setattr(float_map, "np", None)
+    return str(request.param)
+
+
+def test_float_map__pack_paths_round_trip(pack_path: str) -> None:
+    data = {k: k * 1.1 for k in range(0, 2000, 3)}
+
+    raw = FloatMap[int](data).pack()
+    assert len(raw) == 2 + 6 * len(data)
+    assert raw == bytearray(struct.pack(FloatMap.pack_format(len(data)), len(data), *chain(*data.items())))
+
+    result = FloatMap[int].unpack(raw)
+    assert list(result.keys()) == list(data.keys())
+    single = struct.Struct("<f")
+    assert all(result[k] == round(single.unpack(single.pack(v))[0], 6) for k, v in data.items())
+
+
+def test_float_map__unpack_rounds_single_precision(pack_path: str) -> None:
+    result = FloatMap[int].unpack(b"\x01\x00\x07\x00\xcd\xcc\x8c?")
+    assert result[7] == 1.1
+
+
+def test_float_map__unpack_short_buffer(pack_path: str) -> None:
+    with pytest.raises(struct.error):
+        FloatMap[int].unpack(b"\x02\x00\x07\x00\xcd\xcc\x8c?")
+
+
+def test_float_map__pairs_struct_cached() -> None:
+    assert FloatMap.pairs_struct(3) is FloatMap.pairs_struct(3)
+    assert FloatMap.pairs_struct(2).format == FloatMap.pack_format(2).replace("<H", "<", 1)
+
+
+def test_compact_float_map__mapping() -> None:
+    fm = CompactFloatMap[int]({3: 3.0, 1: 1.1, 2: 2.0})
+
+    assert list(fm) == [1, 2, 3]
+    assert fm[1] == 1.1
+    assert len(fm) == 3
+    assert 2 in fm
+    assert 99 not in fm
+    assert "a" not in fm
+    assert fm == {1: 1.1, 2: 2.0, 3: 3.0}
+    assert isinstance(fm, FloatMap)
+    assert not hasattr(fm, "__dict__")
+
+    with pytest.raises(KeyError):
+        _ = fm[99]
+
+    with pytest.raises(ValueError) as ee:
+        CompactFloatMap({})
+    assert str(ee.value) == "can't create an empty CompactFloatMap"
+
+    with pytest.raises(ValueError) as ke:
+        CompactFloatMap({70000: 1.0})
+    assert str(ke.value) == 'key: "70000" does not fit in 2 bytes'
+
+
+def test_compact_float_map__wire_format() -> None:
+    data = {k: k * 1.1 for k in range(0, 2000, 3)}
+
+    raw = CompactFloatMap[int](data).pack()
+    assert raw == FloatMap[int](data).pack()
+    assert bytes(CompactFloatMap[int](data)) == raw
+
+    result = CompactFloatMap[int].unpack(raw)
+    assert isinstance(result, CompactFloatMap)
+    assert result == FloatMap[int].unpack(raw)
+
+    with pytest.raises(struct.error):
+        CompactFloatMap[int].unpack(raw[:-1])
+
+
+def test_compact_float_map__unpack_unsorted() -> None:
+    raw = FloatMap[int]({5: 5.0, 1: 1.0, 3: 3.0}).pack()
+
+    result = CompactFloatMap[int].unpack(raw)
+    assert list(result.items()) == [(1, 1.0), (3, 3.0), (5, 5.0)]
+
+
+@pytest.mark.parametrize("cls", [FloatMap, CompactFloatMap])
+def test_float_map__eq(cls: type[FloatMap[int]]) -> None:
+    fm = cls({1: 0.0, 2: 2.0})
+
+    assert fm == {1: 0.0, 2: 2.0}
+    assert fm == cls({2: 2.0000001, 1: 0.0})
+    assert fm != {1: 5.0, 2: 2.0}  # zero values are compared too
+    assert fm != {1: 0.0, 3: 2.0}
+    assert fm != {1: 0.0}
+    assert fm != {1: 0.0, 2: 2.0, 3: 3.0}
+    assert fm != [1, 2]
+
+
+@pytest.mark.parametrize("cls", [FloatMap, CompactFloatMap])
+def test_float_map__diff(cls: type[FloatMap[int]], pack_path: str) -> None:
+    previous = {k: k * 1.5 for k in range(100)}
+    current = {**previous, 0: 1.0, 50: 0.0, 99: 99 * 1.5 + 1e-9, 100: 7.0}
+    del current[10]
+
+    delta = cls(current).diff(cls(previous))
+    assert delta == {0: 1.0, 50: 0.0, 100: 7.0}
+    assert cls(current).diff(previous) == delta
+    assert cls(previous).diff(cls(previous)) == {}
+    assert cls(previous).diff(cls({**previous, 5: 0.0})) == {5: 7.5}
+
+
+@pytest.mark.parametrize("cls", [FloatMap, CompactFloatMap])
+def test_float_map__delta_round_trip(cls: type[FloatMap[int]], pack_path: str) -> None:
+    base = cls({k: k * 1.5 for k in range(2000)})
+    current = cls({**base, 3: 0.0, 1999: -1.0, 2000: 2.0})
+
+    raw = current.pack_delta(base, base_seq=7, seq=8)
+    assert len(raw) == 5 + 2 + 2 + 3 * 6
+    assert raw[:7] == b"\x01\x07\x00\x08\x00\x00\x00"
+
+    result, seq = cls.unpack_delta(raw, base, base_seq=7)
+    assert seq == 8
+    assert result == current
+    assert isinstance(result, cls)
+
+
+def test_float_map__delta_unchanged() -> None:
+    base = FloatMap[int]({1: 1.0})
+
+    raw = base.pack_delta(base, base_seq=1, seq=2)
+    assert raw == b"\x01\x01\x00\x02\x00\x00\x00\x00\x00"
+    assert FloatMap[int].unpack_delta(raw, base, base_seq=1) == (base, 2)
+
+
+@pytest.mark.parametrize("cls", [FloatMap, CompactFloatMap])
+def test_float_map__delta_small_changes_and_removals(cls: type[FloatMap[int]], pack_path: str) -> None:
+    sender = cls({1: 1.0, 2: 2.0, 3: 3.0})
+    receiver: FloatMap[int] = sender
+    seq = 0
+
+    # changes below the diff tolerance still reach the receiver, they would add up otherwise
+    for step in range(1, 4):
+        current = cls({1: 1.0 + step * 5e-7, 2: 2.0, 3: 3.0})
+        receiver, seq = cls.unpack_delta(current.pack_delta(sender, seq, seq + 1), receiver, seq)
+        sender = current
+    # within the wire precision of the sender, not left at 1.0
+    assert receiver[1] != 1.0
+    assert receiver[1] == pytest.approx(sender[1], abs=1e-6)
+
+    current = cls({1: receiver[1], 3: 3.0, 4: 4.0})
+    receiver, seq = cls.unpack_delta(current.pack_delta(sender, seq, seq + 1), receiver, seq)
+    assert sorted(receiver) == [1, 3, 4]
+    assert seq == 4
+
+
+def test_float_map__delta_sequence_wraps() -> None:
+    base = FloatMap[int]({1: 1.0})
+    raw = FloatMap[int]({1: 2.0}).pack_delta(base, base_seq=65535, seq=65536)
+    assert raw[1:5] == b"\xff\xff\x00\x00"
+
+    result, seq = FloatMap[int].unpack_delta(raw, base, base_seq=65535)
+    assert (result, seq) == ({1: 2.0}, 0)
+    assert FloatMap[int].unpack_delta(raw, base, base_seq=-1)[1] == 0
+
+
+def test_float_map__delta_rejected() -> None:
+    base = FloatMap[int]({1: 1.0})
+    raw = FloatMap[int]({1: 2.0}).pack_delta(base, base_seq=1, seq=2)
+
+    with pytest.raises(DeltaSequenceError):
+        FloatMap[int].unpack_delta(raw, base, base_seq=3)
+
+    with pytest.raises(DecodingError):
+        FloatMap[int].unpack_delta(b"\x09" + raw[1:], base, base_seq=1)
+
+    with pytest.raises(struct.error):
+        FloatMap[int].unpack_delta(raw[:-1], base, base_seq=1)
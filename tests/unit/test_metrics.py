@@ -0,0 +1,108 @@
+import itertools
+import time
+
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.services.serial_service.metrics import Histogram, LinkCounters, SerialMetricsSnapshot
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, RawTranscoder, Result
+from pyside_app_core.services.serial_service.types import Decodable
+from pyside_app_core.services.serial_service.virtual_port import VirtualSerialPort
+
+from helpers import Payload
+
+
+def test_histogram() -> None:
+    hist = Histogram()
+    assert hist.percentile(50) == 0
+
+    for value in (1, 2, 3, 100, 1000):
+        hist.add(value)
+
+    assert (hist.count, hist.total, hist.max) == (5, 1106, 1000)
+    assert hist.percentile(50) == 3
+    assert hist.percentile(80) == 127
+    assert hist.percentile(100) == 1000
+
+    copy = hist.copy()
+    hist.add(5)
+    assert copy.count == 5
+
+
+def test_receiver_counters() -> None:
+    counters = LinkCounters()
+    receiver = FrameReceiver(
+        RawTranscoder, on_result=lambda _: None, on_error=lambda _: None, capacity=8, counters=counters
+    )
+
+    receiver.feed(b"ab\r\ncd\r")
+    receiver.feed(b"\n0123456789\r\nef\r\n")
+
+    assert counters.bytes_in == 24
+    assert counters.frames == 3
+    assert counters.dropped_frames == 1
+    assert counters.buffer_high_water == 8
+
+
+def test_receiver_counters_per_frame(mocker: MockerFixture) -> None:
+    class _Transcoder(RawTranscoder):
+        @classmethod
+        def decode(cls, raw: bytearray) -> Result:
+            if bytes(raw) == b"bad":
+                raise ValueError("bad frame")
+            if bytes(raw) == b"0123456789":
+                # a slow frame, 10us
+                for _ in range(9):
+                    time.perf_counter_ns()
+            return super().decode(raw)
+
+    # every call to the clock is 1us on, the result handler reads it 5 times
+    clock = mocker.patch("pyside_app_core.services.serial_service.receiver.time.perf_counter_ns")
+    clock.side_effect = itertools.count(0, 1000)
+
+    def _on_result(_: Decodable) -> None:
+        for _ in range(5):
+            time.perf_counter_ns()
+
+    counters = LinkCounters()
+    receiver = FrameReceiver(_Transcoder, on_result=_on_result, on_error=lambda _: None, counters=counters)
+    receiver.feed(b"a\r\nbad\r\n0123456789\r\n")
+
+    # the failed decode isn't a frame, the sizes are of each frame, not the first
+    assert counters.frames == 2
+    assert counters.decode_errors == 1
+    assert counters.frame_size.count == 2
+    assert counters.frame_size.max == 10
+    assert counters.frame_size.total == 11
+    # a sample per frame, covering the decode only
+    assert counters.decode_ns.count == counters.frames
+    assert counters.decode_ns.max == 10_000
+    assert counters.decode_ns.total == 11_000
+
+
+def test_serial_service_metrics(qtbot: QtBot) -> None:
+    svc = SerialService(transcoder=CobsTranscoder, metrics_interval_ms=20)
+    svc.DEBUG = False
+    snapshots: list[SerialMetricsSnapshot] = []
+    svc.com_metrics.connect(snapshots.append)
+
+    assert svc.open_connection(VirtualSerialPort(fragments=[16]))
+    for _ in range(50):
+        svc.send_data(Payload(bytes(range(1, 31))))
+
+    qtbot.waitUntil(lambda: bool(snapshots) and snapshots[-1].frames == 50)
+
+    metrics = svc.metrics.snapshot()
+    assert metrics.frames == 50
+    assert metrics.bytes_out == metrics.bytes_in == 50 * 32
+    assert metrics.decode_errors == metrics.dropped_frames == 0
+    assert metrics.frame_size.max == 31
+    assert metrics.decode_ns.count > 0
+    assert metrics.frames_per_second > 0
+    assert metrics.write_high_water > 0
+
+    svc.close_connection()
+    assert not svc.metrics.is_running
+    svc.deleteLater()
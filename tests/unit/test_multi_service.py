@@ -0,0 +1,56 @@
+from collections.abc import Iterator
+
+import pytest
+from PySide6.QtSerialPort import QSerialPortInfo
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.services.serial_service.multi_service import MultiSerialService, PortStats
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import RawTranscoder, Result
+
+
+@pytest.fixture
+def multi(qtbot: QtBot) -> Iterator[MultiSerialService]:
+    service = MultiSerialService(thread_count=2)
+    yield service
+    service.stop()
+
+
+def test_multi_serial_service_open_failure(multi: MultiSerialService) -> None:
+    assert not multi.open_connection(QSerialPortInfo("ttyDOESNOTEXIST"), RawTranscoder)
+    assert multi.ports == []
+
+
+def test_multi_serial_service_fan_in(multi: MultiSerialService, mocker: MockerFixture) -> None:
+    def _open(svc: SerialService, *_: object) -> bool:
+        svc._com = mocker.MagicMock()
+        return True
+
+    mocker.patch.object(SerialService, "open_connection", autospec=True, side_effect=_open)
+
+    received: list[tuple[str, object]] = []
+    multi.port_data.connect(lambda port, result: received.append((port, result)))
+
+    for name in ("ttyA", "ttyB", "ttyC"):
+        port_info = mocker.MagicMock(spec=QSerialPortInfo)
+        port_info.portName.return_value = name
+        assert multi.open_connection(port_info, RawTranscoder)
+    assert multi.ports == ["ttyA", "ttyB", "ttyC"]
+    assert len(set(multi._service_threads.values())) == 2
+
+    svc_b = multi.service("ttyB")
+    assert svc_b is not None
+    result = Result(b"b")
+    svc_b.com_data.emit(result)
+    svc_b.com_error.emit(ValueError("bad frame"))
+
+    assert received == [("ttyB", result)]
+    assert multi.stats()["ttyB"] == PortStats(results=1, errors=1)
+    assert multi.total_stats() == PortStats(results=1, errors=1)
+
+    disconnected: list[str] = []
+    multi.port_disconnect.connect(disconnected.append)
+    multi.close_connection("ttyB")
+    assert disconnected == ["ttyB"]
+    assert multi.ports == ["ttyA", "ttyC"]
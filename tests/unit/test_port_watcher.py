@@ -0,0 +1,149 @@
+import os
+from pathlib import Path
+
+import shiboken6
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+from PySide6.QtGui import QStandardItemModel
+from PySide6.QtSerialPort import QSerialPortInfo
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.services.serial_service.port_watcher import PortWatcher, sysfs_tty_signature
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.ui.widgets.connection_manager import ConnectionManager
+
+
+class _FakePort:
+    def __init__(self, name: str, serial: str = ""):
+        self._name = name
+        self._serial = serial
+
+    def __repr__(self) -> str:
+        return f"<port {self._name}>"
+
+    def portName(self) -> str:
+        return self._name
+
+    def systemLocation(self) -> str:
+        return f"/dev/{self._name}"
+
+    def serialNumber(self) -> str:
+        return self._serial
+
+    def manufacturer(self) -> str:
+        return ""
+
+    def productIdentifier(self) -> int:
+        return 0
+
+    def vendorIdentifier(self) -> int:
+        return 0
+
+
+def _plug(root: Path, name: str, device: str) -> None:
+    (root / name).mkdir()
+    os.symlink(device, root / name / "device")
+
+
+def test_sysfs_tty_signature(tmp_path: Path) -> None:
+    assert sysfs_tty_signature(str(tmp_path / "missing")) is None
+
+    _plug(tmp_path, "ttyUSB0", "../../usb1/1-1")
+    (tmp_path / "tty0").mkdir()
+    assert sysfs_tty_signature(str(tmp_path)) == {("ttyUSB0", "../../usb1/1-1")}
+
+
+def test_port_watcher(qtbot: QtBot, tmp_path: Path) -> None:
+    ports = [_FakePort("ttyUSB0", "A")]
+    scans = 0
+
+    def _list_ports() -> list[_FakePort]:
+        nonlocal scans
+        scans += 1
+        return list(ports)
+
+    _plug(tmp_path, "ttyUSB0", "../../usb1/1-1")
+    watcher = PortWatcher(10, list_ports=_list_ports, sysfs_root=str(tmp_path))  # type: ignore[arg-type]
+    added: list[_FakePort] = []
+    removed: list[_FakePort] = []
+    watcher.port_added.connect(added.append)
+    watcher.port_removed.connect(removed.append)
+
+    svc = SerialService()
+    com_ports: list[list[_FakePort]] = []
+    svc.com_ports.connect(com_ports.append)
+
+    svc.set_port_watcher(watcher)
+    qtbot.waitUntil(lambda: watcher.is_ready)
+    assert [p.portName() for p in com_ports[0]] == ["ttyUSB0"]
+    assert added == ports
+
+    # sysfs hasn't changed, nothing is enumerated
+    qtbot.wait(50)
+    assert scans <= 2
+
+    # hot plug, the same adapter on a new path is a new port
+    ports = [_FakePort("ttyUSB1", "A"), _FakePort("ttyACM0", "B")]
+    os.unlink(tmp_path / "ttyUSB0" / "device")
+    _plug(tmp_path, "ttyUSB1", "../../usb1/1-1")
+    _plug(tmp_path, "ttyACM0", "../../usb1/1-2")
+
+    qtbot.waitUntil(lambda: len(com_ports) == 2)
+    assert [p.portName() for p in removed] == ["ttyUSB0"]
+    assert [p.portName() for p in added] == ["ttyUSB0", "ttyUSB1", "ttyACM0"]
+
+    # answered from the cache straight away
+    svc.scan_for_ports()
+    assert [p.portName() for p in com_ports[2]] == ["ttyUSB1", "ttyACM0"]
+
+    svc.set_port_watcher(None)
+    watcher.deleteLater()
+    svc.deleteLater()
+
+
+def test_port_watcher_udev_settle(qtbot: QtBot, tmp_path: Path) -> None:
+    ports: list[_FakePort] = []
+    watcher = PortWatcher(10, list_ports=lambda: list(ports), sysfs_root=str(tmp_path))  # type: ignore[arg-type,return-value]
+    added: list[_FakePort] = []
+    watcher.port_added.connect(added.append)
+    watcher.start()
+    qtbot.waitUntil(lambda: watcher.is_ready)
+
+    # the node appears before udev has read the serial number
+    ports = [_FakePort("ttyUSB0")]
+    _plug(tmp_path, "ttyUSB0", "../../usb1/1-1")
+    qtbot.waitUntil(lambda: len(added) == 1)
+    ports = [_FakePort("ttyUSB0", "A")]
+
+    # picked up without another sysfs change
+    qtbot.waitUntil(lambda: len(added) == 2, timeout=2000)
+    assert [p.serialNumber() for p in watcher.ports] == ["A"]
+
+    watcher.close()
+
+
+def test_port_watcher_destroyed_with_parent(qtbot: QtBot) -> None:
+    parent = QObject()
+    watcher = PortWatcher(10, parent, list_ports=list, sysfs_root=None)
+    watcher.start()
+    qtbot.waitUntil(lambda: watcher.is_ready)
+
+    thread = watcher._thread
+    assert thread is not None
+    assert thread.isRunning()
+
+    # Qt deletes the watcher, its running thread would abort the process
+    shiboken6.delete(parent)
+    assert not shiboken6.isValid(thread)
+
+
+def test_connection_manager_hot_plug(qtbot: QtBot) -> None:
+    manager = ConnectionManager()
+    qtbot.addWidget(manager)
+
+    for names in (["ttyS0"], ["ttyS0", "ttyS1"], ["ttyS1"]):
+        manager.handle_serial_ports([QSerialPortInfo(name) for name in names])
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+    # the models of earlier port lists are deleted
+    assert manager.findChildren(QStandardItemModel) == [manager._port_list.model()]
+    assert manager._port_list.count() == 1
@@ -0,0 +1,97 @@
+import pytest
+from PySide6.QtSerialPort import QSerialPort
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.errors.serial_errors import SerialDisconnectedError, SerialReconnectError
+from pyside_app_core.services.serial_service.reconnect import ReconnectPolicy, ReconnectSupervisor
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import RawTranscoder
+
+
+class _FakePort:
+    def __init__(self, name: str, serial: str = ""):
+        self._name = name
+        self._serial = serial
+
+    def portName(self) -> str:
+        return self._name
+
+    def systemLocation(self) -> str:
+        return f"/dev/{self._name}"
+
+    def serialNumber(self) -> str:
+        return self._serial
+
+
+def _drop(svc: SerialService, mocker: MockerFixture, port: _FakePort) -> None:
+    svc._port_info = port  # type: ignore[assignment]
+    mocker.patch.object(svc, "_com")
+    with pytest.raises(SerialDisconnectedError):
+        svc._on_error(QSerialPort.SerialPortError.ResourceError)
+
+
+def test_reconnect_policy() -> None:
+    policy = ReconnectPolicy(initial_delay_ms=100, max_delay_ms=1000, multiplier=2, jitter=0.5)
+    assert [policy.delay_ms(n, lambda lo, _: lo) for n in range(1, 6)] == [50, 100, 200, 400, 500]
+    assert [policy.delay_ms(n, lambda _, hi: hi) for n in range(1, 6)] == [150, 300, 600, 1200, 1500]
+
+
+def test_reconnect_supervisor(qtbot: QtBot, mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder)
+    available: list[_FakePort] = []
+    supervisor = ReconnectSupervisor(
+        svc,
+        ReconnectPolicy(initial_delay_ms=1, jitter=0),
+        list_ports=lambda: available,  # type: ignore[arg-type,return-value]
+    )
+
+    opened: list[_FakePort] = []
+
+    def _open(port: _FakePort) -> bool:
+        opened.append(port)
+        if len(opened) == 1:
+            return False
+        svc.com_connect.emit(QSerialPort())
+        return True
+
+    mocker.patch.object(svc, "open_connection", side_effect=_open)
+    attempts: list[tuple[int, int]] = []
+    supervisor.reconnecting.connect(lambda n, delay: attempts.append((n, delay)))
+
+    _drop(svc, mocker, _FakePort("ttyUSB0", "A1"))
+    assert supervisor.is_reconnecting
+
+    # gone, then back under a new name, then it opens on the second try
+    qtbot.waitUntil(lambda: len(attempts) >= 2)
+    available.append(_FakePort("ttyUSB0", "B2"))
+    available.append(_FakePort("ttyUSB3", "A1"))
+
+    with qtbot.waitSignal(supervisor.reconnected):
+        pass
+
+    assert [p.portName() for p in opened] == ["ttyUSB3", "ttyUSB3"]
+    assert not supervisor.is_reconnecting
+    assert [delay for _, delay in attempts][:3] == [1, 2, 4]
+
+    stats = supervisor.stats()
+    assert stats.reconnects == 1
+    assert stats.failed_attempts == len(attempts) - 1
+    assert stats.latency_ms.count == 1
+
+
+def test_reconnect_supervisor_gives_up(qtbot: QtBot, mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder)
+    supervisor = ReconnectSupervisor(
+        svc,
+        ReconnectPolicy(initial_delay_ms=1, jitter=0, max_attempts=3),
+        list_ports=list,
+    )
+
+    with qtbot.waitSignal(supervisor.gave_up) as blocker:
+        _drop(svc, mocker, _FakePort("ttyACM0"))
+
+    assert isinstance(blocker.args[0], SerialReconnectError)
+    assert supervisor.attempt == 3
+    assert supervisor.stats().gave_up == 1
+    assert not supervisor.is_reconnecting
@@ -0,0 +1,56 @@
+import pytest
+
+from pyside_app_core.services.serial_service.ring_buffer import RingBuffer
+
+
+def test_ring_buffer__write_consume() -> None:
+    buf = RingBuffer(8)
+
+    assert buf.write(b"abc") == 3
+    assert len(buf) == 3
+    assert buf.free == 5
+    assert buf == b"abc"
+
+    buf.consume(1)
+    assert buf == b"bc"
+
+    buf.consume(2)
+    assert len(buf) == 0
+    assert buf.free == 8
+
+    with pytest.raises(ValueError):
+        buf.consume(1)
+
+
+def test_ring_buffer__partial_write() -> None:
+    buf = RingBuffer(4)
+
+    assert buf.write(b"abcdef") == 4
+    assert buf == b"abcd"
+    assert buf.write(b"x") == 0
+
+
+def test_ring_buffer__compacts_when_needed() -> None:
+    buf = RingBuffer(6)
+
+    buf.write(b"abcd")
+    buf.consume(3)
+
+    # doesn't fit after the tail, unread data moves to the front
+    assert buf.write(b"efgh") == 4
+    assert buf == b"defgh"
+    assert buf.view(1, 3) == b"ef"
+
+
+def test_ring_buffer__find_and_view() -> None:
+    buf = RingBuffer(16)
+    buf.write(b"xxab\r\ncd\r\n")
+    buf.consume(2)
+
+    assert buf.find(b"\r\n") == 2
+    assert buf.find(b"\r\n", 3) == 6
+    assert buf.find(b"\r\n", 7) == -1
+
+    view = buf.view(0, 2)
+    assert isinstance(view, memoryview)
+    assert view == b"ab"
@@ -0,0 +1,171 @@
+from enum import IntEnum
+
+import pytest
+
+from pyside_app_core.errors.encode_errors import DecodingError, EncodingError
+from pyside_app_core.services.serial_service.float_map import CompactFloatMap, FloatMap
+from pyside_app_core.services.serial_service.schema import (
+    SchemaMessage,
+    SchemaTranscoder,
+    enum_of,
+    f32,
+    fixed_bytes,
+    float_list,
+    float_map,
+    i16,
+    u8,
+    u16,
+    u32,
+)
+
+
+class Mode(IntEnum):
+    IDLE = 0
+    RUN = 1
+
+
+class SetSpeed(SchemaMessage, msg_id=0x10):
+    axis: int = u8()
+    speed: float = f32()
+    mode: Mode = enum_of(Mode)
+
+
+class Reading(SchemaMessage, msg_id=0x20):
+    seq: int = u32()
+    offset: int = i16()
+    tag: bytes = fixed_bytes(4)
+    samples: list[float] = float_list()
+    gains: FloatMap[int] = float_map(CompactFloatMap)
+
+
+class Ping(SchemaMessage, msg_id=0x30):
+    pass
+
+
+class DeviceTranscoder(SchemaTranscoder):
+    MESSAGES = (SetSpeed, Reading, Ping)
+
+
+def test_schema_fixed_message() -> None:
+    msg = SetSpeed(1, speed=2.5, mode=Mode.RUN)
+
+    assert msg.encode() == b"\x10\x01\x00\x00\x20\x40\x01"
+    assert SetSpeed._schema.fixed.format == "<BBfB"
+
+    decoded = SetSpeed.decode(msg.encode())
+    assert decoded == msg
+    assert decoded.mode is Mode.RUN
+    assert repr(decoded) == "SetSpeed(axis=1, speed=2.5, mode=<Mode.RUN: 1>)"
+
+
+def test_schema_variable_fields() -> None:
+    msg = Reading(7, -3, b"ab", [1.5, 2.5], {1: 0.5, 9: 1.25})
+
+    decoded = Reading.decode(msg.encode())
+    assert (decoded.seq, decoded.offset, decoded.tag) == (7, -3, b"ab\x00\x00")
+    assert decoded.samples == [1.5, 2.5]
+    assert isinstance(decoded.gains, CompactFloatMap)
+    assert dict(decoded.gains) == {1: 0.5, 9: 1.25}
+
+    with pytest.raises(DecodingError):
+        Reading.decode(msg.encode()[:-1])
+    with pytest.raises(DecodingError):
+        Reading.decode(msg.encode() + b"\x00")
+    with pytest.raises(DecodingError):
+        SetSpeed.decode(msg.encode())
+
+
+def test_schema_definition_errors() -> None:
+    with pytest.raises(TypeError):
+        SetSpeed(1, 2.0)
+    with pytest.raises(TypeError):
+        SetSpeed(1, 2.0, Mode.RUN, axis=3)
+
+    with pytest.raises(TypeError, match="after all fixed"):
+
+        class _Bad(SchemaMessage, msg_id=1):
+            samples: list[float] = float_list()
+            axis: int = u8()
+
+    with pytest.raises(ValueError, match="more than one"):
+
+        class _Clash(SchemaTranscoder):
+            MESSAGES = (SetSpeed, SetSpeed)
+
+
+def test_schema_message_ids() -> None:
+    class _Header(SchemaMessage):
+        seq: int = u16()
+
+    class _Status(_Header, msg_id=0x40):
+        level: int = u8()
+
+    class _LoggedStatus(_Status):
+        def __str__(self) -> str:
+            return f"status {self.level}"
+
+    # same fields, same id
+    assert _LoggedStatus.MSG_ID == 0x40
+    assert _LoggedStatus(1, 2).encode() == _Status(1, 2).encode() == b"\x40\x01\x00\x02"
+
+    with pytest.raises(TypeError, match="needs its own msg_id"):
+
+        class _Extended(_Status):
+            extra: int = u8()
+
+    with pytest.raises(TypeError, match="no msg_id"):
+        _Header(1)
+    with pytest.raises(TypeError, match="no msg_id"):
+        _Header.decode(b"\x40\x01\x00")
+    with pytest.raises(TypeError, match="no msg_id"):
+
+        class _Missing(SchemaTranscoder):
+            MESSAGES = (_Header,)
+
+
+class _ModeGains(FloatMap[Mode]):
+    @classmethod
+    def _key_xform(cls, key: int) -> Mode:
+        return Mode(key)
+
+
+class _Tuning(SchemaMessage, msg_id=0x50):
+    mode: Mode = enum_of(Mode)
+    gains: FloatMap[Mode] = float_map(_ModeGains)
+
+
+def test_schema_decode_value_errors() -> None:
+    raw = bytearray(_Tuning(Mode.RUN, {Mode.IDLE: 0.5}).encode())
+    assert _Tuning.decode(raw) == _Tuning(Mode.RUN, {Mode.IDLE: 0.5})
+
+    # an enum byte that isn't a Mode
+    raw[1] = 7
+    with pytest.raises(DecodingError, match=r"_Tuning\.mode"):
+        _Tuning.decode(raw)
+
+    # a FloatMap key that isn't a Mode
+    raw[1] = 1
+    raw[4] = 9
+    with pytest.raises(DecodingError, match="_Tuning"):
+        _Tuning.decode(raw)
+
+    with pytest.raises(DecodingError, match="_Tuning"):
+        _Tuning.decode(raw[:2])
+
+
+def test_schema_encode_errors() -> None:
+    with pytest.raises(EncodingError, match="SetSpeed"):
+        SetSpeed(256, 1.0, Mode.RUN).encode()
+    with pytest.raises(EncodingError):
+        SetSpeed("1", 1.0, Mode.RUN).encode()
+
+
+def test_schema_transcoder_dispatch() -> None:
+    messages = [SetSpeed(2, 0.25, Mode.IDLE), Ping(), Reading(1, 2, b"xyzw", [], {3: 1.0})]
+
+    for msg in messages:
+        frame = bytearray(DeviceTranscoder.encode(msg))
+        assert DeviceTranscoder.decode(frame[:-1]) == msg
+
+    with pytest.raises(DecodingError, match="unknown message id"):
+        DeviceTranscoder.decode(bytearray(DeviceTranscoder.frame(b"\x99")[:-1]))
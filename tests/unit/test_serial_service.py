@@ -1,12 +1,23 @@
-from PySide6.QtCore import QObject
+import asyncio
+import logging
+
+import pytest
+import shiboken6
+from PySide6.QtCore import QMetaObject, QObject, Qt, QThread, Slot
 from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
 
+from pyside_app_core import log
+from pyside_app_core.errors.serial_errors import SerialBufferOverflowError, SerialDisconnectedError
 from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import RawTranscoder, Result
 from pyside_app_core.services.serial_service.types import (
     ChunkedData,
     Decodable,
     Encodable,
 )
+from pyside_app_core.services.serial_service.virtual_port import VirtualSerialPort
+from pyside_app_core.services.serial_service.write_queue import WritePriority
 
 
 class MockCommand(Encodable, Decodable):
@@ -89,3 +100,413 @@ def test_serial_service_buffering(mocker: MockerFixture) -> None:
     mock_data_sig.emit.assert_called_with(MockCommand("abc"))
     assert svc._buffer == b"AAA"
     assert mock_data_sig.emit.call_count == 4
+
+
+def test_serial_service_zero_copy_frames(mocker: MockerFixture) -> None:
+    """transcoders that can scan frames in place receive views into the buffer"""
+    svc = SerialService(transcoder=RawTranscoder, parent=QObject())
+
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_data_sig = mocker.patch.object(svc, "com_data")
+    decode_spy = mocker.spy(RawTranscoder, "decode")
+
+    mock_com.readAll.side_effect = [
+        b"abc\r",
+        b"\n123\r\nxy",
+    ]
+
+    svc._on_data()
+    assert mock_data_sig.emit.call_count == 0
+    assert svc._buffer == b"abc\r"
+
+    svc._on_data()
+    assert mock_data_sig.emit.call_count == 2
+    assert svc._buffer == b"xy"
+
+    frames = [c.args[0] for c in decode_spy.call_args_list]
+    assert all(isinstance(f, memoryview) for f in frames)
+    assert [str(c.args[0]) for c in mock_data_sig.emit.call_args_list] == [
+        "<Result>(b'abc')",
+        "<Result>(b'123')",
+    ]
+
+
+def test_serial_service_debug_trace(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"ab\r\n", b"cd\r\n"]
+
+    # off by default, a result is never formatted
+    mock_str = mocker.patch.object(Result, "__str__", autospec=True, return_value="<result>")
+    with caplog.at_level(logging.DEBUG):
+        svc._on_data()
+    assert not svc.DEBUG
+    assert caplog.records == []
+    mock_str.assert_not_called()
+
+    svc.DEBUG = True
+    with caplog.at_level(logging.DEBUG):
+        svc._on_data()
+    assert [r.getMessage() for r in caplog.records] == ["serial data: b'cd\\r\\n'", "transcoded chunk: <result>"]
+
+
+def test_serial_service_debug_trace_on_class(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    mocker.patch.object(SerialService, "DEBUG", True)
+    svc = SerialService(transcoder=RawTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.return_value = b"ab\r\n"
+
+    with caplog.at_level(logging.DEBUG):
+        svc._on_data()
+    assert [r.getMessage() for r in caplog.records] == ["serial data: b'ab\\r\\n'", "transcoded chunk: <Result>(b'ab')"]
+
+    # on, but below the logger level
+    with caplog.at_level(logging.INFO, "pyside_app_core.services.serial_service.service"):
+        assert not svc._trace
+    with caplog.at_level(logging.DEBUG, "pyside_app_core.services.serial_service.service"):
+        assert svc._trace
+
+
+def test_serial_service_debug_trace_configured_logger(mocker: MockerFixture) -> None:
+    # put back the default logger after the test
+    mocker.patch.object(log, "__get_logger_func", getattr(log, "__get_logger_func"))
+
+    svc = SerialService(transcoder=RawTranscoder)
+    svc.DEBUG = True
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.return_value = b"ab\r\n"
+
+    # configured after the service is made, like loguru it has no `isEnabledFor`
+    logger = mocker.Mock(spec=["debug", "info", "warning", "error", "critical", "exception"])
+    log.configure_get_logger_func(lambda: logger)
+    mock_str = mocker.patch.object(Result, "__str__", autospec=True, return_value="<result>")
+    svc._on_data()
+
+    # formatted only once the logger emits the record
+    mock_str.assert_not_called()
+    assert [str(c.args[0]) for c in logger.debug.call_args_list] == [
+        "serial data: b'ab\\r\\n'",
+        "transcoded chunk: <result>",
+    ]
+
+
+def test_serial_service_buffer_overflow(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder, parent=QObject(), buffer_capacity=4)
+
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_data_sig = mocker.patch.object(svc, "com_data")
+    mock_error_sig = mocker.patch.object(svc, "com_error")
+
+    mock_com.readAll.side_effect = [b"123456\r\nab\r\n"]
+
+    svc._on_data()
+
+    assert isinstance(mock_error_sig.emit.call_args.args[0], SerialBufferOverflowError)
+    assert mock_data_sig.emit.call_count == 1
+    assert str(mock_data_sig.emit.call_args.args[0]) == "<Result>(b'ab')"
+    assert len(svc._buffer) == 0
+
+
+def test_serial_service_buffer_overflow_split_separator(mocker: MockerFixture) -> None:
+    """the separator ending the dropped frame straddles the overflow, the next frame is kept"""
+    svc = SerialService(transcoder=RawTranscoder, buffer_capacity=4)
+
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_data_sig = mocker.patch.object(svc, "com_data")
+    mock_error_sig = mocker.patch.object(svc, "com_error")
+
+    mock_com.readAll.side_effect = [b"123\r", b"\nab\r\n"]
+
+    svc._on_data()
+    svc._on_data()
+
+    assert mock_error_sig.emit.call_count == 1
+    assert [str(c.args[0]) for c in mock_data_sig.emit.call_args_list] == ["<Result>(b'ab')"]
+
+
+def test_serial_service_threaded_decode(qtbot: QtBot, mocker: MockerFixture) -> None:
+    """in threaded mode decoding happens on the worker thread, results arrive on com_data"""
+    decode_threads: list[QThread] = []
+
+    class _ThreadCheckTranscoder(RawTranscoder):
+        @classmethod
+        def decode(cls, raw: bytearray) -> Result:
+            decode_threads.append(QThread.currentThread())
+            return super().decode(raw)
+
+    svc = SerialService(transcoder=_ThreadCheckTranscoder, threaded=True)
+    assert svc.is_threaded
+    assert svc._worker is not None
+
+    mock_com = mocker.MagicMock()
+    mock_com.readAll.return_value = b"abc\r\n"
+    svc._worker._com = mock_com
+
+    with qtbot.waitSignal(svc.com_data) as blocker:
+        QMetaObject.invokeMethod(svc._worker, "_on_data", Qt.ConnectionType.QueuedConnection)
+
+    assert str(blocker.args[0]) == "<Result>(b'abc')"
+    assert decode_threads == [svc._thread]
+    assert svc._thread is not QThread.currentThread()
+
+    svc._worker._com = None
+    svc.deleteLater()
+
+
+class _Reader(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.data: list[object] = []
+
+    @Slot()
+    def handle_serial_connect(self, com: object) -> None: ...
+
+    @Slot()
+    def handle_serial_disconnect(self) -> None: ...
+
+    @Slot()
+    def handle_serial_ports(self, ports: list[object]) -> None: ...
+
+    @Slot()
+    def handle_serial_data(self, data: object) -> None:
+        self.data.append(data)
+
+    @Slot()
+    def handle_serial_error(self, error: Exception) -> None: ...
+
+
+class _BatchReader(_Reader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[object]] = []
+
+    @Slot()
+    def handle_serial_data_batch(self, data: list[object]) -> None:
+        self.batches.append(data)
+
+
+def test_serial_service_batching(qtbot: QtBot, mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder)
+    reader = _Reader()
+    batch_reader = _BatchReader()
+    svc.register_reader(reader)
+    svc.register_reader(batch_reader)
+
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"a\r\nb\r\n", b"c\r\n", b"d\r\ne\r\nf\r\n", b"g\r\n"]
+
+    # not batching, every reader gets single results
+    svc._on_data()
+    assert len(reader.data) == 2
+    assert len(batch_reader.data) == 2
+    assert batch_reader.batches == []
+
+    svc.set_batching(window_ms=10, max_size=3)
+    assert svc.is_batching
+
+    svc._on_data()
+    assert len(reader.data) == 2  # held until the window closes
+    qtbot.waitUntil(lambda: len(batch_reader.batches) == 1)
+    assert [str(r) for r in batch_reader.batches[0]] == ["<Result>(b'c')"]
+    assert len(reader.data) == 3
+    assert len(batch_reader.data) == 2  # batch readers no longer get single results
+
+    # a full batch doesn't wait for the window
+    svc._on_data()
+    assert len(batch_reader.batches) == 2
+    assert len(batch_reader.batches[1]) == 3
+
+    svc.set_batching(None)
+    svc._on_data()
+    assert len(batch_reader.batches) == 2
+    assert len(batch_reader.data) == 3
+    assert len(reader.data) == 7
+
+
+def test_serial_service_send_data(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder, write_high_water=8, write_in_flight=1)
+    assert not svc.send_data(MockCommand("nope"))
+
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.write.side_effect = len
+    throttled: list[bool] = []
+    svc.com_backpressure.connect(throttled.append)
+
+    assert svc.send_data(MockCommand("one"))
+    assert svc.send_data(MockCommand("two"))
+    assert svc.send_data(MockCommand("three"))
+    assert not svc.send_data(MockCommand("four"))
+    assert svc.send_data(MockCommand("stop"), WritePriority.CONTROL)
+    assert svc.write_queue_depth == 12
+    assert throttled == [True]
+
+    svc._write_queue.on_bytes_written(3)
+    assert [c.args[0] for c in mock_com.write.call_args_list] == [b"one", b"stop"]
+
+
+def test_serial_service_async_frames(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"a\r\nb\r\n"]
+
+    async def _collect() -> list[str]:
+        collected = []
+        async for frame in svc.frames():
+            collected.append(str(frame))
+            if len(collected) == 2:
+                svc.close_connection()
+        return collected
+
+    async def _session() -> list[str]:
+        task = asyncio.ensure_future(_collect())
+        await asyncio.sleep(0)
+        svc._on_data()
+        return await task
+
+    assert asyncio.run(_session()) == ["<Result>(b'a')", "<Result>(b'b')"]
+    assert svc.receivers("2com_data(PyObject)") == 0
+
+
+def test_serial_service_async_send(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=RawTranscoder, write_high_water=4, write_in_flight=1)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.write.side_effect = len
+
+    async def _session() -> None:
+        await svc.send(MockCommand("one"))  # written
+        await svc.send(MockCommand("two"))  # queued, the queue is full
+
+        task = asyncio.ensure_future(svc.send(MockCommand("three")))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        svc._write_queue.on_bytes_written(3)
+        await task
+        assert svc.write_queue_depth == 5
+
+        svc.close_connection()
+        with pytest.raises(SerialDisconnectedError):
+            await svc.send(MockCommand("four"))
+
+    asyncio.run(_session())
+    assert [c.args[0] for c in mock_com.write.call_args_list] == [b"one", b"two"]
+
+
+class _Status(Result):
+    pass
+
+
+class _Alarm(_Status):
+    pass
+
+
+class _TypedTranscoder(RawTranscoder):
+    @classmethod
+    def decode(cls, raw: bytearray) -> Result:
+        data = cls.unframe(raw)
+        result_type = {b"s": _Status, b"a": _Alarm}.get(data[:1], Result)
+        return result_type(data)
+
+
+def test_serial_service_subscribe(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=_TypedTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"s1\r\nx\r\na1\r\n", b"s2\r\na2\r\n"]
+
+    statuses: list[Result] = []
+    alarms: list[Result] = []
+    svc.subscribe(_Status, statuses.append)
+    svc.subscribe(_Alarm, alarms.append)
+
+    reader = _Reader()
+    svc.register_reader(reader, result_types=(_Alarm,))
+
+    def _broken(_: Result) -> None:
+        raise RuntimeError("subscriber failed")
+
+    svc.subscribe(_Alarm, _broken)
+
+    svc._on_data()
+    # subclasses reach base class subscribers, most specific first
+    assert [type(r) for r in statuses] == [_Status, _Alarm]
+    assert [r._raw_data for r in alarms] == [b"a1"]
+    assert [r._raw_data for r in reader.data] == [b"a1"]  # type: ignore[attr-defined]
+
+    svc.unsubscribe(_Status, statuses.append)
+    svc._on_data()
+    assert len(statuses) == 2
+    assert [r._raw_data for r in alarms] == [b"a1", b"a2"]
+
+    with pytest.raises(ValueError, match="not subscribed"):
+        svc.unsubscribe(_Status, statuses.append)
+
+
+def test_serial_service_subscribed_reader_lifetime(mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=_TypedTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"a1\r\n", b"a2\r\n", b"a3\r\n"]
+    mock_exception = mocker.patch("pyside_app_core.services.serial_service.dispatch.log.exception")
+
+    parent = QObject()
+    destroyed = _Reader()
+    destroyed.setParent(parent)
+    svc.register_reader(destroyed, result_types=(_Alarm,))
+    kept = _Reader()
+    svc.register_reader(kept, result_types=(_Alarm,))
+
+    svc._on_data()
+    assert len(destroyed.data) == len(kept.data) == 1
+
+    # destroyed by its parent, never called again
+    shiboken6.delete(parent)
+    svc._on_data()
+    assert len(kept.data) == 2
+    mock_exception.assert_not_called()
+
+    svc.unregister_reader(kept)
+    svc._on_data()
+    assert len(kept.data) == 2
+    assert not svc._dispatcher
+
+    with pytest.raises(ValueError, match="not registered"):
+        svc.unregister_reader(kept)
+
+
+def test_serial_service_subscribed_batch_reader(qtbot: QtBot, mocker: MockerFixture) -> None:
+    svc = SerialService(transcoder=_TypedTranscoder)
+    mock_com = mocker.patch.object(svc, "_com")
+    mock_com.readAll.side_effect = [b"a1\r\ns1\r\na2\r\n", b"x\r\n", b"a3\r\n"]
+
+    reader = _BatchReader()
+    svc.register_reader(reader, result_types=(_Alarm,))
+    svc.set_batching(window_ms=10)
+
+    svc._on_data()
+    qtbot.waitUntil(lambda: len(reader.batches) == 1)
+    assert [r._raw_data for r in reader.batches[0]] == [b"a1", b"a2"]  # type: ignore[attr-defined]
+    assert reader.data == []
+
+    # nothing of the subscribed types, no batch
+    svc._on_data()
+    qtbot.wait(30)
+    assert len(reader.batches) == 1
+
+    svc.set_batching(None)
+    svc._on_data()
+    assert [r._raw_data for r in reader.data] == [b"a3"]  # type: ignore[attr-defined]
+
+
+def test_serial_service_threaded_connect(qtbot: QtBot) -> None:
+    """readers in this thread never get the worker's port"""
+    svc = SerialService(transcoder=RawTranscoder, threaded=True)
+    connected: list[QObject] = []
+    svc.com_connect.connect(connected.append)
+
+    assert svc.open_connection(VirtualSerialPort("ttyVIRTUAL"))
+    assert svc.is_connected
+    assert connected[0].thread() is QThread.currentThread()
+    assert connected[0].portName() == "ttyVIRTUAL"  # type: ignore[attr-defined]
+
+    svc.close_connection()
+    assert not svc.is_connected
+    svc.deleteLater()
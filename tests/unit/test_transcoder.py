@@ -0,0 +1,71 @@
+from pytest_mock import MockerFixture
+
+from pyside_app_core.errors.serial_errors import SerialBufferOverflowError
+from pyside_app_core.services.serial_service.receiver import FrameReceiver
+from pyside_app_core.services.serial_service.ring_buffer import RingBuffer
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, RawTranscoder
+
+from helpers import Payload
+
+
+def test_raw_transcoder__scan_frames() -> None:
+    buf = RingBuffer(32)
+    buf.write(b"abc\r\n123\r\nxy")
+
+    frames, consumed, scanned = RawTranscoder.scan_frames(buf)
+
+    assert [bytes(f) for f in frames] == [b"abc", b"123"]
+    assert consumed == 10
+    assert scanned == 11
+
+
+def test_raw_transcoder__scan_frames_incremental(mocker: MockerFixture) -> None:
+    """bytes of a long partial frame are only searched once no matter how it is fragmented"""
+    buf = RingBuffer(64)
+    find_spy = mocker.spy(RingBuffer, "find")
+
+    offset = 0
+    reads = [b"aaaa", b"aaaa\r", b"\naaa", b"a\r\n"]
+    frames: list[bytes] = []
+
+    for read in reads:
+        buf.write(read)
+        found, consumed, scanned = RawTranscoder.scan_frames(buf, offset)
+        frames.extend(bytes(f) for f in found)
+        buf.consume(consumed)
+        offset = scanned - consumed
+
+    assert frames == [b"aaaaaaaa", b"aaaa"]
+
+    # every search starts where the previous one left off, minus separator overlap
+    starts = [c.args[2] for c in find_spy.call_args_list]
+    assert starts == [0, 3, 8, 10, 2, 6]
+
+
+def test_cobs_transcoder__round_trip() -> None:
+    buf = RingBuffer(64)
+    buf.write(b"\x00")
+    buf.write(CobsTranscoder.encode(Payload(b"\x11\x00\x22")))
+    buf.write(CobsTranscoder.encode(Payload(b"\x00\x00")))
+    buf.write(b"\x03\x11")
+
+    frames, consumed, _ = CobsTranscoder.scan_frames(buf)
+    decoded = [CobsTranscoder.decode(f)._raw_data for f in frames]  # type: ignore[arg-type]
+
+    assert decoded == [b"\x11\x00\x22", b"\x00\x00"]
+    assert len(buf) - consumed == 2
+
+
+def test_cobs_transcoder__overflow_at_boundary() -> None:
+    """the dropped frame ends exactly at the capacity, its tail is only the delimiter"""
+    results: list[bytes] = []
+    errors: list[Exception] = []
+    receiver = FrameReceiver(
+        CobsTranscoder, on_result=lambda r: results.append(r._raw_data), on_error=errors.append, capacity=16
+    )
+
+    receiver.feed(b"\x05abcdabcdabcdabc")
+    receiver.feed(b"\x00" + CobsTranscoder.frame(b"hi") + CobsTranscoder.frame(b"yo"))
+
+    assert results == [b"hi", b"yo"]
+    assert [type(e) for e in errors] == [SerialBufferOverflowError]
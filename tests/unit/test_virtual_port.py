@@ -0,0 +1,73 @@
+from typing import cast
+
+import pytest
+from PySide6.QtCore import QIODevice
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.services.serial_service import virtual_port
+from pyside_app_core.services.serial_service.service import SerialService
+from pyside_app_core.services.serial_service.transcoder import CobsTranscoder, Result
+from pyside_app_core.services.serial_service.types import Decodable
+from pyside_app_core.services.serial_service.virtual_port import VirtualSerialPort
+
+from helpers import Payload
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_serial_service_virtual_loopback(qtbot: QtBot, threaded: bool) -> None:
+    payloads = [bytes([i, 0, 255 - i]) * (i % 7 + 1) for i in range(200)]
+
+    svc = SerialService(transcoder=CobsTranscoder, threaded=threaded)
+    svc.DEBUG = False
+    received: list[Decodable] = []
+    svc.com_data.connect(received.append)
+
+    assert svc.open_connection(VirtualSerialPort(fragments=[1, 5, 3, 64]))
+    for payload in payloads:
+        assert svc.send_data(Payload(payload))
+
+    qtbot.waitUntil(lambda: len(received) == len(payloads))
+    assert [cast(Result, r)._raw_data for r in received] == payloads
+
+    svc.close_connection()
+    svc.deleteLater()
+
+
+def test_virtual_port_link(mocker: MockerFixture) -> None:
+    # the link runs on the port's clock, stepped by hand instead of waiting on timers
+    now_ns = 0
+    mocker.patch.object(virtual_port.time, "monotonic_ns", side_effect=lambda: now_ns)
+
+    port = VirtualSerialPort(bandwidth=2000, latency_ms=50, fragments=[10], loopback=False)
+    port.open(QIODevice.OpenModeFlag.ReadWrite)
+
+    host_data: list[bytes] = []
+    port.host_data.connect(host_data.append)
+    assert port.write(b"\x00\xff") == 2
+    assert host_data == [b"\x00\xff"]
+
+    reads: list[tuple[int, bytes]] = []
+    port.readyRead.connect(lambda: reads.append((now_ns // 1_000_000, bytes(port.readAll()))))
+
+    sent = bytes(range(100))
+    port.inject(sent)
+    assert port.in_transit == 100
+
+    def _step_to(ms: int) -> None:
+        nonlocal now_ns
+        now_ns = ms * 1_000_000
+        port._deliver()
+
+    # every 10 bytes take 5ms at 2000 B/s, then 50ms of latency
+    _step_to(54)
+    assert reads == []
+    _step_to(55)
+    assert reads == [(55, sent[:10])]
+    _step_to(99)
+    assert len(reads) == 9
+    _step_to(100)
+    assert [len(r) for _, r in reads] == [10] * 10
+    assert b"".join(r for _, r in reads) == sent
+    assert port.in_transit == 0
+    port.close()
@@ -0,0 +1,52 @@
+from pytestqt.qtbot import QtBot
+
+from pyside_app_core.services.serial_service.write_queue import WritePriority, WriteQueue
+
+
+def test_write_queue_priority(qtbot: QtBot) -> None:
+    written: list[bytes] = []
+    queue = WriteQueue(written.append, high_water=100, in_flight=6)
+
+    assert queue.enqueue(b"bulk-0")
+    assert queue.enqueue(b"bulk-1")
+    assert queue.enqueue(b"bulk-2")
+    assert queue.enqueue(b"ctrl", WritePriority.CONTROL)
+
+    # the first message goes straight out, the rest wait for the port
+    assert written == [b"bulk-0"]
+    assert queue.in_flight == 6
+    assert queue.depth == 16
+
+    queue.on_bytes_written(6)
+    assert written == [b"bulk-0", b"ctrl", b"bulk-1"]
+
+    queue.on_bytes_written(10)
+    assert written == [b"bulk-0", b"ctrl", b"bulk-1", b"bulk-2"]
+    assert queue.depth == 0
+
+
+def test_write_queue_backpressure(qtbot: QtBot) -> None:
+    written: list[bytes] = []
+    queue = WriteQueue(written.append, high_water=20, in_flight=1)
+
+    depths: list[int] = []
+    throttled: list[bool] = []
+    queue.depth_changed.connect(depths.append)
+    queue.backpressure.connect(throttled.append)
+
+    assert queue.enqueue(b"a" * 10)  # written
+    assert queue.enqueue(b"b" * 10)
+    assert queue.enqueue(b"c" * 10)
+    assert not queue.enqueue(b"d" * 10)  # over the high water mark
+    assert queue.enqueue(b"e" * 10, WritePriority.CONTROL)
+    assert throttled == [True]
+
+    queue.on_bytes_written(10)  # e
+    queue.on_bytes_written(10)  # b, at the low water mark
+    assert throttled == [True, False]
+    assert depths == [10, 20, 30, 20, 10]
+    assert written == [b"a" * 10, b"e" * 10, b"b" * 10]
+
+    queue.clear()
+    assert queue.depth == 0
+    assert queue.in_flight == 0